@@ -43,10 +43,10 @@ Event Stub Types (frozen dataclasses):
     PermissionDecision
 
 Canonical Lookup Dicts:
-    PHASE_SPECS         — dict[PhaseId, PhaseSpec]        — all 12 phases
-    CONSTRAINT_SPECS    — dict[str, ConstraintSpec]       — all C-* constraints
-    HANDOFF_SPECS       — dict[str, HandoffSpec]          — all 6 handoffs
-    PHASE_DOMAIN        — dict[PhaseId, Domain]           — phase-to-domain mapping
+    PHASE_SPECS         — Mapping[PhaseId, PhaseSpec]     — all 12 phases (read-only)
+    CONSTRAINT_SPECS    — Mapping[str, ConstraintSpec]    — all C-* constraints (read-only)
+    HANDOFF_SPECS       — Mapping[str, HandoffSpec]       — all 6 handoffs (read-only)
+    PHASE_DOMAIN        — Mapping[PhaseId, Domain]        — phase-to-domain mapping (read-only)
     ROLE_SPECS          — dict[RoleId, RoleSpec]          — all 5 roles
     COMMAND_SPECS       — dict[CommandId, CommandSpec]     — all 35 commands
     LABEL_SPECS         — dict[str, LabelSpec]            — all 21 labels
@@ -29,6 +29,8 @@ Design decisions:
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable
 
 from aura_protocol.state_machine import EpochState
 from aura_protocol.types import (
@@ -47,13 +49,16 @@ from aura_protocol.types import (
 # ─── Violation Type ────────────────────────────────────────────────────────────
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConstraintViolation:
     """A single protocol constraint violation detected at runtime.
 
     constraint_id matches a key in CONSTRAINT_SPECS (e.g. "C-review-consensus").
     message is a human-readable description of the violation.
     context provides key-value pairs with details (phase, role, count, etc.).
+
+    Slotted: aggregation entry points build lists of these in bulk, so each
+    instance stores its three fields directly instead of carrying a __dict__.
     """
 
     constraint_id: str
@@ -65,6 +70,13 @@ class ConstraintViolation:
 
 _REVIEW_AXES: frozenset[str] = frozenset(ReviewAxis)
 
+# Sentinel vote mapping for full consensus: every axis voted ACCEPT with no
+# extras. A single dict equality against this settles the common passing case
+# in check_review_consensus without building any per-call collections.
+_ALL_ACCEPT: dict[ReviewAxis, VoteType] = {
+    axis: VoteType.Accept for axis in ReviewAxis
+}
+
 # Phases that use review consensus gating
 _REVIEW_PHASES: frozenset[PhaseId] = frozenset(
     {PhaseId.P4_Review, PhaseId.P10_CodeReview}
@@ -104,11 +116,38 @@ _SAME_ACTOR: frozenset[tuple[PhaseId, PhaseId]] = frozenset(
     }
 )
 
+# Known role value strings (used by C-vertical-slices role validation).
+_KNOWN_ROLES: frozenset[str] = frozenset(r.value for r in RoleId)
+
+# Valid vote value strings and their display form (used by C-review-binary).
+_VALID_VOTES: frozenset[str] = frozenset(v.value for v in VoteType)
+_VALID_VOTES_DISPLAY: str = ",".join(sorted(_VALID_VOTES))
+
 # Action types that constitute direct code implementation (used by C-supervisor-no-impl).
 _IMPL_ACTIONS: frozenset[str] = frozenset(
     {"file_edit", "file_write", "code_change", "write_file", "edit_file"}
 )
 
+# Static (message, context) pairs for the three required URE record fields,
+# in check order: question, options, response (used by C-ure-verbatim).
+_URE_FIELDS: tuple[tuple[str, tuple[tuple[str, str], ...]], ...] = (
+    (
+        "User interview record is missing the question text. "
+        "Must capture full question text verbatim.",
+        (("field", "question"),),
+    ),
+    (
+        "User interview record has no options. "
+        "Must capture ALL option descriptions (not just numbers).",
+        (("field", "options"), ("option_count", "0")),
+    ),
+    (
+        "User interview record is missing the user's response. "
+        "Must capture verbatim response.",
+        (("field", "response"),),
+    ),
+)
+
 # Valid title prefixes for follow-up lifecycle tasks (used by C-followup-lifecycle).
 _FOLLOWUP_PREFIXES: tuple[str, ...] = (
     "FOLLOWUP:",
@@ -120,6 +159,97 @@ _FOLLOWUP_PREFIXES: tuple[str, ...] = (
 )
 
 
+def _is_proposal_title(title: str) -> bool:
+    """True if title matches 'PROPOSAL-{N}:' — N one or more digits.
+
+    Explicit character scan instead of a regex: the check runs once per task
+    title, and walking the string directly avoids the regex engine and match
+    object allocation entirely.
+    """
+    if not title.startswith("PROPOSAL-"):
+        return False
+    i = len("PROPOSAL-")
+    start = i
+    n = len(title)
+    while i < n and title[i].isdigit():
+        i += 1
+    return i > start and i < n and title[i] == ":"
+
+
+def _is_review_title(title: str) -> bool:
+    """True if title matches '{SCOPE}-REVIEW-{A|B|C}-{round}' with non-empty SCOPE.
+
+    Scans each '-REVIEW-' occurrence (SCOPE must be at least one character,
+    so the search starts at index 1) and accepts when it is followed by an
+    axis letter, a dash, and at least one digit — the same language as the
+    former regex, without the regex engine.
+    """
+    pos = title.find("-REVIEW-", 1)
+    while pos != -1:
+        i = pos + len("-REVIEW-")
+        if (
+            i + 2 < len(title)
+            and title[i] in "ABC"
+            and title[i + 1] == "-"
+            and title[i + 2].isdigit()
+        ):
+            return True
+        pos = title.find("-REVIEW-", pos + 1)
+    return False
+
+
+@lru_cache(maxsize=256)
+def _violation(
+    constraint_id: str, message: str, context_items: tuple[tuple[str, str], ...]
+) -> ConstraintViolation:
+    """Flyweight constructor for violations with enumerable content.
+
+    Emission sites whose message and context are drawn from a small input
+    domain (phase values, severity-level names, small counts) route through
+    this cache so the repeat case returns the same frozen instance instead
+    of allocating a new one. Callers must not mutate the context dict of a
+    returned violation — it is shared across every call with the same key.
+    """
+    return ConstraintViolation(constraint_id, message, dict(context_items))
+
+
+@lru_cache(maxsize=None)
+def _handoff_violations(
+    from_phase: PhaseId, to_phase: PhaseId
+) -> tuple[ConstraintViolation, ...]:
+    """Memoized C-handoff-skill-invocation result for a (from, to) phase pair.
+
+    Pure function of two PhaseId enums (at most |PhaseId|² distinct inputs),
+    so the cache is bounded. The cached ConstraintViolation instances are
+    shared across calls — they are frozen, and callers must not mutate the
+    context dict of a returned violation.
+    """
+    if (from_phase, to_phase) in _SAME_ACTOR:
+        return ()
+
+    if (from_phase, to_phase) not in _HANDOFF_REQUIRED_TRANSITIONS:
+        return ()
+
+    # The transition IS an actor-change transition — handoff is required.
+    # We return a reminder violation. The actual handoff file existence
+    # must be verified by the workflow, not at runtime against EpochState alone.
+    return (
+        ConstraintViolation(
+            constraint_id="C-handoff-skill-invocation",
+            message=(
+                f"Transition {from_phase.value!r} → {to_phase.value!r} requires "
+                f"a handoff document and the receiving agent's prompt MUST start "
+                f"with Skill(/aura:{{role}}). "
+                f"Store handoff at .git/.aura/handoff/{{request-id}}/."
+            ),
+            context={
+                "from_phase": from_phase.value,
+                "to_phase": to_phase.value,
+            },
+        ),
+    )
+
+
 # ─── Checker ──────────────────────────────────────────────────────────────────
 
 
@@ -152,9 +282,107 @@ class RuntimeConstraintChecker:
         self._handoff_specs: dict[str, HandoffSpec] = (
             handoff_specs if handoff_specs is not None else HANDOFF_SPECS
         )
+        # Frozen view of the known C-* constraint IDs, computed once so
+        # membership tests don't go through the spec dict on every lookup.
+        self._known_ids: frozenset[str] = frozenset(self._constraint_specs)
+        # Memoized check_state results keyed by the state fields the five
+        # state-based checks actually read (see _state_cache_key). Values are
+        # stored as tuples of frozen ConstraintViolation instances, so cached
+        # entries are safely shareable; check_state returns a fresh list.
+        self._state_cache: dict[tuple, tuple[ConstraintViolation, ...]] = {}
+        # Phase-indexed dispatch table for check_state: each phase maps to the
+        # checks that can possibly fire there, in the canonical aggregation
+        # order. Review-phase-only checks (consensus, severity tree) and the
+        # p10-only blocker gate are skipped entirely outside their phases;
+        # audit trail and role ownership apply everywhere.
+        self._state_checks_by_phase: dict[
+            PhaseId, tuple[Callable[[EpochState], list[ConstraintViolation]], ...]
+        ] = {
+            phase: (
+                (
+                    (self.check_review_consensus, self.check_severity_tree)
+                    if phase in _REVIEW_PHASES
+                    else ()
+                )
+                + (
+                    (self.check_blocker_gate,)
+                    if phase is PhaseId.P10_CodeReview
+                    else ()
+                )
+                + (self.check_audit_trail, self.check_role_ownership)
+            )
+            for phase in PhaseId
+        }
+        # Edge-indexed dispatch table for check_transition: each (from, to)
+        # phase pair maps to exactly the checks that can fire on that edge,
+        # in the canonical order (consensus, handoff, blocker gate). Edges
+        # absent from the table (e.g. p1→p2) have no transition constraints
+        # and resolve to an empty result in constant time.
+        def _bind_handoff(
+            frm: PhaseId, to: PhaseId
+        ) -> Callable[[EpochState], list[ConstraintViolation]]:
+            return lambda state: self.check_handoff_required(frm, to)
+
+        transition_checks: dict[
+            tuple[PhaseId, PhaseId],
+            list[Callable[[EpochState], list[ConstraintViolation]]],
+        ] = {
+            (PhaseId.P4_Review, PhaseId.P5_Uat): [self.check_review_consensus],
+            (PhaseId.P10_CodeReview, PhaseId.P11_ImplUat): [
+                self.check_review_consensus
+            ],
+        }
+        for frm, to in _HANDOFF_REQUIRED_TRANSITIONS:
+            transition_checks.setdefault((frm, to), []).append(_bind_handoff(frm, to))
+        transition_checks[(PhaseId.P10_CodeReview, PhaseId.P11_ImplUat)].append(
+            self.check_blocker_gate
+        )
+        self._transition_checks: dict[
+            tuple[PhaseId, PhaseId],
+            tuple[Callable[[EpochState], list[ConstraintViolation]], ...],
+        ] = {edge: tuple(checks) for edge, checks in transition_checks.items()}
+
+    @property
+    def known_ids(self) -> frozenset[str]:
+        """The set of constraint IDs this checker validates against.
+
+        Derived once from the injected (or canonical) constraint specs;
+        use this for membership tests instead of the spec dict itself.
+        """
+        return self._known_ids
 
     # ── Aggregation Entry Points ──────────────────────────────────────────────
 
+    @staticmethod
+    def _state_cache_key(state: EpochState) -> tuple:
+        """Build the memoization key for check_state from the fields it reads.
+
+        Every field any of the five state-based checks inspects — including
+        fields that only shape violation messages (vote breakdown, severity
+        group keys, per-record audit fields) — must appear in the key, or a
+        cache hit could return violations computed for a different state.
+        """
+        return (
+            state.current_phase,
+            state.blocker_count,
+            tuple(sorted(state.review_votes.items())),
+            frozenset(state.severity_groups),
+            state.current_role,
+            tuple(
+                (r.from_phase, r.to_phase, bool(r.triggered_by), bool(r.condition_met))
+                for r in state.transition_history
+            ),
+        )
+
+    def invalidate(self) -> None:
+        """Clear the memoized check_state results.
+
+        Cache keys are derived from state values (not identity), so hits can
+        never be stale for correctness — this exists to bound memory in
+        long-running checkers that see many distinct states.
+        """
+        self._state_cache.clear()
+
     def check_state(self, state: EpochState) -> list[ConstraintViolation]:
         """Run state-based constraint checks against current epoch state.
 
@@ -174,14 +402,24 @@ class RuntimeConstraintChecker:
         For transition-specific checks (consensus gate, handoff, blocker gate as
         a transition precondition), use check_transition(state, to_phase).
 
+        Results are memoized per checker instance, keyed on the state fields
+        the five checks read — repeated calls against equivalent states return
+        a copy of the cached violation list instead of re-running all checks.
+        On a miss, only the checks that can fire at the state's current phase
+        are dispatched (via the phase-indexed table built at construction);
+        the review-phase and p10-only checks are skipped entirely elsewhere.
+
         Returns combined list of all violations (empty = all state constraints satisfied).
         """
+        key = self._state_cache_key(state)
+        cached = self._state_cache.get(key)
+        if cached is not None:
+            return list(cached)
+
         violations: list[ConstraintViolation] = []
-        violations.extend(self.check_review_consensus(state))
-        violations.extend(self.check_severity_tree(state))
-        violations.extend(self.check_blocker_gate(state))
-        violations.extend(self.check_audit_trail(state))
-        violations.extend(self.check_role_ownership(state))
+        for check in self._state_checks_by_phase[state.current_phase]:
+            violations.extend(check(state))
+        self._state_cache[key] = tuple(violations)
         return violations
 
     def check_state_constraints(self, state: EpochState) -> list[ConstraintViolation]:
@@ -204,27 +442,15 @@ class RuntimeConstraintChecker:
         - C-worker-gates (blocker gate): p10→p11 blocked while blocker_count > 0
 
         Does NOT short-circuit — all transition checks run regardless of
-        earlier violations.
+        earlier violations. Dispatch goes through the edge-indexed table
+        built at construction, so edges with no transition constraints
+        (e.g. p1→p2) resolve to an empty list in constant time.
 
         Returns list of violations (empty = transition is protocol-valid).
         """
         violations: list[ConstraintViolation] = []
-
-        current = state.current_phase
-
-        # C-review-consensus: check consensus gate for review phase → forward transition
-        if current == PhaseId.P4_Review and to_phase == PhaseId.P5_Uat:
-            violations.extend(self.check_review_consensus(state))
-        elif current == PhaseId.P10_CodeReview and to_phase == PhaseId.P11_ImplUat:
-            violations.extend(self.check_review_consensus(state))
-
-        # C-handoff-skill-invocation: handoff required for actor-change transitions
-        violations.extend(self.check_handoff_required(current, to_phase))
-
-        # C-worker-gates: blocker gate — p10→p11 blocked while blocker_count > 0
-        if current == PhaseId.P10_CodeReview and to_phase == PhaseId.P11_ImplUat:
-            violations.extend(self.check_blocker_gate(state))
-
+        for check in self._transition_checks.get((state.current_phase, to_phase), ()):
+            violations.extend(check(state))
         return violations
 
     def check_transition_constraints(
@@ -435,6 +661,10 @@ class RuntimeConstraintChecker:
             return []
 
         votes = state.review_votes
+        # Fast path: exact full-consensus mapping — one C-level dict compare.
+        if votes == _ALL_ACCEPT:
+            return []
+
         missing_accept: list[str] = []
         for axis in sorted(_REVIEW_AXES):
             if axis not in votes or votes[axis] != VoteType.Accept:
@@ -542,14 +772,14 @@ class RuntimeConstraintChecker:
         # C-severity-not-plan: p4 (plan review) must NOT use severity trees.
         if current == PhaseId.P4_Review:
             violations.append(
-                ConstraintViolation(
-                    constraint_id="C-severity-not-plan",
-                    message=(
+                _violation(
+                    "C-severity-not-plan",
+                    (
                         "Phase p4 (plan review) must NOT use severity trees. "
                         "Plan reviews use binary ACCEPT/REVISE only. "
                         "Severity trees are for p10 code review only."
                     ),
-                    context={"phase": current.value},
+                    (("phase", current.value),),
                 )
             )
 
@@ -562,20 +792,20 @@ class RuntimeConstraintChecker:
             if missing_levels:
                 missing_names = sorted(level.value for level in missing_levels)
                 violations.append(
-                    ConstraintViolation(
-                        constraint_id="C-severity-eager",
-                        message=(
+                    _violation(
+                        "C-severity-eager",
+                        (
                             f"Phase p10 (code review) requires all 3 severity groups "
                             f"(BLOCKER, IMPORTANT, MINOR) to be created eagerly. "
                             f"Missing: {missing_names}. "
                             "Severity groups must be created immediately when review starts, "
                             "not lazily."
                         ),
-                        context={
-                            "phase": current.value,
-                            "missing_severity_levels": ",".join(missing_names),
-                            "present_count": str(len(state.severity_groups)),
-                        },
+                        (
+                            ("phase", current.value),
+                            ("missing_severity_levels", ",".join(missing_names)),
+                            ("present_count", str(len(state.severity_groups))),
+                        ),
                     )
                 )
 
@@ -597,31 +827,13 @@ class RuntimeConstraintChecker:
         spec covers it (i.e. it's an unrecognized actor-change transition).
         Returns empty list for same-actor transitions (p5→p6, p6→p7) and
         well-known transitions that have handoff specs.
-        """
-        if (from_phase, to_phase) in _SAME_ACTOR:
-            return []
-
-        if (from_phase, to_phase) not in _HANDOFF_REQUIRED_TRANSITIONS:
-            return []
 
-        # The transition IS an actor-change transition — handoff is required.
-        # We return a reminder violation. The actual handoff file existence
-        # must be verified by the workflow, not at runtime against EpochState alone.
-        return [
-            ConstraintViolation(
-                constraint_id="C-handoff-skill-invocation",
-                message=(
-                    f"Transition {from_phase.value!r} → {to_phase.value!r} requires "
-                    f"a handoff document and the receiving agent's prompt MUST start "
-                    f"with Skill(/aura:{{role}}). "
-                    f"Store handoff at .git/.aura/handoff/{{request-id}}/."
-                ),
-                context={
-                    "from_phase": from_phase.value,
-                    "to_phase": to_phase.value,
-                },
-            )
-        ]
+        The result is a pure function of the two PhaseId arguments, so it is
+        memoized in the module-level _handoff_violations cache (at most
+        |PhaseId|² entries); this method materializes a fresh list at the
+        boundary.
+        """
+        return list(_handoff_violations(from_phase, to_phase))
 
     def check_blocker_gate(self, state: EpochState) -> list[ConstraintViolation]:
         """C-worker-gates / blocker gate: p10→p11 blocked while blocker_count > 0.
@@ -636,16 +848,16 @@ class RuntimeConstraintChecker:
             return []
 
         return [
-            ConstraintViolation(
-                constraint_id="C-worker-gates",
-                message=(
+            _violation(
+                "C-worker-gates",
+                (
                     f"Phase p10 has {state.blocker_count} unresolved BLOCKER(s). "
                     "All BLOCKERs must be resolved before advancing to p11 (Impl UAT)."
                 ),
-                context={
-                    "phase": state.current_phase.value,
-                    "blocker_count": str(state.blocker_count),
-                },
+                (
+                    ("phase", state.current_phase.value),
+                    ("blocker_count", str(state.blocker_count)),
+                ),
             )
         ]
 
@@ -735,14 +947,13 @@ class RuntimeConstraintChecker:
         current = state.current_phase
 
         # Validate that current_role is a known role string.
-        known_roles = {r.value for r in RoleId}
-        if state.current_role not in known_roles:
+        if state.current_role not in _KNOWN_ROLES:
             violations.append(
                 ConstraintViolation(
                     constraint_id="C-vertical-slices",
                     message=(
                         f"Unknown role {state.current_role!r}. "
-                        f"Valid roles are: {sorted(known_roles)}."
+                        f"Valid roles are: {sorted(_KNOWN_ROLES)}."
                     ),
                     context={
                         "current_role": state.current_role,
@@ -763,8 +974,7 @@ class RuntimeConstraintChecker:
         Returns violation if the vote string is not a valid VoteType value.
         Invalid values include: APPROVE, APPROVE_WITH_COMMENTS, REQUEST_CHANGES, REJECT.
         """
-        valid_votes = {v.value for v in VoteType}
-        if vote in valid_votes:
+        if vote in _VALID_VOTES:
             return []
 
         return [
@@ -775,7 +985,7 @@ class RuntimeConstraintChecker:
                     f"Values like APPROVE, APPROVE_WITH_COMMENTS, REQUEST_CHANGES, "
                     f"REJECT are not valid."
                 ),
-                context={"vote": vote, "valid_votes": ",".join(sorted(valid_votes))},
+                context={"vote": vote, "valid_votes": _VALID_VOTES_DISPLAY},
             )
         ]
 
@@ -857,9 +1067,7 @@ class RuntimeConstraintChecker:
         Returns violation if the title does not start with 'PROPOSAL-' followed
         by a positive integer.
         """
-        import re
-
-        if re.match(r"^PROPOSAL-\d+:", title):
+        if _is_proposal_title(title):
             return []
 
         return [
@@ -880,10 +1088,8 @@ class RuntimeConstraintChecker:
         axis must be A, B, or C. round is a positive integer starting at 1.
         Returns violation if the title does not match the pattern.
         """
-        import re
-
-        # Match pattern: {SCOPE}-REVIEW-{A|B|C}-{N}: {description}
-        if re.match(r"^.+-REVIEW-[ABC]-\d+", title):
+        # Pattern: {SCOPE}-REVIEW-{A|B|C}-{N}: {description}
+        if _is_review_title(title):
             return []
 
         return [
@@ -934,45 +1140,16 @@ class RuntimeConstraintChecker:
 
         Returns violations if any of the required fields are empty.
         """
-        violations: list[ConstraintViolation] = []
-
-        if not question or not question.strip():
-            violations.append(
-                ConstraintViolation(
-                    constraint_id="C-ure-verbatim",
-                    message=(
-                        "User interview record is missing the question text. "
-                        "Must capture full question text verbatim."
-                    ),
-                    context={"field": "question"},
-                )
-            )
-
-        if not options:
-            violations.append(
-                ConstraintViolation(
-                    constraint_id="C-ure-verbatim",
-                    message=(
-                        "User interview record has no options. "
-                        "Must capture ALL option descriptions (not just numbers)."
-                    ),
-                    context={"field": "options", "option_count": "0"},
-                )
-            )
-
-        if not response or not response.strip():
-            violations.append(
-                ConstraintViolation(
-                    constraint_id="C-ure-verbatim",
-                    message=(
-                        "User interview record is missing the user's response. "
-                        "Must capture verbatim response."
-                    ),
-                    context={"field": "response"},
-                )
-            )
-
-        return violations
+        present = (
+            bool(question and question.strip()),
+            bool(options),
+            bool(response and response.strip()),
+        )
+        return [
+            _violation("C-ure-verbatim", message, context_items)
+            for ok, (message, context_items) in zip(present, _URE_FIELDS)
+            if not ok
+        ]
 
     def check_followup_timing(
         self,
@@ -1115,9 +1292,10 @@ class RuntimeConstraintChecker:
 
         Returns violation if the title lacks the FOLLOWUP prefix.
         """
-        for prefix in _FOLLOWUP_PREFIXES:
-            if followup_task_title.startswith(prefix):
-                return []
+        # str.startswith accepts the whole prefix tuple — one C-level call
+        # that short-circuits on first match, instead of a Python loop.
+        if followup_task_title.startswith(_FOLLOWUP_PREFIXES):
+            return []
 
         return [
             ConstraintViolation(
@@ -34,6 +34,8 @@ isinstance() for runtime signature safety — it is a convenience check only.
 
 from __future__ import annotations
 
+import functools
+import typing
 from dataclasses import dataclass
 from typing import Any, Protocol, runtime_checkable
 
@@ -157,6 +159,46 @@ class AuditTrail(Protocol):
         ...
 
 
+# ─── Cached Structural Checks ─────────────────────────────────────────────────
+
+
+def _protocol_attrs(iface: type) -> frozenset[str]:
+    """Return the member names a Protocol requires.
+
+    Python 3.12+ exposes __protocol_attrs__ directly on the Protocol class;
+    on earlier versions we fall back to typing._get_protocol_attrs (the same
+    source isinstance() uses internally).
+    """
+    attrs = getattr(iface, "__protocol_attrs__", None)
+    if attrs is None:
+        attrs = typing._get_protocol_attrs(iface)  # type: ignore[attr-defined]
+    return frozenset(attrs)
+
+
+@functools.lru_cache(maxsize=None)
+def satisfies_iface(tp: type, iface: type) -> bool:
+    """Return True if type tp structurally satisfies the given Protocol.
+
+    Drop-in hot-path replacement for ``isinstance(obj, Iface)`` on
+    @runtime_checkable Protocols: call ``satisfies_iface(type(obj), Iface)``
+    instead. _ProtocolMeta.__instancecheck__ re-runs a hasattr-per-member scan
+    on every isinstance() call; this helper performs that scan once per
+    (type, interface) pair and answers subsequent checks from the cache.
+
+    Same semantics and same PEP 544 limitation as isinstance(): only member
+    *presence* is verified, not parameter or return signatures (see the
+    module docstring's TYPE_CHECKING Protocol Limitations section).
+
+    Args:
+        tp:    The concrete type to check (``type(obj)``, not the instance).
+        iface: A Protocol class such as ConstraintValidatorInterface.
+
+    Returns:
+        True if tp defines a callable for every member the Protocol requires.
+    """
+    return all(callable(getattr(tp, attr, None)) for attr in _protocol_attrs(iface))
+
+
 # ─── Null Stub Implementations ────────────────────────────────────────────────
 
 
@@ -206,7 +248,7 @@ class NullSecurityGate:
 # Full hierarchy is v2/v3 scope.
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileWithUri:
     """A2A file content object with URI reference.
 
@@ -223,14 +265,14 @@ class FileWithUri:
     mime_type: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TextPart:
     """A2A TextPart — plain text content."""
 
     text: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FilePart:
     """A2A FilePart — file content reference via nested FileWithUri.
 
@@ -244,7 +286,7 @@ class FilePart:
     file_with_uri: FileWithUri
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DataPart:
     """A2A DataPart — structured data payload."""
 
@@ -258,7 +300,7 @@ Part = TextPart | FilePart | DataPart
 # ─── Tool Call ────────────────────────────────────────────────────────────────
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToolCall:
     """MCP-compatible tool call representation.
 
@@ -321,7 +363,12 @@ class ToolCall:
 # ─── Model Identifier ─────────────────────────────────────────────────────────
 
 
-@dataclass(frozen=True)
+def _raise_bad_model_id(s: str) -> typing.NoReturn:
+    """Raise the ModelId.parse ValueError (cold path, kept out of parse())."""
+    raise ValueError(f"Invalid model ID: {s!r} — expected 'provider/model' format")
+
+
+@dataclass(frozen=True, slots=True)
 class ModelId:
     """models.dev composite model identifier: {provider_id}/{model_id}.
 
@@ -361,12 +408,14 @@ class ModelId:
             ValueError: If s does not contain "/", or if provider or model
                         part is empty after splitting.
         """
-        provider, sep, model = s.partition("/")
-        if not sep or not provider or not model:
-            raise ValueError(
-                f"Invalid model ID: {s!r} — expected 'provider/model' format"
-            )
-        return cls(provider=provider, model=model)
+        # str.find + two slices instead of str.partition: partition always
+        # materializes a throwaway separator string even for valid input.
+        # idx <= 0 covers both "no slash" (-1) and "empty provider" (0);
+        # idx == len(s) - 1 means the model part is empty.
+        idx = s.find("/")
+        if idx <= 0 or idx == len(s) - 1:
+            _raise_bad_model_id(s)
+        return cls(provider=s[:idx], model=s[idx + 1 :])
 
 
 # ─── Re-exports of Event Stub Types ──────────────────────────────────────────
@@ -379,6 +428,8 @@ __all__ = [
     "TranscriptRecorder",
     "SecurityGate",
     "AuditTrail",
+    # Cached structural checks
+    "satisfies_iface",
     # Null stub implementations
     "NullTranscriptRecorder",
     "NullSecurityGate",
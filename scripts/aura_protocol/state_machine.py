@@ -14,6 +14,8 @@ Key types:
 
 from __future__ import annotations
 
+import copy
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
@@ -53,7 +55,7 @@ class EpochState:
     last_error: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TransitionRecord:
     """Immutable audit entry for a single phase transition.
 
@@ -144,6 +146,54 @@ class EpochStateMachine:
             epoch_id=epoch_id,
             current_phase=PhaseId.P1_Request,
         )
+        # Memoized available_transitions result. Invalidated (set to None) by
+        # every state-mutating method: advance, record_vote(s), record_blocker.
+        self._avail_cache: list[Transition] | None = None
+
+    def __deepcopy__(self, memo: dict[int, object]) -> EpochStateMachine:
+        """Deep-copy the mutable runtime state; share the immutable specs table.
+
+        The specs mapping is a read-only view of canonical data (or a
+        caller-provided injection) and is safely shared between copies —
+        copying it would be wasted work and MappingProxyType is not
+        deep-copyable anyway. Only EpochState is duplicated.
+        """
+        cloned = object.__new__(type(self))
+        cloned._specs = self._specs
+        cloned._state = copy.deepcopy(self._state, memo)
+        cloned._avail_cache = None
+        return cloned
+
+    def clone(self) -> EpochStateMachine:
+        """Return an independent copy of this machine, cheaper than deepcopy.
+
+        Field-wise copy of EpochState: enum values and TransitionRecord entries
+        are immutable and shared as-is; only the mutable containers
+        (completed_phases, review_votes, severity_groups and its per-level
+        sets, transition_history) are duplicated, so mutations on the clone
+        never leak back to the original. The specs table is shared, same as
+        __deepcopy__. Unlike copy.deepcopy, no reference graph is walked and
+        no memo dict is consulted — use this when snapshotting a machine to
+        branch or replay from a known state.
+        """
+        cloned = object.__new__(type(self))
+        cloned._specs = self._specs
+        src = self._state
+        cloned._state = EpochState(
+            epoch_id=src.epoch_id,
+            current_phase=src.current_phase,
+            completed_phases=set(src.completed_phases),
+            review_votes=dict(src.review_votes),
+            blocker_count=src.blocker_count,
+            current_role=src.current_role,
+            severity_groups={
+                level: set(ids) for level, ids in src.severity_groups.items()
+            },
+            transition_history=list(src.transition_history),
+            last_error=src.last_error,
+        )
+        cloned._avail_cache = None
+        return cloned
 
     # ── Public Properties ──────────────────────────────────────────────────────
 
@@ -166,7 +216,19 @@ class EpochStateMachine:
         - If the BLOCKER gate applies (p10→p11) and blocker_count > 0, the
           forward p11 transition is excluded.
         - Returns empty list when current_phase is COMPLETE or not in specs.
+
+        The result is memoized until the next state mutation (advance,
+        record_vote(s), record_blocker), so repeated queries between
+        transitions recompute nothing. Callers must not mutate the returned
+        list.
         """
+        if self._avail_cache is not None:
+            return self._avail_cache
+        self._avail_cache = self._compute_available_transitions()
+        return self._avail_cache
+
+    def _compute_available_transitions(self) -> list[Transition]:
+        """Apply the gate rules to the transition table (uncached)."""
         current = self._state.current_phase
         if current == PhaseId.Complete or current not in self._specs:
             return []
@@ -278,6 +340,8 @@ class EpochStateMachine:
         # Clear any previous error now that a valid advance has succeeded.
         self._state.last_error = None
 
+        self._avail_cache = None
+
         return record
 
     def validate_advance(self, to_phase: PhaseId) -> list[str]:
@@ -362,6 +426,35 @@ class EpochStateMachine:
                 f"Use ReviewAxis.Correctness, ReviewAxis.TestQuality, or ReviewAxis.Elegance."
             )
         self._state.review_votes[ReviewAxis(axis)] = vote
+        self._avail_cache = None
+
+    def record_votes(self, votes: Iterable[tuple[ReviewAxis, VoteType]]) -> None:
+        """Record a batch of reviewer votes in a single call.
+
+        Bulk counterpart of record_vote() for draining queued vote signals:
+        one Python-level call applies all votes instead of one call frame per
+        vote. Votes are applied in order, so a later vote for the same axis
+        overwrites an earlier one — identical semantics to calling
+        record_vote() once per pair.
+
+        Args:
+            votes: Iterable of (axis, vote) pairs. Each axis is validated the
+                same way record_vote() validates it.
+
+        Raises:
+            ValueError: If any axis is not a valid ReviewAxis value. Votes
+                preceding the invalid entry are already applied when this is
+                raised (same as sequential record_vote() calls).
+        """
+        review_votes = self._state.review_votes
+        for axis, vote in votes:
+            if axis not in _REVIEW_AXES:
+                raise ValueError(
+                    f"Invalid review axis {axis!r}. Must be one of {sorted(_REVIEW_AXES)}. "
+                    f"Use ReviewAxis.Correctness, ReviewAxis.TestQuality, or ReviewAxis.Elegance."
+                )
+            review_votes[ReviewAxis(axis)] = vote
+            self._avail_cache = None
 
     def has_consensus(self) -> bool:
         """Return True if all 3 review axes (CORRECTNESS, TEST_QUALITY, ELEGANCE) have ACCEPT votes.
@@ -389,6 +482,7 @@ class EpochStateMachine:
             self._state.blocker_count = max(0, self._state.blocker_count - 1)
         else:
             self._state.blocker_count += 1
+        self._avail_cache = None
 
     # ── Private Helpers ───────────────────────────────────────────────────────
 
@@ -9,8 +9,10 @@ Integration test: tests/test_schema_types_sync.py verifies Python types match sc
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 from enum import StrEnum
+from types import MappingProxyType
 from typing import Any
 
 
@@ -961,7 +963,7 @@ class Figure:
 # Derived from schema.xml semantic rule _EXPECTED_DOMAINS in validate_schema.py.
 # Each phase number maps to its domain; this dict maps PhaseId to Domain.
 
-PHASE_DOMAIN: dict[PhaseId, Domain] = {
+_PHASE_DOMAIN: dict[PhaseId, Domain] = {
     PhaseId.P1_Request:    Domain.User,
     PhaseId.P2_Elicit:     Domain.User,
     PhaseId.P3_Propose:    Domain.Plan,
@@ -976,6 +978,10 @@ PHASE_DOMAIN: dict[PhaseId, Domain] = {
     PhaseId.P12_Landing:   Domain.Impl,
 }
 
+# Read-only view. Immutability protects downstream memoization (e.g. the
+# state machine's available_transitions cache) from accidental mutation.
+PHASE_DOMAIN: Mapping[PhaseId, Domain] = MappingProxyType(_PHASE_DOMAIN)
+
 
 # ─── Phase Parsing ───────────────────────────────────────────────────────────
 
@@ -1077,7 +1083,7 @@ def parse_phase_id(value: str) -> PhaseId:
 # Transition table derived from schema.xml <phase>/<transitions> elements.
 # Integration test (test_schema_types_sync.py) verifies these match schema.xml.
 
-PHASE_SPECS: dict[PhaseId, PhaseSpec] = {
+_PHASE_SPECS: dict[PhaseId, PhaseSpec] = {
     PhaseId.P1_Request: PhaseSpec(
         id=PhaseId.P1_Request,
         number=1,
@@ -1256,8 +1262,11 @@ PHASE_SPECS: dict[PhaseId, PhaseSpec] = {
     ),
 }
 
+# Read-only view of the canonical transition table.
+PHASE_SPECS: Mapping[PhaseId, PhaseSpec] = MappingProxyType(_PHASE_SPECS)
+
 
-CONSTRAINT_SPECS: dict[str, ConstraintSpec] = {
+_CONSTRAINT_SPECS: dict[str, ConstraintSpec] = {
     "C-audit-never-delete": ConstraintSpec(
         id="C-audit-never-delete",
         given="any task or label",
@@ -1638,8 +1647,11 @@ CONSTRAINT_SPECS: dict[str, ConstraintSpec] = {
     ),
 }
 
+# Read-only view of the canonical constraint catalogue.
+CONSTRAINT_SPECS: Mapping[str, ConstraintSpec] = MappingProxyType(_CONSTRAINT_SPECS)
 
-HANDOFF_SPECS: dict[str, HandoffSpec] = {
+
+_HANDOFF_SPECS: dict[str, HandoffSpec] = {
     "h1": HandoffSpec(
         id="h1",
         source_role=RoleId.Architect,
@@ -1708,6 +1720,9 @@ HANDOFF_SPECS: dict[str, HandoffSpec] = {
     ),
 }
 
+# Read-only view of the canonical handoff catalogue.
+HANDOFF_SPECS: Mapping[str, HandoffSpec] = MappingProxyType(_HANDOFF_SPECS)
+
 
 # ─── New Canonical Dicts (schema-driven) ─────────────────────────────────────
 # Derived from schema.xml. Integration tests in test_schema_types_sync.py verify
@@ -32,6 +32,7 @@ Search attribute keys:
 Activities:
     check_constraints(state, to_phase) -> list[ConstraintViolation]
     record_transition(record: TransitionRecord) -> None
+    record_transitions(records: list[TransitionRecord]) -> None
 
 Child Workflows:
     SliceWorkflow       — single P9_SLICE; runs concurrently with other slices
@@ -42,6 +43,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import timedelta
 
@@ -72,6 +74,12 @@ from aura_protocol.types import (
     VoteType,
 )
 
+# Flat PhaseId → domain-string table. Precomputed once so the per-transition
+# upsert path does a single .get() instead of a membership test, dict lookup,
+# and Enum.value attribute read.
+PHASE_DOMAIN_VALUE: dict[PhaseId, str] = {p: d.value for p, d in PHASE_DOMAIN.items()}
+
+
 # ─── Search Attribute Keys ────────────────────────────────────────────────────
 # These keys are registered in the Temporal namespace and used for forensic
 # querying: "find all workflows where AuraPhase='p9'" etc.
@@ -83,11 +91,40 @@ SA_STATUS: SearchAttributeKey = SearchAttributeKey.for_keyword("AuraStatus")
 SA_DOMAIN: SearchAttributeKey = SearchAttributeKey.for_keyword("AuraDomain")
 SA_LAST_EVENT_TYPE: SearchAttributeKey = SearchAttributeKey.for_keyword("AuraLastEventType")
 
+# Transition records are buffered in the run() loop and flushed to the
+# record_transitions activity in batches — one activity round-trip per flush
+# instead of per transition. A flush happens when the buffer reaches this
+# threshold, when the pending advance queue drains, or when the epoch completes.
+_FLUSH_THRESHOLD = 16
+
+# Activity timeouts, hoisted to module scope so the run() loop reuses the
+# same timedelta objects instead of allocating fresh ones per transition.
+_CHECK_CONSTRAINTS_TIMEOUT = timedelta(seconds=10)
+_RECORD_TRANSITION_TIMEOUT = timedelta(seconds=30)
+
+# Feature flag: when True and multiple advance signals are queued, run() fans
+# out constraint-check activities for the next _SPECULATIVE_CHECK_BATCH queued
+# signals via asyncio.gather before applying advances in order. Off by default
+# — speculative checks run against the pre-advance state, so enable only when
+# advisory (stale-state) violation counts during bursts are acceptable.
+_SPECULATIVE_CONSTRAINT_CHECKS = False
+_SPECULATIVE_CHECK_BATCH = 4
+
+# Module-level logger for activities. logging.getLogger caches by name but
+# still takes a lock and dict lookup per call — resolve it once at import.
+_LOGGER = logging.getLogger(__name__)
+
+# Shared checker for the check_constraints activity. RuntimeConstraintChecker
+# holds only immutable spec dicts after __init__ and check_transition() does
+# not mutate self, so one instance can safely serve every activity invocation
+# on the worker instead of being rebuilt per call.
+_CONSTRAINT_CHECKER = RuntimeConstraintChecker()
+
 
 # ─── Signal / Query Types (frozen dataclasses) ────────────────────────────────
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EpochInput:
     """Input for EpochWorkflow.run().
 
@@ -99,7 +136,7 @@ class EpochInput:
     request_description: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EpochResult:
     """Return value of EpochWorkflow.run() when the epoch reaches COMPLETE.
 
@@ -122,7 +159,7 @@ class EpochResult:
     constraint_violations_total: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PhaseAdvanceSignal:
     """Signal payload for EpochWorkflow.advance_phase().
 
@@ -136,7 +173,7 @@ class PhaseAdvanceSignal:
     condition_met: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReviewVoteSignal:
     """Signal payload for EpochWorkflow.submit_vote().
 
@@ -298,8 +335,7 @@ async def check_constraints(
     may in future versions involve I/O (reading external beads state, etc.).
     Keeping it as an activity ensures the workflow remains deterministic.
     """
-    checker = RuntimeConstraintChecker()
-    return checker.check_transition(state, to_phase)
+    return _CONSTRAINT_CHECKER.check_transition(state, to_phase)
 
 
 @activity.defn
@@ -316,8 +352,7 @@ async def record_transition(record: TransitionRecord) -> None:
     """
     # v1 stub: transition is already recorded in EpochState.transition_history.
     # v2: write to beads/database/audit log here.
-    logger = logging.getLogger(__name__)
-    logger.info(
+    _LOGGER.info(
         "Transition recorded: %s -> %s (triggered_by=%s)",
         record.from_phase.value,
         record.to_phase.value,
@@ -325,6 +360,32 @@ async def record_transition(record: TransitionRecord) -> None:
     )
 
 
+@activity.defn
+async def record_transitions(records: list[TransitionRecord]) -> None:
+    """Persist a batch of transition records to the audit trail.
+
+    Batched counterpart of record_transition: the workflow buffers records and
+    flushes them here in one activity round-trip instead of one per transition,
+    cutting workflow history size and end-to-end latency for signal bursts.
+
+    In v1, this is a no-op stub — the records are already stored in
+    EpochState.transition_history (in-memory within the workflow). In v2, this
+    would write the batch to a durable store (Beads task comment, database, etc.).
+    """
+    # v1 stub: transitions are already recorded in EpochState.transition_history.
+    # v2: batch-write to beads/database/audit log here.
+    # One aggregated log line per flush (not one per record) — the
+    # isEnabledFor guard skips the summary formatting entirely when INFO
+    # is disabled.
+    if records and _LOGGER.isEnabledFor(logging.INFO):
+        _LOGGER.info(
+            "Recorded %d transitions: %s -> %s",
+            len(records),
+            records[0].from_phase.value,
+            records[-1].to_phase.value,
+        )
+
+
 # ─── Workflow ─────────────────────────────────────────────────────────────────
 
 
@@ -358,12 +419,28 @@ class EpochWorkflow:
           transition to keep AuraPhase / AuraStatus always in sync
     """
 
+    __slots__ = (
+        "_pending_advance",
+        "_pending_votes",
+        "_total_violations",
+        "_pending_records",
+        "_sm",
+        "_slice_progress_log",
+        "_active_sessions",
+        "_last_sa",
+        "_signal_event",
+    )
+
     def __init__(self) -> None:
         # Pending signals are queued here and processed in the run() loop.
-        self._pending_advance: list[PhaseAdvanceSignal] = []
-        self._pending_votes: list[ReviewVoteSignal] = []
+        # deques give O(1) popleft() — list.pop(0) is O(N) per pop and turns
+        # quadratic under signal bursts.
+        self._pending_advance: deque[PhaseAdvanceSignal] = deque()
+        self._pending_votes: deque[ReviewVoteSignal] = deque()
         # Cumulative violation count across all transitions.
         self._total_violations: int = 0
+        # Transition records buffered for the next record_transitions flush.
+        self._pending_records: list[TransitionRecord] = []
         # State machine — initialized in run().
         self._sm: EpochStateMachine | None = None
         # Slice progress log — appended by slice_progress signal handler.
@@ -371,6 +448,14 @@ class EpochWorkflow:
         self._slice_progress_log: list[SliceProgressSignal] = []
         # Active sessions — registered via register_session signal (SLICE-7).
         self._active_sessions: list[SessionRegisterSignal] = []
+        # Last-upserted search attribute values, keyed by SA key. Used by
+        # _upsert_sa_diff() to emit only changed keys per transition.
+        self._last_sa: dict[SearchAttributeKey, str] = {}
+        # Set by signal handlers whenever a processable signal arrives; the
+        # run() loop waits on it instead of re-evaluating queue truthiness.
+        # asyncio.Event is replay-safe here — Temporal's wait_condition just
+        # needs a deterministic predicate, and is_set() is O(1).
+        self._signal_event = asyncio.Event()
 
     # ── Run ───────────────────────────────────────────────────────────────────
 
@@ -397,108 +482,92 @@ class EpochWorkflow:
         # preserves existing search attribute values across upserts, so the
         # epoch ID remains indexed for forensic lookup throughout the run.
         initial_phase = self._sm.state.current_phase
-        initial_domain = PHASE_DOMAIN[initial_phase].value if initial_phase in PHASE_DOMAIN else ""
-        workflow.upsert_search_attributes(
-            [
-                SA_EPOCH_ID.value_set(input.epoch_id),
-                SA_PHASE.value_set(initial_phase.value),
-                SA_ROLE.value_set(self._sm.state.current_role.value),
-                SA_STATUS.value_set("running"),
-                SA_DOMAIN.value_set(initial_domain),
-            ]
+        initial_domain = PHASE_DOMAIN_VALUE.get(initial_phase, "")
+        self._upsert_sa_diff(
+            {
+                SA_EPOCH_ID: input.epoch_id,
+                SA_PHASE: initial_phase.value,
+                SA_ROLE: self._sm.state.current_role.value,
+                SA_STATUS: "running",
+                SA_DOMAIN: initial_domain,
+            }
         )
 
         # Main signal-driven loop.
-        while self._sm.state.current_phase != PhaseId.Complete:
-            # Wait until there is something to process.
-            await workflow.wait_condition(
-                lambda: bool(self._pending_advance) or bool(self._pending_votes)
-            )
-
-            # 1. Drain all pending votes.
-            while self._pending_votes:
-                vote_signal = self._pending_votes.pop(0)
-                self._sm.record_vote(vote_signal.axis, vote_signal.vote)
-
-            # 2. Process the next advance signal.
+        while self._sm.state.current_phase is not PhaseId.Complete:
+            # Wait until there is something to process. The event is cleared
+            # only when both queues are fully drained — a signal arriving
+            # mid-iteration re-sets it, so nothing queued is ever lost, and
+            # leftover queued signals keep the event set across iterations.
+            if not self._pending_advance and not self._pending_votes:
+                self._signal_event.clear()
+            await workflow.wait_condition(self._signal_event.is_set)
+
+            # 1. Drain all pending votes in one bulk state-machine call.
+            if self._pending_votes:
+                votes = [(s.axis, s.vote) for s in self._pending_votes]
+                self._pending_votes.clear()
+                self._sm.record_votes(votes)
+
+            # 2. Process pending advance signals.
             if not self._pending_advance:
                 continue
 
-            advance_signal = self._pending_advance.pop(0)
+            # Speculative parallel constraint checks (opt-in): during a signal
+            # burst, dispatch the check activities for the next K queued
+            # signals concurrently via asyncio.gather, then apply the advances
+            # strictly in order, short-circuiting on the first failure (the
+            # unapplied remainder is requeued at the front). Later checks run
+            # against the pre-advance state, so their violations are advisory;
+            # the sequential advance below still enforces structural validity.
+            # Replay-safe: the number of activities scheduled is a pure
+            # function of the queue length at this decision point.
+            if _SPECULATIVE_CONSTRAINT_CHECKS and len(self._pending_advance) > 1:
+                batch = [
+                    self._pending_advance.popleft()
+                    for _ in range(
+                        min(len(self._pending_advance), _SPECULATIVE_CHECK_BATCH)
+                    )
+                ]
+                checks = [
+                    workflow.execute_activity(
+                        check_constraints,
+                        args=[self._sm.state, s.to_phase],
+                        start_to_close_timeout=_CHECK_CONSTRAINTS_TIMEOUT,
+                    )
+                    for s in batch
+                ]
+                results = await asyncio.gather(*checks)
+                for i, (signal, violations) in enumerate(zip(batch, results)):
+                    self._total_violations += len(violations)
+                    if not await self._apply_advance(input, signal):
+                        self._pending_advance.extendleft(reversed(batch[i + 1 :]))
+                        break
+                continue
 
-            # 2a. Check constraints (activity — non-deterministic allowed here).
-            violations = await workflow.execute_activity(
-                check_constraints,
-                args=[self._sm.state, advance_signal.to_phase],
-                start_to_close_timeout=timedelta(seconds=10),
-            )
-            self._total_violations += len(violations)
+            advance_signal = self._pending_advance.popleft()
 
-            # 2b. Advance state machine (pure, deterministic).
-            # Pass timestamp=workflow.now() directly so the record uses
-            # deterministic workflow time — no post-hoc mutation needed.
-            try:
-                record = self._sm.advance(
-                    advance_signal.to_phase,
-                    triggered_by=advance_signal.triggered_by,
-                    condition_met=advance_signal.condition_met,
-                    timestamp=workflow.now(),
-                )
-            except TransitionError as e:
-                # Invalid advance — record the failed attempt in the audit trail
-                # so the transition_history captures all attempts (not just successes).
-                # The failed record uses condition_met="FAILED: {error}" for display
-                # and success=False for all programmatic success/failure checks.
-                failed_record = TransitionRecord(
-                    from_phase=self._sm.state.current_phase,
-                    to_phase=advance_signal.to_phase,
-                    timestamp=workflow.now(),
-                    triggered_by=advance_signal.triggered_by,
-                    condition_met=f"FAILED: {e}",
-                    success=False,
+            # 2a. Check constraints (activity — non-deterministic allowed here).
+            # Cheap structural pre-check first: when to_phase is not an
+            # available transition, the advance below is guaranteed to raise
+            # TransitionError, so the activity round-trip would be wasted work.
+            # Skipping it still records the failed attempt in the audit trail
+            # via the except branch in 2b.
+            if any(
+                t.to_phase == advance_signal.to_phase
+                for t in self._sm.available_transitions
+            ):
+                violations = await workflow.execute_activity(
+                    check_constraints,
+                    args=[self._sm.state, advance_signal.to_phase],
+                    start_to_close_timeout=_CHECK_CONSTRAINTS_TIMEOUT,
                 )
-                self._sm.state.transition_history.append(failed_record)
-                self._sm.state.last_error = str(e)
-                continue
-
-            # 2c. Record transition (activity — I/O boundary).
-            await workflow.execute_activity(
-                record_transition,
-                args=[record],
-                start_to_close_timeout=timedelta(seconds=10),
-            )
+                self._total_violations += len(violations)
 
-            # 2d. Record audit event (activity — I/O boundary).
-            await workflow.execute_activity(
-                "record_audit_event",
-                AuditEvent(
-                    epoch_id=input.epoch_id,
-                    event_type=EventType.PhaseTransition,
-                    phase=record.to_phase,
-                    role=self._sm.state.current_role,
-                    payload={"from": record.from_phase.value, "to": record.to_phase.value},
-                ),
-                start_to_close_timeout=timedelta(seconds=10),
-            )
+            await self._apply_advance(input, advance_signal)
 
-            # 2e. Upsert search attributes atomically with the transition.
-            current = self._sm.state.current_phase
-            domain_value = (
-                PHASE_DOMAIN[current].value
-                if current in PHASE_DOMAIN
-                else ""
-            )
-            workflow.upsert_search_attributes(
-                [
-                    SA_PHASE.value_set(current.value),
-                    SA_ROLE.value_set(self._sm.state.current_role.value),
-                    SA_STATUS.value_set(
-                        "complete" if current == PhaseId.Complete else "running"
-                    ),
-                    SA_DOMAIN.value_set(domain_value),
-                    SA_LAST_EVENT_TYPE.value_set(EventType.PhaseTransition.value),
-                ]
-            )
+        # Final flush — ensure no buffered records are lost before returning.
+        await self._flush_pending_records()
 
         history = self._sm.state.transition_history
         successful = sum(1 for r in history if r.success)
@@ -510,6 +579,119 @@ class EpochWorkflow:
             constraint_violations_total=self._total_violations,
         )
 
+    async def _apply_advance(
+        self, input: EpochInput, advance_signal: PhaseAdvanceSignal
+    ) -> bool:
+        """Apply one advance signal: advance, record, audit, upsert (steps 2b–2e).
+
+        Returns True when the state machine accepted the transition; False when
+        it raised TransitionError (the failed attempt is still recorded in
+        transition_history for the audit trail).
+        """
+        # 2b. Advance state machine (pure, deterministic).
+        # Pass timestamp=workflow.now() directly so the record uses
+        # deterministic workflow time — no post-hoc mutation needed.
+        try:
+            record = self._sm.advance(
+                advance_signal.to_phase,
+                triggered_by=advance_signal.triggered_by,
+                condition_met=advance_signal.condition_met,
+                timestamp=workflow.now(),
+            )
+        except TransitionError as e:
+            # Invalid advance — record the failed attempt in the audit trail
+            # so the transition_history captures all attempts (not just successes).
+            # The failed record uses condition_met="FAILED: {error}" for display
+            # and success=False for all programmatic success/failure checks.
+            failed_record = TransitionRecord(
+                from_phase=self._sm.state.current_phase,
+                to_phase=advance_signal.to_phase,
+                timestamp=workflow.now(),
+                triggered_by=advance_signal.triggered_by,
+                condition_met=f"FAILED: {e}",
+                success=False,
+            )
+            self._sm.state.transition_history.append(failed_record)
+            self._sm.state.last_error = str(e)
+            return False
+
+        # 2c. Buffer the transition record; flush in batches (activity — I/O
+        # boundary). Flushing on queue drain keeps the audit trail current
+        # whenever the workflow goes idle; the threshold bounds buffer growth
+        # during sustained signal bursts.
+        self._pending_records.append(record)
+        if (
+            len(self._pending_records) >= _FLUSH_THRESHOLD
+            or not self._pending_advance
+            or self._sm.state.current_phase is PhaseId.Complete
+        ):
+            await self._flush_pending_records()
+
+        # 2d. Record audit event (activity — I/O boundary).
+        await workflow.execute_activity(
+            "record_audit_event",
+            AuditEvent(
+                epoch_id=input.epoch_id,
+                event_type=EventType.PhaseTransition,
+                phase=record.to_phase,
+                role=self._sm.state.current_role,
+                payload={"from": record.from_phase.value, "to": record.to_phase.value},
+            ),
+            start_to_close_timeout=_CHECK_CONSTRAINTS_TIMEOUT,
+        )
+
+        # 2e. Upsert search attributes atomically with the transition.
+        # Enum .value is a descriptor call — read each once into a local
+        # and reuse instead of re-reading per dict entry.
+        current = self._sm.state.current_phase
+        phase_value = current.value
+        role_value = self._sm.state.current_role.value
+        domain_value = PHASE_DOMAIN_VALUE.get(current, "")
+        self._upsert_sa_diff(
+            {
+                SA_PHASE: phase_value,
+                SA_ROLE: role_value,
+                SA_STATUS: "complete" if current is PhaseId.Complete else "running",
+                SA_DOMAIN: domain_value,
+                SA_LAST_EVENT_TYPE: EventType.PhaseTransition.value,
+            }
+        )
+        return True
+
+    def _upsert_sa_diff(self, desired: dict[SearchAttributeKey, str]) -> None:
+        """Upsert only the search attribute keys whose values actually changed.
+
+        Every upsert_search_attributes() call is recorded in workflow history;
+        emitting unchanged keys (AuraRole and AuraDomain are stable across most
+        transitions) bloats history and replay cost for no benefit. Temporal
+        preserves existing values across upserts, so omitting an unchanged key
+        leaves it indexed as-is. No-op when nothing changed.
+        """
+        updates = [
+            key.value_set(value)
+            for key, value in desired.items()
+            if self._last_sa.get(key) != value
+        ]
+        if updates:
+            workflow.upsert_search_attributes(updates)
+            self._last_sa.update(desired)
+
+    async def _flush_pending_records(self) -> None:
+        """Flush buffered transition records via the record_transitions activity.
+
+        No-op when the buffer is empty. The 30s timeout covers batch I/O
+        (up to _FLUSH_THRESHOLD records per flush).
+        """
+        if not self._pending_records:
+            return
+        records = self._pending_records
+        self._pending_records = []
+        await workflow.execute_activity(
+            record_transitions,
+            args=[records],
+            start_to_close_timeout=_RECORD_TRANSITION_TIMEOUT,
+        )
+
     # ── Signals ───────────────────────────────────────────────────────────────
 
     @workflow.signal
@@ -521,6 +703,7 @@ class EpochWorkflow:
         deterministic ordering and proper activity scheduling.
         """
         self._pending_advance.append(signal)
+        self._signal_event.set()
 
     @workflow.signal
     def submit_vote(self, signal: ReviewVoteSignal) -> None:
@@ -531,6 +714,7 @@ class EpochWorkflow:
         after drain.
         """
         self._pending_votes.append(signal)
+        self._signal_event.set()
 
     @workflow.signal
     def slice_progress(self, signal: SliceProgressSignal) -> None:
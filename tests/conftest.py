@@ -9,6 +9,7 @@ Provides:
 Module-level helpers (import directly):
     _advance_to(sm, target) — drive a state machine through the forward phase path.
     _make_state(phase, epoch_id, **kwargs) — construct a bare EpochState.
+    _record_unanimous_accept(sm) — record ACCEPT on all 3 review axes.
 
 Module-level fixtures (import directly):
     _PROTOCOL_FIXTURE — ProtocolFixture singleton (loaded once, shared across tests).
@@ -18,6 +19,10 @@ pytest fixtures:
     sm                  — fresh EpochStateMachine at P1.
     sm_at_p4            — state machine advanced to P4 (review phase).
     sm_at_p4_with_consensus — sm_at_p4 with all 3 ACCEPT votes recorded.
+    sm_at_p9            — state machine advanced to P9 (slice phase).
+    sm_at_p10           — state machine advanced to P10 (code review phase).
+    sm_complete         — state machine driven to the COMPLETE sentinel.
+    default_checker     — session-scoped RuntimeConstraintChecker (canonical specs).
     protocol_fixture    — ProtocolFixture singleton (YAML-driven test data).
 """
 
@@ -25,6 +30,7 @@ from __future__ import annotations
 
 import pytest
 
+from aura_protocol.constraints import RuntimeConstraintChecker
 from aura_protocol.state_machine import EpochState, EpochStateMachine
 from aura_protocol.types import PhaseId, ReviewAxis, VoteType
 
@@ -49,11 +55,11 @@ _PROTOCOL_FIXTURE = ProtocolFixture()
 
 # Manually ordered forward phase sequence — NOT derived from PHASE_SPECS because
 # PHASE_SPECS transitions include revision loops (e.g. P4→P3, P10→P9) and
-# COMPLETE is not in PHASE_SPECS at all. This list represents the single happy
+# COMPLETE is not in PHASE_SPECS at all. This tuple represents the single happy
 # path with no revisions, used by _advance_to() to drive the state machine
 # forward. Do not reorder or derive from dict iteration (dict order is insertion
 # order but PHASE_SPECS is keyed by enum, not by phase number).
-_FORWARD_PHASES: list[PhaseId] = [
+_FORWARD_PHASES: tuple[PhaseId, ...] = (
     PhaseId.P1_Request,
     PhaseId.P2_Elicit,
     PhaseId.P3_Propose,
@@ -67,7 +73,20 @@ _FORWARD_PHASES: list[PhaseId] = [
     PhaseId.P11_ImplUat,
     PhaseId.P12_Landing,
     PhaseId.Complete,
-]
+)
+
+# Phase → index lookup for _FORWARD_PHASES — O(1) hashed lookup instead of a
+# linear .index() scan on every _advance_to call.
+_FORWARD_IDX: dict[PhaseId, int] = {p: i for i, p in enumerate(_FORWARD_PHASES)}
+
+# Forward edges that require all 3 ACCEPT votes before advancing:
+# P4→P5 (plan review consensus) and P10→P11 (code review consensus + blockers).
+_GATE_EDGES: frozenset[tuple[PhaseId, PhaseId]] = frozenset(
+    {
+        (PhaseId.P4_Review, PhaseId.P5_Uat),
+        (PhaseId.P10_CodeReview, PhaseId.P11_ImplUat),
+    }
+)
 
 
 def _advance_to(sm: EpochStateMachine, target: PhaseId) -> None:
@@ -82,28 +101,27 @@ def _advance_to(sm: EpochStateMachine, target: PhaseId) -> None:
         sm: The state machine to advance. Must be at a phase earlier than target.
         target: The phase to stop at (inclusive — the machine will be AT target).
     """
-    current_idx = _FORWARD_PHASES.index(sm.state.current_phase)
-    target_idx = _FORWARD_PHASES.index(target)
+    current_idx = _FORWARD_IDX[sm.state.current_phase]
+    target_idx = _FORWARD_IDX[target]
 
     for i in range(current_idx, target_idx):
         frm = _FORWARD_PHASES[i]
         nxt = _FORWARD_PHASES[i + 1]
 
-        # Populate consensus gate before P4→P5 (plan review).
-        if frm == PhaseId.P4_Review and nxt == PhaseId.P5_Uat:
-            sm.record_vote(ReviewAxis.Correctness, VoteType.Accept)
-            sm.record_vote(ReviewAxis.TestQuality, VoteType.Accept)
-            sm.record_vote(ReviewAxis.Elegance, VoteType.Accept)
-
-        # Populate consensus + blocker-clear gate before P10→P11 (code review).
-        if frm == PhaseId.P10_CodeReview and nxt == PhaseId.P11_ImplUat:
-            sm.record_vote(ReviewAxis.Correctness, VoteType.Accept)
-            sm.record_vote(ReviewAxis.TestQuality, VoteType.Accept)
-            sm.record_vote(ReviewAxis.Elegance, VoteType.Accept)
+        # Populate the consensus gate before P4→P5 and P10→P11.
+        if (frm, nxt) in _GATE_EDGES:
+            _record_unanimous_accept(sm)
 
         sm.advance(nxt, triggered_by="test", condition_met="test-condition")
 
 
+def _record_unanimous_accept(sm: EpochStateMachine) -> None:
+    """Record an ACCEPT vote on all 3 review axes (satisfies the consensus gate)."""
+    sm.record_vote(ReviewAxis.Correctness, VoteType.Accept)
+    sm.record_vote(ReviewAxis.TestQuality, VoteType.Accept)
+    sm.record_vote(ReviewAxis.Elegance, VoteType.Accept)
+
+
 def _make_state(
     phase: PhaseId = PhaseId.P1_Request,
     epoch_id: str = "test-epoch",
@@ -136,24 +154,110 @@ def sm(epoch_id: str) -> EpochStateMachine:
     return EpochStateMachine(epoch_id)
 
 
-@pytest.fixture
-def sm_at_p4(sm: EpochStateMachine) -> EpochStateMachine:
-    """State machine advanced to P4 (review phase)."""
+@pytest.fixture(scope="session")
+def _sm_at_p4_template() -> EpochStateMachine:
+    """Session-scoped template: state machine advanced to P4 (review phase).
+
+    Built once per session; the three advance() calls (validation + history
+    appends) run once instead of once per test. Tests receive deep copies via
+    the function-scoped fixtures below — never use this template directly.
+    """
+    sm = EpochStateMachine("test-epoch-001")
     sm.advance(PhaseId.P2_Elicit, triggered_by="epoch", condition_met="ok")
     sm.advance(PhaseId.P3_Propose, triggered_by="architect", condition_met="ok")
     sm.advance(PhaseId.P4_Review, triggered_by="architect", condition_met="ok")
     return sm
 
 
+@pytest.fixture
+def sm_at_p4(_sm_at_p4_template: EpochStateMachine) -> EpochStateMachine:
+    """State machine advanced to P4 (review phase).
+
+    Clone of the session template — cheaper than replaying three
+    advance() calls per test, and mutations stay test-local.
+    """
+    return _sm_at_p4_template.clone()
+
+
 @pytest.fixture
 def sm_at_p4_with_consensus(sm_at_p4: EpochStateMachine) -> EpochStateMachine:
     """State machine at P4 with all 3 ACCEPT votes."""
-    sm_at_p4.record_vote(ReviewAxis.Correctness, VoteType.Accept)
-    sm_at_p4.record_vote(ReviewAxis.TestQuality, VoteType.Accept)
-    sm_at_p4.record_vote(ReviewAxis.Elegance, VoteType.Accept)
+    _record_unanimous_accept(sm_at_p4)
     return sm_at_p4
 
 
+@pytest.fixture(scope="session")
+def _sm_at_p9_template() -> EpochStateMachine:
+    """Session-scoped template: state machine advanced to P9 (slice phase).
+
+    Built once per session; the eight-transition walk (including the P4
+    review gate) runs once instead of once per test. Tests receive clones
+    via the sm_at_p9 fixture — never use this template directly.
+    """
+    sm = EpochStateMachine("test-epoch-001")
+    _advance_to(sm, PhaseId.P9_Slice)
+    return sm
+
+
+@pytest.fixture
+def sm_at_p9(_sm_at_p9_template: EpochStateMachine) -> EpochStateMachine:
+    """State machine advanced to P9 (slice phase). Clone of the session template."""
+    return _sm_at_p9_template.clone()
+
+
+@pytest.fixture(scope="session")
+def _sm_at_p10_template() -> EpochStateMachine:
+    """Session-scoped template: state machine advanced to P10 (code review).
+
+    Built once per session; the nine-transition walk (including both review
+    gates) runs once instead of once per test. Tests receive clones via the
+    sm_at_p10 fixture — never use this template directly.
+    """
+    sm = EpochStateMachine("test-epoch-001")
+    _advance_to(sm, PhaseId.P10_CodeReview)
+    return sm
+
+
+@pytest.fixture
+def sm_at_p10(_sm_at_p10_template: EpochStateMachine) -> EpochStateMachine:
+    """State machine advanced to P10 (code review).
+
+    Clone of the session template — cheaper than replaying the nine
+    advance() calls per test, and mutations stay test-local.
+    """
+    return _sm_at_p10_template.clone()
+
+
+@pytest.fixture(scope="session")
+def _sm_complete_template() -> EpochStateMachine:
+    """Session-scoped template: state machine driven to the COMPLETE sentinel.
+
+    The full 12-transition walk runs once per session. Tests receive clones
+    via the sm_complete fixture — never use this template directly.
+    """
+    sm = EpochStateMachine("test-epoch-001")
+    _advance_to(sm, PhaseId.Complete)
+    return sm
+
+
+@pytest.fixture
+def sm_complete(_sm_complete_template: EpochStateMachine) -> EpochStateMachine:
+    """State machine at COMPLETE. Clone of the session template."""
+    return _sm_complete_template.clone()
+
+
+@pytest.fixture(scope="session")
+def default_checker() -> RuntimeConstraintChecker:
+    """Session-scoped RuntimeConstraintChecker with canonical specs.
+
+    The default checker is stateless with respect to the states it inspects,
+    so one shared instance is safe across the whole suite. Constructing a
+    fresh checker per test just re-binds the same spec dicts; tests that need
+    custom constraint/handoff specs construct their own instance inline.
+    """
+    return RuntimeConstraintChecker()
+
+
 @pytest.fixture
 def protocol_fixture() -> ProtocolFixture:
     """Return the module-level ProtocolFixture singleton.
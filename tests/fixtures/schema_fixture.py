@@ -8,18 +8,22 @@ The SchemaFixture class loads the baseline XML and applies mutations to fresh co
 from __future__ import annotations
 
 import copy
+import functools
+import re
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Iterator
+from typing import Callable, Iterable, Iterator
 
 from validate_schema import ErrorLayer
 
+_BASELINE_PATH = Path(__file__).parent / "schema_valid_minimal.xml"
+
 
 # ─── Mutation dataclass ──────────────────────────────────────────────────────
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SchemaMutation:
     """A single schema mutation that should produce a detectable validation error."""
 
@@ -28,72 +32,198 @@ class SchemaMutation:
     description: str
     expected_fragment: str  # substring expected in error message
     category: str  # grouping (e.g., "phase", "label", "handoff")
-    apply_fn: Callable[[ET.Element], None]  # mutates root in-place
+    op: tuple  # ("op_name", *args) — interpreted by _OPS; see apply()
+
+    def apply(self, root: ET.Element) -> None:
+        """Apply this mutation to root in-place via the shared op table."""
+        _OPS[self.op[0]](root, *self.op[1:])
 
 
 # ─── Mutation factories ──────────────────────────────────────────────────────
 
+# Selector pre-compilation: stdlib ElementTree memoizes compiled path selectors
+# in an internal cache keyed by the path string, but the first find() per path
+# still pays the pure-Python ElementPath parse. Priming each mutation's path
+# once at import (factory-call) time moves that one-off compile out of the test
+# hot path — every find() during the suite is then a cache hit. (lxml's
+# ET.XPath objects would be the equivalent, but lxml is not a dependency.)
+_PRIME = ET.Element("_prime")
+
+
+def _precompile(xpath: str) -> str:
+    """Compile a path selector into ElementTree's cache; returns it unchanged."""
+    _PRIME.find(xpath)
+    return xpath
+
+
+# Id-indexed dispatch: most mutation paths have the shape .//tag[@id='x'] — a
+# full descendant walk to find one uniquely-id'd element. Element ids are
+# unique in the baseline, so a single walk at first use builds an id → (tag,
+# child-index path) map and each lookup becomes O(depth) indexed child access.
+# The index is built from the shipped baseline; _find_target verifies the id of
+# the element it lands on and falls back to find() when the root diverges
+# structurally (custom fixture file, or a prior mutation shifted indices).
+_ID_XPATH_RE = re.compile(r"^\.//(?:[\w-]+/)*([\w-]+)\[@id='([^']+)'\]$")
+
+# Bare descendant paths (.//tag, no predicate) short-circuit through
+# root.iter(tag): iter stops at the first match without any path-engine
+# involvement, where find() would still run the compiled selector machinery.
+_BARE_TAG_RE = re.compile(r"^\.//([\w-]+)$")
+
+
+@functools.lru_cache(maxsize=None)
+def _load_tree(path: str) -> ET.ElementTree:
+    """Parse a fixture file once per path; later SchemaFixture instances share it.
+
+    The shared tree is never mutated — fresh_root() hands out deepcopies of
+    the root — so caching across instances (and across fixture
+    re-instantiation in parametrize decorators) is safe.
+    """
+    return ET.parse(path)
+
+
+@functools.lru_cache(maxsize=None)
+def _baseline_id_index() -> dict[str, tuple[str, tuple[int, ...]]]:
+    """Map each id in the baseline schema to its (tag, child-index path)."""
+    index: dict[str, tuple[str, tuple[int, ...]]] = {}
+
+    def walk(elem: ET.Element, path: tuple[int, ...]) -> None:
+        elem_id = elem.get("id")
+        if elem_id is not None and elem_id not in index:
+            index[elem_id] = (elem.tag, path)
+        for i, child in enumerate(elem):
+            walk(child, path + (i,))
+
+    walk(ET.parse(_BASELINE_PATH).getroot(), ())
+    return index
+
+
+def _find_target(root: ET.Element, xpath: str) -> ET.Element | None:
+    """Locate the element addressed by xpath, via the id index when possible."""
+    match = _BARE_TAG_RE.match(xpath)
+    if match is not None:
+        return next(root.iter(match.group(1)), None)
+    match = _ID_XPATH_RE.match(xpath)
+    if match is not None:
+        tag, elem_id = match.groups()
+        entry = _baseline_id_index().get(elem_id)
+        if entry is not None and entry[0] == tag:
+            elem = root
+            try:
+                for i in entry[1]:
+                    elem = elem[i]
+            except IndexError:
+                elem = None
+            if elem is not None and elem.get("id") == elem_id:
+                return elem
+    return root.find(xpath)
+
+
+# Mutations are encoded as ("op_name", *args) tuples interpreted by the _OPS
+# handler table below, instead of one heap-allocated closure per mutation.
+# The handlers are plain module-level functions — one shared code object and
+# frame shape per op kind, no cell-variable loads in the hot path.
+
+
+def _op_del_attr(root: ET.Element, xpath: str, attr: str) -> None:
+    """Op: delete an attribute from the element found by xpath."""
+    elem = _find_target(root, xpath)
+    if elem is not None and attr in elem.attrib:
+        del elem.attrib[attr]
+
+
+def _op_set_attr(root: ET.Element, xpath: str, attr: str, value: str) -> None:
+    """Op: set an attribute value on the element found by xpath."""
+    elem = _find_target(root, xpath)
+    if elem is not None:
+        elem.set(attr, value)
+
+
+def _op_add_elem(
+    root: ET.Element, parent_xpath: str, tag: str, attribs: dict[str, str]
+) -> None:
+    """Op: add a child element to the parent found by xpath."""
+    parent = _find_target(root, parent_xpath)
+    if parent is not None:
+        el = ET.SubElement(parent, tag)
+        for k, v in attribs.items():
+            el.set(k, v)
 
-def _del_attr(xpath: str, attr: str) -> Callable[[ET.Element], None]:
-    """Factory: delete an attribute from an element found by xpath."""
 
-    def apply(root: ET.Element) -> None:
-        elem = root.find(xpath)
-        if elem is not None and attr in elem.attrib:
-            del elem.attrib[attr]
+def _op_remove_child(root: ET.Element, xpath: str, child_tag: str) -> None:
+    """Op: remove a direct child element by tag from the element found by xpath."""
+    parent = _find_target(root, xpath)
+    if parent is not None:
+        child = parent.find(child_tag)
+        if child is not None:
+            parent.remove(child)
 
-    return apply
 
+def _op_batch_del_attrs(
+    root: ET.Element, targets: tuple[tuple[str, str | None, str], ...]
+) -> None:
+    """Op: delete several attributes in one tree walk.
 
-def _set_attr(xpath: str, attr: str, value: str) -> Callable[[ET.Element], None]:
-    """Factory: set an attribute value on an element found by xpath."""
+    Each target is (tag, elem_id, attr); elem_id None matches the first
+    element with that tag. One root.iter() pass services all deletions and
+    stops early once every target has been matched, instead of one selector
+    walk per deletion.
+    """
+    pending = list(targets)
+    for elem in root.iter():
+        if not pending:
+            break
+        tag = elem.tag
+        elem_id = elem.get("id")
+        for target in pending[:]:
+            if target[0] == tag and (target[1] is None or target[1] == elem_id):
+                elem.attrib.pop(target[2], None)
+                pending.remove(target)
 
-    def apply(root: ET.Element) -> None:
-        elem = root.find(xpath)
-        if elem is not None:
-            elem.set(attr, value)
 
-    return apply
+_OPS: dict[str, Callable[..., None]] = {
+    "del_attr": _op_del_attr,
+    "set_attr": _op_set_attr,
+    "add_elem": _op_add_elem,
+    "remove_child": _op_remove_child,
+    "batch_del_attrs": _op_batch_del_attrs,
+}
 
 
-def _add_elem(
-    parent_xpath: str, tag: str, attribs: dict[str, str]
-) -> Callable[[ET.Element], None]:
-    """Factory: add a child element to the parent found by xpath."""
+# Op-tuple builders — keep the declarative mutation tables below readable while
+# precompiling each path selector at import time.
 
-    def apply(root: ET.Element) -> None:
-        parent = root.find(parent_xpath)
-        if parent is not None:
-            el = ET.SubElement(parent, tag)
-            for k, v in attribs.items():
-                el.set(k, v)
 
-    return apply
+def _del_attr(xpath: str, attr: str) -> tuple:
+    return ("del_attr", _precompile(xpath), attr)
 
 
-def _remove_child(xpath: str, child_tag: str) -> Callable[[ET.Element], None]:
-    """Factory: remove a direct child element by tag from element found by xpath."""
+def _batch_del_attrs(targets: list[tuple[str, str | None, str]]) -> tuple:
+    return ("batch_del_attrs", tuple(targets))
 
-    def apply(root: ET.Element) -> None:
-        parent = root.find(xpath)
-        if parent is not None:
-            child = parent.find(child_tag)
-            if child is not None:
-                parent.remove(child)
 
-    return apply
+def _set_attr(xpath: str, attr: str, value: str) -> tuple:
+    return ("set_attr", _precompile(xpath), attr, value)
+
+
+def _add_elem(parent_xpath: str, tag: str, attribs: dict[str, str]) -> tuple:
+    return ("add_elem", _precompile(parent_xpath), tag, attribs)
+
+
+def _remove_child(xpath: str, child_tag: str) -> tuple:
+    return ("remove_child", _precompile(xpath), _precompile(child_tag))
 
 
 # ─── Structural mutations ────────────────────────────────────────────────────
 
-STRUCTURAL_MUTATIONS: list[SchemaMutation] = [
+STRUCTURAL_MUTATIONS: tuple[SchemaMutation, ...] = (
     SchemaMutation(
         name="missing_phase_domain",
         layer=ErrorLayer.STRUCTURAL,
         description="Phase without domain attribute",
         expected_fragment="domain",
         category="phase",
-        apply_fn=_del_attr(".//phase[@id='p1']", "domain"),
+        op=_del_attr(".//phase[@id='p1']", "domain"),
     ),
     SchemaMutation(
         name="missing_phase_number",
@@ -101,7 +231,7 @@ STRUCTURAL_MUTATIONS: list[SchemaMutation] = [
         description="Phase without number attribute",
         expected_fragment="number",
         category="phase",
-        apply_fn=_del_attr(".//phase[@id='p1']", "number"),
+        op=_del_attr(".//phase[@id='p1']", "number"),
     ),
     SchemaMutation(
         name="missing_substep_label_ref",
@@ -109,7 +239,7 @@ STRUCTURAL_MUTATIONS: list[SchemaMutation] = [
         description="Substep without label-ref attribute",
         expected_fragment="label-ref",
         category="substep",
-        apply_fn=_del_attr(".//substep[@id='s1']", "label-ref"),
+        op=_del_attr(".//substep[@id='s1']", "label-ref"),
     ),
     SchemaMutation(
         name="missing_substep_order",
@@ -117,7 +247,7 @@ STRUCTURAL_MUTATIONS: list[SchemaMutation] = [
         description="Substep without order attribute",
         expected_fragment="order",
         category="substep",
-        apply_fn=_del_attr(".//substep[@id='s1']", "order"),
+        op=_del_attr(".//substep[@id='s1']", "order"),
     ),
     SchemaMutation(
         name="missing_label_value",
@@ -125,7 +255,7 @@ STRUCTURAL_MUTATIONS: list[SchemaMutation] = [
         description="Label without value attribute",
         expected_fragment="value",
         category="label",
-        apply_fn=_del_attr(".//label[@id='L-p1s1']", "value"),
+        op=_del_attr(".//label[@id='L-p1s1']", "value"),
     ),
     SchemaMutation(
         name="missing_label_phase_ref",
@@ -133,7 +263,7 @@ STRUCTURAL_MUTATIONS: list[SchemaMutation] = [
         description="Non-special label without phase-ref",
         expected_fragment="phase-ref",
         category="label",
-        apply_fn=_del_attr(".//label[@id='L-p1s1']", "phase-ref"),
+        op=_del_attr(".//label[@id='L-p1s1']", "phase-ref"),
     ),
     SchemaMutation(
         name="missing_constraint_should_not",
@@ -141,7 +271,7 @@ STRUCTURAL_MUTATIONS: list[SchemaMutation] = [
         description="Constraint without should-not attribute",
         expected_fragment="should-not",
         category="constraint",
-        apply_fn=_del_attr(".//constraint[@id='C-test']", "should-not"),
+        op=_del_attr(".//constraint[@id='C-test']", "should-not"),
     ),
     SchemaMutation(
         name="missing_handoff_content_level",
@@ -149,7 +279,7 @@ STRUCTURAL_MUTATIONS: list[SchemaMutation] = [
         description="Handoff without content-level attribute",
         expected_fragment="content-level",
         category="handoff",
-        apply_fn=_del_attr(".//handoff[@id='h-test']", "content-level"),
+        op=_del_attr(".//handoff[@id='h-test']", "content-level"),
     ),
     SchemaMutation(
         name="missing_title_convention_created_by",
@@ -157,7 +287,7 @@ STRUCTURAL_MUTATIONS: list[SchemaMutation] = [
         description="Title convention without created-by",
         expected_fragment="created-by",
         category="title-convention",
-        apply_fn=_del_attr(".//title-convention", "created-by"),
+        op=_del_attr(".//title-convention", "created-by"),
     ),
     SchemaMutation(
         name="missing_document_path",
@@ -165,7 +295,7 @@ STRUCTURAL_MUTATIONS: list[SchemaMutation] = [
         description="Document without path attribute",
         expected_fragment="path",
         category="document",
-        apply_fn=_del_attr(".//document[@id='doc-test']", "path"),
+        op=_del_attr(".//document[@id='doc-test']", "path"),
     ),
     SchemaMutation(
         name="missing_axis_letter",
@@ -173,7 +303,7 @@ STRUCTURAL_MUTATIONS: list[SchemaMutation] = [
         description="Axis without letter attribute",
         expected_fragment="letter",
         category="axis",
-        apply_fn=_del_attr(".//axis[@id='axis-A']", "letter"),
+        op=_del_attr(".//axis[@id='axis-A']", "letter"),
     ),
     SchemaMutation(
         name="missing_command_name",
@@ -181,7 +311,7 @@ STRUCTURAL_MUTATIONS: list[SchemaMutation] = [
         description="Command without name attribute",
         expected_fragment="name",
         category="command",
-        apply_fn=_del_attr(".//command[@id='cmd-test']", "name"),
+        op=_del_attr(".//command[@id='cmd-test']", "name"),
     ),
     # ── Startup sequence ──
     SchemaMutation(
@@ -190,7 +320,7 @@ STRUCTURAL_MUTATIONS: list[SchemaMutation] = [
         description="Startup sequence step without order attribute",
         expected_fragment="order",
         category="startup_sequence",
-        apply_fn=_del_attr(".//startup-sequence/step", "order"),
+        op=_del_attr("./phases/phase/substeps/substep/startup-sequence/step", "order"),
     ),
     # ── Standing teams ──
     SchemaMutation(
@@ -199,7 +329,7 @@ STRUCTURAL_MUTATIONS: list[SchemaMutation] = [
         description="Standing team without id attribute",
         expected_fragment="id",
         category="standing_team",
-        apply_fn=_del_attr(".//standing-teams/team[@id='team-test']", "id"),
+        op=_del_attr(".//standing-teams/team[@id='team-test']", "id"),
     ),
     SchemaMutation(
         name="missing_agent_template_role",
@@ -207,7 +337,7 @@ STRUCTURAL_MUTATIONS: list[SchemaMutation] = [
         description="Agent template without role attribute",
         expected_fragment="role",
         category="agent_template",
-        apply_fn=_del_attr(".//agent-template", "role"),
+        op=_del_attr(".//agent-template", "role"),
     ),
     SchemaMutation(
         name="missing_agent_template_skill_ref",
@@ -215,7 +345,7 @@ STRUCTURAL_MUTATIONS: list[SchemaMutation] = [
         description="Agent template without skill-ref attribute",
         expected_fragment="skill-ref",
         category="agent_template",
-        apply_fn=_del_attr(".//agent-template", "skill-ref"),
+        op=_del_attr(".//agent-template", "skill-ref"),
     ),
     SchemaMutation(
         name="missing_agent_template_min_count",
@@ -223,7 +353,7 @@ STRUCTURAL_MUTATIONS: list[SchemaMutation] = [
         description="Agent template without min-count attribute",
         expected_fragment="min-count",
         category="agent_template",
-        apply_fn=_del_attr(".//agent-template", "min-count"),
+        op=_del_attr(".//agent-template", "min-count"),
     ),
     # ── Skill invocation ──
     SchemaMutation(
@@ -232,20 +362,20 @@ STRUCTURAL_MUTATIONS: list[SchemaMutation] = [
         description="Skill invocation without directive attribute",
         expected_fragment="directive",
         category="skill_invocation",
-        apply_fn=_del_attr(".//skill-invocation", "directive"),
+        op=_del_attr(".//skill-invocation", "directive"),
     ),
-]
+)
 
 # ─── Referential integrity mutations ─────────────────────────────────────────
 
-REFERENTIAL_MUTATIONS: list[SchemaMutation] = [
+REFERENTIAL_MUTATIONS: tuple[SchemaMutation, ...] = (
     SchemaMutation(
         name="dangling_label_phase_ref",
         layer=ErrorLayer.REFERENTIAL,
         description="Label references nonexistent phase",
         expected_fragment="p99",
         category="label_to_phase",
-        apply_fn=_set_attr(".//label[@id='L-p1s1']", "phase-ref", "p99"),
+        op=_set_attr(".//label[@id='L-p1s1']", "phase-ref", "p99"),
     ),
     SchemaMutation(
         name="dangling_label_substep_ref",
@@ -253,7 +383,7 @@ REFERENTIAL_MUTATIONS: list[SchemaMutation] = [
         description="Label references nonexistent substep",
         expected_fragment="s99",
         category="label_to_substep",
-        apply_fn=_set_attr(".//label[@id='L-p1s1']", "substep-ref", "s99"),
+        op=_set_attr(".//label[@id='L-p1s1']", "substep-ref", "s99"),
     ),
     SchemaMutation(
         name="dangling_substep_label_ref",
@@ -261,7 +391,7 @@ REFERENTIAL_MUTATIONS: list[SchemaMutation] = [
         description="Substep references nonexistent label",
         expected_fragment="L-nonexistent",
         category="substep_to_label",
-        apply_fn=_set_attr(".//substep[@id='s1']", "label-ref", "L-nonexistent"),
+        op=_set_attr(".//substep[@id='s1']", "label-ref", "L-nonexistent"),
     ),
     SchemaMutation(
         name="dangling_command_role_ref",
@@ -269,7 +399,7 @@ REFERENTIAL_MUTATIONS: list[SchemaMutation] = [
         description="Command references nonexistent role",
         expected_fragment="bad-role",
         category="command_to_role",
-        apply_fn=_set_attr(".//command[@id='cmd-test']", "role-ref", "bad-role"),
+        op=_set_attr(".//command[@id='cmd-test']", "role-ref", "bad-role"),
     ),
     SchemaMutation(
         name="dangling_handoff_at_phase",
@@ -277,7 +407,7 @@ REFERENTIAL_MUTATIONS: list[SchemaMutation] = [
         description="Handoff references nonexistent phase",
         expected_fragment="p99",
         category="handoff_to_phase",
-        apply_fn=_set_attr(".//handoff[@id='h-test']", "at-phase", "p99"),
+        op=_set_attr(".//handoff[@id='h-test']", "at-phase", "p99"),
     ),
     SchemaMutation(
         name="dangling_handoff_source_role",
@@ -285,7 +415,7 @@ REFERENTIAL_MUTATIONS: list[SchemaMutation] = [
         description="Handoff references nonexistent source role",
         expected_fragment="bad-role",
         category="handoff_to_role",
-        apply_fn=_set_attr(".//handoff[@id='h-test']", "source-role", "bad-role"),
+        op=_set_attr(".//handoff[@id='h-test']", "source-role", "bad-role"),
     ),
     SchemaMutation(
         name="dangling_transition_to_phase",
@@ -293,7 +423,7 @@ REFERENTIAL_MUTATIONS: list[SchemaMutation] = [
         description="Transition references nonexistent phase",
         expected_fragment="p99",
         category="transition_to_phase",
-        apply_fn=_set_attr(".//transition[@to-phase='p2']", "to-phase", "p99"),
+        op=_set_attr("./phases/phase/transitions/transition[@to-phase='p2']", "to-phase", "p99"),
     ),
     SchemaMutation(
         name="dangling_title_label_ref",
@@ -301,7 +431,7 @@ REFERENTIAL_MUTATIONS: list[SchemaMutation] = [
         description="Title convention references nonexistent label",
         expected_fragment="L-nonexistent",
         category="title_to_label",
-        apply_fn=_set_attr(".//title-convention", "label-ref", "L-nonexistent"),
+        op=_set_attr(".//title-convention", "label-ref", "L-nonexistent"),
     ),
     SchemaMutation(
         name="dangling_title_phase_ref",
@@ -309,7 +439,7 @@ REFERENTIAL_MUTATIONS: list[SchemaMutation] = [
         description="Title convention references nonexistent phase",
         expected_fragment="p99",
         category="title_to_phase",
-        apply_fn=_set_attr(".//title-convention", "phase-ref", "p99"),
+        op=_set_attr(".//title-convention", "phase-ref", "p99"),
     ),
     SchemaMutation(
         name="dangling_entity_refs",
@@ -317,7 +447,7 @@ REFERENTIAL_MUTATIONS: list[SchemaMutation] = [
         description="Document entity references nonexistent phase",
         expected_fragment="p99",
         category="entity_to_phase",
-        apply_fn=_set_attr(".//entity[@type='phase']", "refs", "p1,p99"),
+        op=_set_attr("./documents/document/covers/entity[@type='phase']", "refs", "p1,p99"),
     ),
     SchemaMutation(
         name="dangling_phase_ref_child",
@@ -325,8 +455,8 @@ REFERENTIAL_MUTATIONS: list[SchemaMutation] = [
         description="Phase-ref child element references nonexistent phase",
         expected_fragment="p99",
         category="phase_ref_child",
-        apply_fn=_set_attr(
-            ".//role[@id='role-test']/owns-phases/phase-ref[@ref='p1']", "ref", "p99"
+        op=_set_attr(
+            "./roles/role[@id='role-test']/owns-phases/phase-ref[@ref='p1']", "ref", "p99"
         ),
     ),
     # ── Skill invocation refs ──
@@ -336,8 +466,8 @@ REFERENTIAL_MUTATIONS: list[SchemaMutation] = [
         description="Skill invocation references nonexistent command",
         expected_fragment="cmd-nonexistent",
         category="skill_invocation_to_command",
-        apply_fn=_set_attr(
-            ".//skill-invocation[@command-ref='cmd-test']", "command-ref", "cmd-nonexistent"
+        op=_set_attr(
+            "./phases/phase/transitions/transition/skill-invocation[@command-ref='cmd-test']", "command-ref", "cmd-nonexistent"
         ),
     ),
     SchemaMutation(
@@ -346,20 +476,20 @@ REFERENTIAL_MUTATIONS: list[SchemaMutation] = [
         description="Agent template skill-ref references nonexistent command",
         expected_fragment="cmd-nonexistent",
         category="agent_template_to_command",
-        apply_fn=_set_attr(".//agent-template", "skill-ref", "cmd-nonexistent"),
+        op=_set_attr(".//agent-template", "skill-ref", "cmd-nonexistent"),
     ),
-]
+)
 
 # ─── Semantic mutations ──────────────────────────────────────────────────────
 
-SEMANTIC_MUTATIONS: list[SchemaMutation] = [
+SEMANTIC_MUTATIONS: tuple[SchemaMutation, ...] = (
     SchemaMutation(
         name="phase_numbers_gap",
         layer=ErrorLayer.SEMANTIC,
         description="Phase numbers have a gap (1, 5 instead of 1, 2)",
         expected_fragment="sequential",
         category="phase_numbering",
-        apply_fn=_set_attr(".//phase[@id='p2']", "number", "5"),
+        op=_set_attr(".//phase[@id='p2']", "number", "5"),
     ),
     SchemaMutation(
         name="phase_wrong_domain",
@@ -367,7 +497,7 @@ SEMANTIC_MUTATIONS: list[SchemaMutation] = [
         description="Phase 1 has wrong domain (should be user)",
         expected_fragment="should be",
         category="domain_consistency",
-        apply_fn=_set_attr(".//phase[@id='p1']", "domain", "impl"),
+        op=_set_attr(".//phase[@id='p1']", "domain", "impl"),
     ),
     SchemaMutation(
         name="phase_no_substeps",
@@ -375,7 +505,7 @@ SEMANTIC_MUTATIONS: list[SchemaMutation] = [
         description="Phase with no substeps",
         expected_fragment="no substeps",
         category="substep_coverage",
-        apply_fn=_remove_child(".//phase[@id='p2']", "substeps"),
+        op=_remove_child(".//phase[@id='p2']", "substeps"),
     ),
     SchemaMutation(
         name="parallel_no_group",
@@ -383,7 +513,7 @@ SEMANTIC_MUTATIONS: list[SchemaMutation] = [
         description="Parallel substep without parallel-group attribute",
         expected_fragment="parallel-group",
         category="parallel_grouping",
-        apply_fn=_set_attr(".//substep[@id='s1']", "execution", "parallel"),
+        op=_set_attr(".//substep[@id='s1']", "execution", "parallel"),
     ),
     SchemaMutation(
         name="duplicate_label_value",
@@ -391,7 +521,7 @@ SEMANTIC_MUTATIONS: list[SchemaMutation] = [
         description="Two labels with the same value",
         expected_fragment="duplicate value",
         category="label_uniqueness",
-        apply_fn=_add_elem(
+        op=_add_elem(
             ".//labels",
             "label",
             {
@@ -407,7 +537,7 @@ SEMANTIC_MUTATIONS: list[SchemaMutation] = [
         description="Role that owns no phases",
         expected_fragment="no phases",
         category="role_coverage",
-        apply_fn=_remove_child(".//role[@id='role-test']", "owns-phases"),
+        op=_remove_child(".//role[@id='role-test']", "owns-phases"),
     ),
     SchemaMutation(
         name="command_phases_no_file",
@@ -415,7 +545,7 @@ SEMANTIC_MUTATIONS: list[SchemaMutation] = [
         description="Command has phases but no file child",
         expected_fragment="no <file>",
         category="command_completeness",
-        apply_fn=_remove_child(".//command[@id='cmd-test']", "file"),
+        op=_remove_child(".//command[@id='cmd-test']", "file"),
     ),
     SchemaMutation(
         name="duplicate_axis_letter",
@@ -423,7 +553,7 @@ SEMANTIC_MUTATIONS: list[SchemaMutation] = [
         description="Two axes with the same letter",
         expected_fragment="duplicate letter",
         category="axis_uniqueness",
-        apply_fn=_add_elem(
+        op=_add_elem(
             ".//review-axes",
             "axis",
             {"id": "axis-dup", "letter": "A", "name": "Duplicate"},
@@ -435,7 +565,7 @@ SEMANTIC_MUTATIONS: list[SchemaMutation] = [
         description="Phase domain not in DomainType enum",
         expected_fragment="DomainType",
         category="domain_enum",
-        apply_fn=_set_attr(".//phase[@id='p1']", "domain", "unknown"),
+        op=_set_attr(".//phase[@id='p1']", "domain", "unknown"),
     ),
     # ── Startup sequence ordering ──
     SchemaMutation(
@@ -444,7 +574,7 @@ SEMANTIC_MUTATIONS: list[SchemaMutation] = [
         description="Startup sequence steps have gap (1, 3 instead of 1, 2)",
         expected_fragment="sequential",
         category="startup_sequence_ordering",
-        apply_fn=_set_attr(".//startup-sequence/step[@order='2']", "order", "3"),
+        op=_set_attr("./phases/phase/substeps/substep/startup-sequence/step[@order='2']", "order", "3"),
     ),
     # ── Agent template counts ──
     SchemaMutation(
@@ -453,11 +583,21 @@ SEMANTIC_MUTATIONS: list[SchemaMutation] = [
         description="Agent template min-count exceeds max-count",
         expected_fragment="min-count",
         category="agent_template_counts",
-        apply_fn=_set_attr(".//agent-template", "min-count", "5"),
+        op=_set_attr(".//agent-template", "min-count", "5"),
     ),
-]
+)
+
+ALL_MUTATIONS: tuple[SchemaMutation, ...] = (
+    STRUCTURAL_MUTATIONS + REFERENTIAL_MUTATIONS + SEMANTIC_MUTATIONS
+)
 
-ALL_MUTATIONS = STRUCTURAL_MUTATIONS + REFERENTIAL_MUTATIONS + SEMANTIC_MUTATIONS
+# O(1) per-layer lookup; tuples keep the tables immutable, so they are safe to
+# share across parallel test workers.
+MUTATIONS_BY_LAYER: dict[ErrorLayer, tuple[SchemaMutation, ...]] = {
+    ErrorLayer.STRUCTURAL: STRUCTURAL_MUTATIONS,
+    ErrorLayer.REFERENTIAL: REFERENTIAL_MUTATIONS,
+    ErrorLayer.SEMANTIC: SEMANTIC_MUTATIONS,
+}
 
 
 # ─── Fixture class ───────────────────────────────────────────────────────────
@@ -470,28 +610,71 @@ class SchemaFixture:
         if fixture_path is None:
             fixture_path = Path(__file__).parent / "schema_valid_minimal.xml"
         self.fixture_path = Path(fixture_path)
-        self._tree = ET.parse(str(self.fixture_path))
+        self._tree = _load_tree(str(self.fixture_path))
+        self._root = self._tree.getroot()
 
     def fresh_root(self) -> ET.Element:
-        """Return a deep copy of the fixture's root element."""
-        return copy.deepcopy(self._tree.getroot())
+        """Return a fresh copy of the fixture's root element.
+
+        copy.deepcopy is the fastest option here, measured against both a
+        hand-rolled recursive Element cloner and reparsing the serialized
+        buffer: the C-accelerated _elementtree Element implements __deepcopy__
+        natively, so the whole copy runs in C (~8x faster than fromstring on
+        this tree). A pure-Python cloner only wins where the accelerator is
+        unavailable.
+        """
+        return copy.deepcopy(self._root)
 
     def apply_mutation(self, mutation: SchemaMutation) -> ET.Element:
         """Apply a mutation to a fresh copy and return the mutated root."""
         root = self.fresh_root()
-        mutation.apply_fn(root)
+        mutation.apply(root)
+        return root
+
+    def apply_mutations(self, mutations: Iterable[SchemaMutation]) -> ET.Element:
+        """Apply several mutations to one shared fresh copy and return it.
+
+        Amortizes the fresh_root() copy across the whole group — O(1) copies
+        per group instead of O(K) — for combinatorial tests that stack
+        independent mutations onto the same schema. Mutations are applied in
+        iteration order; combining mutations that target the same element is
+        the caller's responsibility.
+        """
+        root = self.fresh_root()
+        for mutation in mutations:
+            mutation.apply(root)
         return root
 
+    def apply_many(
+        self, mutations: Iterable[SchemaMutation]
+    ) -> list[tuple[SchemaMutation, ET.Element]]:
+        """Apply each mutation to its own fresh copy in one amortized pass.
+
+        Batch counterpart of apply_mutation for loops like
+        ``for m in fixture.generate_all_mutations(): fixture.apply_mutation(m)``:
+        the copy entry point and baseline root are bound to locals once for
+        the whole batch instead of being re-resolved per call. Returns
+        (mutation, mutated_root) pairs in input order.
+        """
+        deepcopy = copy.deepcopy
+        baseline = self._root
+        results: list[tuple[SchemaMutation, ET.Element]] = []
+        for mutation in mutations:
+            root = deepcopy(baseline)
+            mutation.apply(root)
+            results.append((mutation, root))
+        return results
+
+    # The generate_* methods return iterators over the module-level mutation
+    # sequences directly — no generator frame per call, no per-item yield hop.
     def generate_structural_mutations(self) -> Iterator[SchemaMutation]:
-        yield from STRUCTURAL_MUTATIONS
+        return iter(STRUCTURAL_MUTATIONS)
 
     def generate_referential_mutations(self) -> Iterator[SchemaMutation]:
-        yield from REFERENTIAL_MUTATIONS
+        return iter(REFERENTIAL_MUTATIONS)
 
     def generate_semantic_mutations(self) -> Iterator[SchemaMutation]:
-        yield from SEMANTIC_MUTATIONS
+        return iter(SEMANTIC_MUTATIONS)
 
     def generate_all_mutations(self) -> Iterator[SchemaMutation]:
-        yield from self.generate_structural_mutations()
-        yield from self.generate_referential_mutations()
-        yield from self.generate_semantic_mutations()
+        return iter(ALL_MUTATIONS)
@@ -58,6 +58,8 @@ from aura_protocol.state_machine import EpochState, EpochStateMachine, Transitio
 from aura_protocol.types import (
     ReviewAxis,
     CONSTRAINT_SPECS,
+    ConstraintSpec,
+    HandoffSpec,
     PhaseId,
     RoleId,
     SeverityLevel,
@@ -70,6 +72,11 @@ from datetime import datetime, timezone
 # ─── Helpers ──────────────────────────────────────────────────────────────────
 
 
+# Fixed timestamp for TransitionRecord construction. No test inspects the
+# timestamp value, so a shared constant avoids a clock read per record.
+_FIXED_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
 def _make_state_at_p4_with_votes(**votes: VoteType) -> EpochState:
     """Return an EpochState at P4_REVIEW with the given axis->vote mapping."""
     state = _make_state(phase=PhaseId.P4_Review)
@@ -84,11 +91,6 @@ def _make_state_at_p10_with_votes(**votes: VoteType) -> EpochState:
     return state
 
 
-def _make_checker() -> RuntimeConstraintChecker:
-    """Return a RuntimeConstraintChecker with canonical specs."""
-    return RuntimeConstraintChecker()
-
-
 def _all_accept_state(phase: PhaseId) -> EpochState:
     """Return an EpochState at the given phase with all 3 axes ACCEPT."""
     state = _make_state(phase=phase)
@@ -136,9 +138,9 @@ class TestConstraintViolation:
 
     def test_constraint_id_field_name(self) -> None:
         """constraint_id must be the field name (not 'id') per spec."""
-        v = ConstraintViolation(constraint_id="C-audit-never-delete", message="m")
-        assert hasattr(v, "constraint_id")
-        assert not hasattr(v, "id")
+        fields = ConstraintViolation.__dataclass_fields__
+        assert "constraint_id" in fields
+        assert "id" not in fields
 
     def test_context_defaults_to_empty_dict(self) -> None:
         v = ConstraintViolation(constraint_id="C-x", message="m")
@@ -158,7 +160,6 @@ class TestRuntimeConstraintCheckerConstructor:
         assert checker is not None
 
     def test_custom_constraint_specs_accepted(self) -> None:
-        from aura_protocol.types import ConstraintSpec
         custom = {
             "C-test": ConstraintSpec(
                 id="C-test",
@@ -179,7 +180,6 @@ class TestRuntimeConstraintCheckerConstructor:
         assert isinstance(result, list)
 
     def test_custom_handoff_specs_accepted(self) -> None:
-        from aura_protocol.types import HandoffSpec, RoleId
         custom_handoffs = {
             "h-test": HandoffSpec(
                 id="h-test",
@@ -193,6 +193,24 @@ class TestRuntimeConstraintCheckerConstructor:
         checker = RuntimeConstraintChecker(handoff_specs=custom_handoffs)
         assert checker is not None
 
+    def test_known_ids_matches_canonical_specs(self) -> None:
+        checker = RuntimeConstraintChecker()
+        assert isinstance(checker.known_ids, frozenset)
+        assert checker.known_ids == frozenset(CONSTRAINT_SPECS)
+
+    def test_known_ids_reflects_custom_specs(self) -> None:
+        custom = {
+            "C-test": ConstraintSpec(
+                id="C-test",
+                given="test",
+                when="testing",
+                then="pass",
+                should_not="fail",
+            )
+        }
+        checker = RuntimeConstraintChecker(constraint_specs=custom)
+        assert checker.known_ids == frozenset({"C-test"})
+
 
 # ─── AC4: check_state (primary) — 7 constraint checks ─────────────────────────
 
@@ -203,41 +221,34 @@ class TestAC4CheckState:
     Asserts all 7 constraint_ids individually (not just count).
     """
 
-    def test_check_state_returns_list(self) -> None:
-        checker = _make_checker()
+    def test_check_state_returns_list(self, default_checker: RuntimeConstraintChecker) -> None:
         state = _make_state()
-        result = checker.check_state(state)
+        result = default_checker.check_state(state)
         assert isinstance(result, list)
 
-    def test_check_state_returns_violations_for_p4_without_consensus(self) -> None:
+    def test_check_state_returns_violations_for_p4_without_consensus(self, default_checker: RuntimeConstraintChecker) -> None:
         """At p4 with no votes, check_state should include C-review-consensus violation."""
-        checker = _make_checker()
         state = _make_state_at_p4_with_votes()  # no votes
-        violations = checker.check_state(state)
-        constraint_ids = {v.constraint_id for v in violations}
-        assert "C-review-consensus" in constraint_ids
+        violations = default_checker.check_state(state)
+        assert any(v.constraint_id == "C-review-consensus" for v in violations)
 
-    def test_check_state_returns_violations_for_p10_with_blockers(self) -> None:
+    def test_check_state_returns_violations_for_p10_with_blockers(self, default_checker: RuntimeConstraintChecker) -> None:
         """At p10 with blockers, check_state should include C-worker-gates violation."""
-        checker = _make_checker()
         state = _make_state(phase=PhaseId.P10_CodeReview, blocker_count=2)
-        violations = checker.check_state(state)
-        constraint_ids = {v.constraint_id for v in violations}
-        assert "C-worker-gates" in constraint_ids
+        violations = default_checker.check_state(state)
+        assert any(v.constraint_id == "C-worker-gates" for v in violations)
 
-    def test_check_state_returns_empty_for_clean_p1_state(self) -> None:
+    def test_check_state_returns_empty_for_clean_p1_state(self, default_checker: RuntimeConstraintChecker) -> None:
         """A fresh p1 state with no violations should return empty list."""
-        checker = _make_checker()
         state = _make_state(phase=PhaseId.P1_Request)
-        violations = checker.check_state(state)
+        violations = default_checker.check_state(state)
         assert violations == []
 
-    def test_check_state_does_not_short_circuit(self) -> None:
+    def test_check_state_does_not_short_circuit(self, default_checker: RuntimeConstraintChecker) -> None:
         """check_state must aggregate ALL violations — not stop at first."""
-        checker = _make_checker()
         # p10 with blockers AND no consensus AND no severity groups AND no audit trail
         state = _make_state(phase=PhaseId.P10_CodeReview, blocker_count=3)
-        violations = checker.check_state(state)
+        violations = default_checker.check_state(state)
         constraint_ids = {v.constraint_id for v in violations}
         # All 4 violations should appear:
         # 1. C-review-consensus: no votes in review phase
@@ -249,83 +260,73 @@ class TestAC4CheckState:
         assert "C-severity-eager" in constraint_ids
         assert "C-audit-never-delete" in constraint_ids
 
-    def test_check_state_violations_have_non_empty_messages(self) -> None:
-        checker = _make_checker()
+    def test_check_state_violations_have_non_empty_messages(self, default_checker: RuntimeConstraintChecker) -> None:
         state = _make_state(phase=PhaseId.P4_Review)
-        violations = checker.check_state(state)
+        violations = default_checker.check_state(state)
         for v in violations:
             assert v.message, f"Empty message in violation: {v.constraint_id}"
 
-    def test_check_state_violations_have_valid_constraint_ids(self) -> None:
+    def test_check_state_violations_have_valid_constraint_ids(self, default_checker: RuntimeConstraintChecker) -> None:
         """All violation constraint_ids must match a known C-* constraint."""
-        checker = _make_checker()
         state = _make_state(phase=PhaseId.P4_Review, blocker_count=1)
-        violations = checker.check_state(state)
+        violations = default_checker.check_state(state)
         for v in violations:
-            assert v.constraint_id in CONSTRAINT_SPECS, (
+            assert v.constraint_id in default_checker.known_ids, (
                 f"Unknown constraint_id: {v.constraint_id!r}"
             )
 
-    def test_check_state_p4_constraint_id_c_review_consensus(self) -> None:
+    def test_check_state_p4_constraint_id_c_review_consensus(self, default_checker: RuntimeConstraintChecker) -> None:
         """AC4: check_state asserts C-review-consensus constraint_id individually."""
-        checker = _make_checker()
         state = _make_state(phase=PhaseId.P4_Review)
-        constraint_ids = {v.constraint_id for v in checker.check_state(state)}
+        constraint_ids = {v.constraint_id for v in default_checker.check_state(state)}
         assert "C-review-consensus" in constraint_ids
 
-    def test_check_state_p4_constraint_id_c_severity_not_plan(self) -> None:
+    def test_check_state_p4_constraint_id_c_severity_not_plan(self, default_checker: RuntimeConstraintChecker) -> None:
         """AC4: check_state asserts C-severity-not-plan constraint_id individually (via check_severity_tree)."""
-        checker = _make_checker()
         state = _make_state(phase=PhaseId.P4_Review)
-        constraint_ids = {v.constraint_id for v in checker.check_state(state)}
+        constraint_ids = {v.constraint_id for v in default_checker.check_state(state)}
         assert "C-severity-not-plan" in constraint_ids
 
-    def test_check_state_p10_constraint_id_c_severity_eager(self) -> None:
+    def test_check_state_p10_constraint_id_c_severity_eager(self, default_checker: RuntimeConstraintChecker) -> None:
         """AC4: check_state asserts C-severity-eager constraint_id individually (p10, no severity groups)."""
-        checker = _make_checker()
         state = _make_state(phase=PhaseId.P10_CodeReview)
-        constraint_ids = {v.constraint_id for v in checker.check_state(state)}
+        constraint_ids = {v.constraint_id for v in default_checker.check_state(state)}
         assert "C-severity-eager" in constraint_ids
 
-    def test_check_state_p10_constraint_id_c_worker_gates(self) -> None:
+    def test_check_state_p10_constraint_id_c_worker_gates(self, default_checker: RuntimeConstraintChecker) -> None:
         """AC4: check_state asserts C-worker-gates constraint_id individually (p10 with blockers)."""
-        checker = _make_checker()
         state = _make_state(phase=PhaseId.P10_CodeReview, blocker_count=1)
-        constraint_ids = {v.constraint_id for v in checker.check_state(state)}
+        constraint_ids = {v.constraint_id for v in default_checker.check_state(state)}
         assert "C-worker-gates" in constraint_ids
 
-    def test_check_state_p2_constraint_id_c_audit_never_delete(self) -> None:
+    def test_check_state_p2_constraint_id_c_audit_never_delete(self, default_checker: RuntimeConstraintChecker) -> None:
         """AC4: check_state asserts C-audit-never-delete constraint_id individually (p2 empty history)."""
-        checker = _make_checker()
         state = _make_state(phase=PhaseId.P2_Elicit)
-        constraint_ids = {v.constraint_id for v in checker.check_state(state)}
+        constraint_ids = {v.constraint_id for v in default_checker.check_state(state)}
         assert "C-audit-never-delete" in constraint_ids
 
-    def test_check_state_constraint_id_c_audit_dep_chain(self) -> None:
+    def test_check_state_constraint_id_c_audit_dep_chain(self, default_checker: RuntimeConstraintChecker) -> None:
         """AC4: check_state asserts C-audit-dep-chain constraint_id individually (missing triggered_by)."""
-        checker = _make_checker()
         state = _make_state(phase=PhaseId.P2_Elicit)
         record = TransitionRecord(
             from_phase=PhaseId.P1_Request,
             to_phase=PhaseId.P2_Elicit,
-            timestamp=datetime.now(tz=timezone.utc),
+            timestamp=_FIXED_NOW,
             triggered_by="",  # missing
             condition_met="test condition",
         )
         state.transition_history.append(record)
-        constraint_ids = {v.constraint_id for v in checker.check_state(state)}
+        constraint_ids = {v.constraint_id for v in default_checker.check_state(state)}
         assert "C-audit-dep-chain" in constraint_ids
 
-    def test_check_state_constraint_id_c_vertical_slices(self) -> None:
+    def test_check_state_constraint_id_c_vertical_slices(self, default_checker: RuntimeConstraintChecker) -> None:
         """AC4: check_state asserts C-vertical-slices constraint_id individually (unknown role)."""
-        checker = _make_checker()
         state = _make_state(phase=PhaseId.P9_Slice, current_role="unknown-role")
-        constraint_ids = {v.constraint_id for v in checker.check_state(state)}
+        constraint_ids = {v.constraint_id for v in default_checker.check_state(state)}
         assert "C-vertical-slices" in constraint_ids
 
-    def test_check_state_p10_with_all_groups_and_no_blockers_returns_empty(self) -> None:
+    def test_check_state_p10_with_all_groups_and_no_blockers_returns_empty(self, default_checker: RuntimeConstraintChecker) -> None:
         """check_state returns empty for valid p10 state (all groups present, no blockers)."""
-        checker = _make_checker()
         state = _make_state(
             phase=PhaseId.P10_CodeReview,
             severity_groups={
@@ -344,240 +345,306 @@ class TestAC4CheckState:
             TransitionRecord(
                 from_phase=PhaseId.P9_Slice,
                 to_phase=PhaseId.P10_CodeReview,
-                timestamp=datetime.now(tz=timezone.utc),
+                timestamp=_FIXED_NOW,
                 triggered_by="worker",
                 condition_met="slice complete",
             )
         )
-        violations = checker.check_state(state)
+        violations = default_checker.check_state(state)
         assert violations == [], f"Unexpected violations: {violations}"
 
 
+# ─── check_state Phase Dispatch ───────────────────────────────────────────────
+
+
+class TestCheckStatePhaseDispatch:
+    """check_state dispatches only the checks that can fire at each phase."""
+
+    def test_every_phase_has_a_dispatch_entry(self, default_checker: RuntimeConstraintChecker) -> None:
+        assert set(default_checker._state_checks_by_phase) == set(PhaseId)
+
+    def test_non_review_phases_skip_review_only_checks(self, default_checker: RuntimeConstraintChecker) -> None:
+        checks = default_checker._state_checks_by_phase[PhaseId.P1_Request]
+        names = {c.__name__ for c in checks}
+        assert names == {"check_audit_trail", "check_role_ownership"}
+
+    def test_p10_dispatches_all_five_checks(self, default_checker: RuntimeConstraintChecker) -> None:
+        checks = default_checker._state_checks_by_phase[PhaseId.P10_CodeReview]
+        names = [c.__name__ for c in checks]
+        assert names == [
+            "check_review_consensus",
+            "check_severity_tree",
+            "check_blocker_gate",
+            "check_audit_trail",
+            "check_role_ownership",
+        ]
+
+    def test_p4_skips_blocker_gate(self, default_checker: RuntimeConstraintChecker) -> None:
+        checks = default_checker._state_checks_by_phase[PhaseId.P4_Review]
+        names = {c.__name__ for c in checks}
+        assert "check_blocker_gate" not in names
+        assert "check_review_consensus" in names
+
+
+# ─── check_transition Edge Dispatch ───────────────────────────────────────────
+
+
+class TestCheckTransitionEdgeDispatch:
+    """check_transition dispatches through an edge-indexed check table."""
+
+    def test_unconstrained_edge_has_no_table_entry(self, default_checker: RuntimeConstraintChecker) -> None:
+        assert (PhaseId.P1_Request, PhaseId.P2_Elicit) not in default_checker._transition_checks
+
+    def test_p4_to_p5_edge_runs_consensus_only(self, default_checker: RuntimeConstraintChecker) -> None:
+        checks = default_checker._transition_checks[(PhaseId.P4_Review, PhaseId.P5_Uat)]
+        assert [c.__name__ for c in checks] == ["check_review_consensus"]
+
+    def test_p10_to_p11_edge_runs_consensus_then_blocker_gate(self, default_checker: RuntimeConstraintChecker) -> None:
+        checks = default_checker._transition_checks[
+            (PhaseId.P10_CodeReview, PhaseId.P11_ImplUat)
+        ]
+        names = [c.__name__ for c in checks]
+        assert names[0] == "check_review_consensus"
+        assert names[-1] == "check_blocker_gate"
+
+    def test_handoff_edges_are_in_the_table(self, default_checker: RuntimeConstraintChecker) -> None:
+        assert (PhaseId.P7_Handoff, PhaseId.P8_ImplPlan) in default_checker._transition_checks
+        assert (PhaseId.P9_Slice, PhaseId.P10_CodeReview) in default_checker._transition_checks
+
+
+# ─── check_state Memoization ──────────────────────────────────────────────────
+
+
+class TestCheckStateMemoization:
+    """check_state memoizes results on the state fields the checks read."""
+
+    def test_repeated_calls_return_equal_violations(self) -> None:
+        checker = RuntimeConstraintChecker()
+        state = _make_state(phase=PhaseId.P4_Review)
+        first = checker.check_state(state)
+        second = checker.check_state(state)
+        assert first == second
+
+    def test_cached_result_is_a_fresh_list(self) -> None:
+        """Mutating a returned list must not corrupt the cache."""
+        checker = RuntimeConstraintChecker()
+        state = _make_state(phase=PhaseId.P4_Review)
+        first = checker.check_state(state)
+        first.clear()
+        second = checker.check_state(state)
+        assert second, "Cache returned the caller-mutated list"
+
+    def test_severity_groups_participate_in_cache_key(self) -> None:
+        """Two p10 states differing only in severity_groups must not share a cache entry."""
+        checker = RuntimeConstraintChecker()
+        without_groups = _make_state(phase=PhaseId.P10_CodeReview)
+        with_groups = _make_state(
+            phase=PhaseId.P10_CodeReview,
+            severity_groups={
+                SeverityLevel.Blocker: set(),
+                SeverityLevel.Important: set(),
+                SeverityLevel.Minor: set(),
+            },
+        )
+        ids_without = {v.constraint_id for v in checker.check_state(without_groups)}
+        ids_with = {v.constraint_id for v in checker.check_state(with_groups)}
+        assert "C-severity-eager" in ids_without
+        assert "C-severity-eager" not in ids_with
+
+    def test_mutated_state_is_not_served_from_cache(self) -> None:
+        """Changing a keyed field after a call yields freshly computed violations."""
+        checker = RuntimeConstraintChecker()
+        state = _make_state(phase=PhaseId.P10_CodeReview)
+        assert not any(
+            v.constraint_id == "C-worker-gates" for v in checker.check_state(state)
+        )
+        state.blocker_count = 2
+        assert any(
+            v.constraint_id == "C-worker-gates" for v in checker.check_state(state)
+        )
+
+    def test_invalidate_clears_the_cache(self) -> None:
+        checker = RuntimeConstraintChecker()
+        state = _make_state(phase=PhaseId.P4_Review)
+        checker.check_state(state)
+        assert checker._state_cache
+        checker.invalidate()
+        assert checker._state_cache == {}
+
+
 # ─── AC5: check_state_constraints Aggregation (deprecated alias) ───────────────
 
 
 class TestAC5CheckStateConstraints:
     """AC5: check_state_constraints is a deprecated alias that delegates to check_state."""
 
-    def test_check_state_constraints_returns_list(self) -> None:
-        checker = _make_checker()
+    def test_check_state_constraints_returns_list(self, default_checker: RuntimeConstraintChecker) -> None:
         state = _make_state()
-        result = checker.check_state_constraints(state)
+        result = default_checker.check_state_constraints(state)
         assert isinstance(result, list)
 
-    def test_check_state_constraints_returns_violations_for_p4_without_consensus(self) -> None:
+    def test_check_state_constraints_returns_violations_for_p4_without_consensus(self, default_checker: RuntimeConstraintChecker) -> None:
         """At p4 with no votes, check_state_constraints should include C-review-consensus violation."""
-        checker = _make_checker()
         state = _make_state_at_p4_with_votes()  # no votes
-        violations = checker.check_state_constraints(state)
-        constraint_ids = {v.constraint_id for v in violations}
-        assert "C-review-consensus" in constraint_ids
+        violations = default_checker.check_state_constraints(state)
+        assert any(v.constraint_id == "C-review-consensus" for v in violations)
 
-    def test_check_state_constraints_returns_violations_for_p10_with_blockers(self) -> None:
+    def test_check_state_constraints_returns_violations_for_p10_with_blockers(self, default_checker: RuntimeConstraintChecker) -> None:
         """At p10 with blockers, check_state_constraints should include C-worker-gates violation."""
-        checker = _make_checker()
         state = _make_state(phase=PhaseId.P10_CodeReview, blocker_count=2)
-        violations = checker.check_state_constraints(state)
-        constraint_ids = {v.constraint_id for v in violations}
-        assert "C-worker-gates" in constraint_ids
+        violations = default_checker.check_state_constraints(state)
+        assert any(v.constraint_id == "C-worker-gates" for v in violations)
 
-    def test_check_state_constraints_returns_empty_for_clean_p1_state(self) -> None:
+    def test_check_state_constraints_returns_empty_for_clean_p1_state(self, default_checker: RuntimeConstraintChecker) -> None:
         """A fresh p1 state with no violations should return empty list."""
-        checker = _make_checker()
         state = _make_state(phase=PhaseId.P1_Request)
-        violations = checker.check_state_constraints(state)
+        violations = default_checker.check_state_constraints(state)
         assert violations == []
 
-    def test_check_state_constraints_does_not_short_circuit(self) -> None:
+    def test_check_state_constraints_does_not_short_circuit(self, default_checker: RuntimeConstraintChecker) -> None:
         """check_state_constraints must aggregate ALL violations — not stop at first."""
-        checker = _make_checker()
         # p10 with blockers AND no consensus — should get both violations
         state = _make_state(phase=PhaseId.P10_CodeReview, blocker_count=3)
         # no votes recorded
-        violations = checker.check_state_constraints(state)
+        violations = default_checker.check_state_constraints(state)
         constraint_ids = {v.constraint_id for v in violations}
         # Both C-review-consensus and C-worker-gates should appear
         assert "C-review-consensus" in constraint_ids
         assert "C-worker-gates" in constraint_ids
 
-    def test_check_state_constraints_violations_have_non_empty_messages(self) -> None:
-        checker = _make_checker()
+    def test_check_state_constraints_violations_have_non_empty_messages(self, default_checker: RuntimeConstraintChecker) -> None:
         state = _make_state(phase=PhaseId.P4_Review)
-        violations = checker.check_state_constraints(state)
+        violations = default_checker.check_state_constraints(state)
         for v in violations:
             assert v.message, f"Empty message in violation: {v.constraint_id}"
 
-    def test_check_state_constraints_violations_have_valid_constraint_ids(self) -> None:
+    def test_check_state_constraints_violations_have_valid_constraint_ids(self, default_checker: RuntimeConstraintChecker) -> None:
         """All violation constraint_ids must match a known C-* constraint."""
-        checker = _make_checker()
         state = _make_state(phase=PhaseId.P4_Review, blocker_count=1)
-        violations = checker.check_state_constraints(state)
+        violations = default_checker.check_state_constraints(state)
         for v in violations:
-            assert v.constraint_id in CONSTRAINT_SPECS, (
+            assert v.constraint_id in default_checker.known_ids, (
                 f"Unknown constraint_id: {v.constraint_id!r}"
             )
 
-    def test_check_state_constraints_delegates_to_check_state(self) -> None:
+    def test_check_state_constraints_delegates_to_check_state(self, default_checker: RuntimeConstraintChecker) -> None:
         """check_state_constraints must produce the same result as check_state."""
-        checker = _make_checker()
         state = _make_state(phase=PhaseId.P4_Review, blocker_count=1)
-        assert checker.check_state_constraints(state) == checker.check_state(state)
-
-
-# ─── check_transition (primary) ──────────────────────────────────────────────
-
-
+        assert default_checker.check_state_constraints(state) == default_checker.check_state(state)
+
+
+# ─── check_transition (primary + deprecated alias) ───────────────────────────
+# check_transition is the primary method; check_transition_constraints is its
+# deprecated alias. Scenarios are declared once in TRANSITION_SCENARIOS and a
+# class-level parametrize fans each row out over both method names, so adding
+# a transition constraint case is a one-line table entry.
+
+_ALL_ACCEPT_VOTES: dict[ReviewAxis, VoteType] = {
+    ReviewAxis.Correctness: VoteType.Accept,
+    ReviewAxis.TestQuality: VoteType.Accept,
+    ReviewAxis.Elegance: VoteType.Accept,
+}
+
+# (from_phase, to_phase, votes, blocker_count, must_include, must_exclude)
+TRANSITION_SCENARIOS = [
+    pytest.param(
+        PhaseId.P4_Review, PhaseId.P5_Uat, {"A": VoteType.Accept}, 0,
+        {"C-review-consensus"}, set(),
+        id="p4-to-p5-partial-votes-violates-consensus",
+    ),
+    pytest.param(
+        PhaseId.P4_Review, PhaseId.P5_Uat, _ALL_ACCEPT_VOTES, 0,
+        set(), {"C-review-consensus"},
+        id="p4-to-p5-with-consensus-passes",
+    ),
+    pytest.param(
+        PhaseId.P10_CodeReview, PhaseId.P11_ImplUat,
+        {"A": VoteType.Accept, "B": VoteType.Accept}, 0,
+        {"C-review-consensus"}, set(),
+        id="p10-to-p11-partial-votes-violates-consensus",
+    ),
+    pytest.param(
+        PhaseId.P10_CodeReview, PhaseId.P11_ImplUat, _ALL_ACCEPT_VOTES, 0,
+        set(), {"C-review-consensus"},
+        id="p10-to-p11-with-consensus-passes",
+    ),
+    pytest.param(
+        PhaseId.P7_Handoff, PhaseId.P8_ImplPlan, {}, 0,
+        {"C-handoff-skill-invocation"}, set(),
+        id="p7-to-p8-actor-change-requires-handoff",
+    ),
+    pytest.param(
+        PhaseId.P5_Uat, PhaseId.P6_Ratify, {}, 0,
+        set(), {"C-handoff-skill-invocation"},
+        id="p5-to-p6-same-actor-no-handoff",
+    ),
+    pytest.param(
+        PhaseId.P10_CodeReview, PhaseId.P11_ImplUat, _ALL_ACCEPT_VOTES, 2,
+        {"C-worker-gates"}, set(),
+        id="p10-to-p11-with-blockers-hits-blocker-gate",
+    ),
+    pytest.param(
+        PhaseId.P10_CodeReview, PhaseId.P11_ImplUat, _ALL_ACCEPT_VOTES, 0,
+        set(), {"C-worker-gates"},
+        id="p10-to-p11-zero-blockers-passes-blocker-gate",
+    ),
+    pytest.param(
+        PhaseId.P10_CodeReview, PhaseId.P11_ImplUat, {}, 3,
+        {"C-review-consensus", "C-worker-gates"}, set(),
+        id="p10-to-p11-aggregates-consensus-and-blocker-gate",
+    ),
+]
+
+
+@pytest.mark.parametrize("method_name", ["check_transition", "check_transition_constraints"])
 class TestCheckTransitionConstraints:
     """check_transition validates constraints for proposed phase transitions (primary method).
-    check_transition_constraints is the deprecated alias.
+    check_transition_constraints is the deprecated alias; both are exercised
+    via the class-level method_name parametrization, against the declarative
+    TRANSITION_SCENARIOS table.
     """
 
-    def test_p4_to_p5_without_consensus_returns_violation(self) -> None:
-        checker = _make_checker()
-        state = _make_state_at_p4_with_votes(A=VoteType.Accept)  # only 1 axis
-        violations = checker.check_transition_constraints(state, PhaseId.P5_Uat)
+    @pytest.mark.parametrize(
+        "from_phase, to_phase, votes, blocker_count, must_include, must_exclude",
+        TRANSITION_SCENARIOS,
+    )
+    def test_transition_scenario(
+        self,
+        default_checker: RuntimeConstraintChecker,
+        method_name: str,
+        from_phase: PhaseId,
+        to_phase: PhaseId,
+        votes: dict,
+        blocker_count: int,
+        must_include: set[str],
+        must_exclude: set[str],
+    ) -> None:
+        state = _make_state(phase=from_phase, blocker_count=blocker_count)
+        state.review_votes.update(votes)
+        violations = getattr(default_checker, method_name)(state, to_phase)
         ids = {v.constraint_id for v in violations}
-        assert "C-review-consensus" in ids
+        assert must_include <= ids, f"Missing expected violations: {must_include - ids}"
+        assert must_exclude.isdisjoint(ids), f"Unexpected violations: {must_exclude & ids}"
 
-    def test_p4_to_p5_with_consensus_returns_no_consensus_violation(self) -> None:
-        checker = _make_checker()
-        state = _all_accept_state(PhaseId.P4_Review)
-        violations = checker.check_transition_constraints(state, PhaseId.P5_Uat)
-        ids = {v.constraint_id for v in violations}
-        assert "C-review-consensus" not in ids
-
-    def test_p10_to_p11_without_consensus_returns_violation(self) -> None:
-        checker = _make_checker()
-        state = _make_state_at_p10_with_votes(A=VoteType.Accept, B=VoteType.Accept)
-        violations = checker.check_transition_constraints(state, PhaseId.P11_ImplUat)
-        ids = {v.constraint_id for v in violations}
-        assert "C-review-consensus" in ids
-
-    def test_p10_to_p11_with_consensus_returns_no_consensus_violation(self) -> None:
-        checker = _make_checker()
-        state = _all_accept_state(PhaseId.P10_CodeReview)
-        violations = checker.check_transition_constraints(state, PhaseId.P11_ImplUat)
-        ids = {v.constraint_id for v in violations}
-        assert "C-review-consensus" not in ids
-
-    def test_p1_to_p2_returns_no_violations(self) -> None:
-        checker = _make_checker()
+    def test_p1_to_p2_returns_no_violations(self, default_checker: RuntimeConstraintChecker, method_name: str) -> None:
         state = _make_state(phase=PhaseId.P1_Request)
-        violations = checker.check_transition_constraints(state, PhaseId.P2_Elicit)
+        violations = getattr(default_checker, method_name)(state, PhaseId.P2_Elicit)
         assert violations == []
 
-    def test_handoff_required_transition_returns_violation(self) -> None:
-        checker = _make_checker()
-        state = _make_state(phase=PhaseId.P7_Handoff)
-        violations = checker.check_transition_constraints(state, PhaseId.P8_ImplPlan)
-        ids = {v.constraint_id for v in violations}
-        assert "C-handoff-skill-invocation" in ids
-
-    def test_same_actor_transition_returns_no_handoff_violation(self) -> None:
-        checker = _make_checker()
-        # p5→p6 and p6→p7 are same-actor (no handoff needed)
-        state = _make_state(phase=PhaseId.P5_Uat)
-        violations = checker.check_transition_constraints(state, PhaseId.P6_Ratify)
-        ids = {v.constraint_id for v in violations}
-        assert "C-handoff-skill-invocation" not in ids
-
-    def test_p10_to_p11_with_blockers_returns_blocker_gate_violation(self) -> None:
-        """p10→p11 transition is blocked while blocker_count > 0."""
-        checker = _make_checker()
-        state = _all_accept_state(PhaseId.P10_CodeReview)
-        state.blocker_count = 2
-        violations = checker.check_transition_constraints(state, PhaseId.P11_ImplUat)
-        ids = {v.constraint_id for v in violations}
-        assert "C-worker-gates" in ids
-
-    def test_p10_to_p11_with_zero_blockers_no_blocker_gate_violation(self) -> None:
-        """p10→p11 is not blocked when blocker_count is 0."""
-        checker = _make_checker()
-        state = _all_accept_state(PhaseId.P10_CodeReview)
-        state.blocker_count = 0
-        violations = checker.check_transition_constraints(state, PhaseId.P11_ImplUat)
-        ids = {v.constraint_id for v in violations}
-        assert "C-worker-gates" not in ids
-
-    def test_does_not_short_circuit(self) -> None:
-        """check_transition_constraints must aggregate all transition violations."""
-        checker = _make_checker()
-        # p10→p11 with no consensus AND blockers: both violations should appear
-        state = _make_state(phase=PhaseId.P10_CodeReview, blocker_count=3)
-        # no votes recorded
-        violations = checker.check_transition_constraints(state, PhaseId.P11_ImplUat)
-        ids = {v.constraint_id for v in violations}
-        assert "C-review-consensus" in ids
-        assert "C-worker-gates" in ids
-
-    def test_returns_list(self) -> None:
-        checker = _make_checker()
+    def test_returns_list(self, default_checker: RuntimeConstraintChecker, method_name: str) -> None:
         state = _make_state(phase=PhaseId.P1_Request)
-        result = checker.check_transition_constraints(state, PhaseId.P2_Elicit)
+        result = getattr(default_checker, method_name)(state, PhaseId.P2_Elicit)
         assert isinstance(result, list)
 
 
-# ─── check_transition_constraints (deprecated alias) ──────────────────────────
-
-
 class TestCheckTransition:
     """check_transition_constraints is a deprecated alias for check_transition (primary)."""
 
-    def test_p4_to_p5_without_consensus_returns_violation(self) -> None:
-        checker = _make_checker()
-        state = _make_state_at_p4_with_votes(A=VoteType.Accept)  # only 1 axis
-        violations = checker.check_transition(state, PhaseId.P5_Uat)
-        ids = {v.constraint_id for v in violations}
-        assert "C-review-consensus" in ids
-
-    def test_p4_to_p5_with_consensus_returns_no_consensus_violation(self) -> None:
-        checker = _make_checker()
-        state = _all_accept_state(PhaseId.P4_Review)
-        violations = checker.check_transition(state, PhaseId.P5_Uat)
-        ids = {v.constraint_id for v in violations}
-        assert "C-review-consensus" not in ids
-
-    def test_p10_to_p11_without_consensus_returns_violation(self) -> None:
-        checker = _make_checker()
-        state = _make_state_at_p10_with_votes(A=VoteType.Accept, B=VoteType.Accept)
-        violations = checker.check_transition(state, PhaseId.P11_ImplUat)
-        ids = {v.constraint_id for v in violations}
-        assert "C-review-consensus" in ids
-
-    def test_p10_to_p11_with_consensus_returns_no_consensus_violation(self) -> None:
-        checker = _make_checker()
-        state = _all_accept_state(PhaseId.P10_CodeReview)
-        violations = checker.check_transition(state, PhaseId.P11_ImplUat)
-        ids = {v.constraint_id for v in violations}
-        assert "C-review-consensus" not in ids
-
-    def test_p1_to_p2_returns_no_violations(self) -> None:
-        checker = _make_checker()
-        state = _make_state(phase=PhaseId.P1_Request)
-        violations = checker.check_transition(state, PhaseId.P2_Elicit)
-        assert violations == []
-
-    def test_handoff_required_transition_returns_violation(self) -> None:
-        checker = _make_checker()
-        state = _make_state(phase=PhaseId.P7_Handoff)
-        violations = checker.check_transition(state, PhaseId.P8_ImplPlan)
-        ids = {v.constraint_id for v in violations}
-        assert "C-handoff-skill-invocation" in ids
-
-    def test_same_actor_transition_returns_no_handoff_violation(self) -> None:
-        checker = _make_checker()
-        # p5→p6 and p6→p7 are same-actor (no handoff needed)
-        state = _make_state(phase=PhaseId.P5_Uat)
-        violations = checker.check_transition(state, PhaseId.P6_Ratify)
-        ids = {v.constraint_id for v in violations}
-        assert "C-handoff-skill-invocation" not in ids
-
-    def test_check_transition_constraints_delegates_to_check_transition(self) -> None:
+    def test_check_transition_constraints_delegates_to_check_transition(self, default_checker: RuntimeConstraintChecker) -> None:
         """check_transition_constraints (alias) must produce same result as check_transition (primary)."""
-        checker = _make_checker()
         state = _make_state_at_p4_with_votes(A=VoteType.Accept)
-        assert checker.check_transition_constraints(state, PhaseId.P5_Uat) == \
-            checker.check_transition(state, PhaseId.P5_Uat)
+        assert default_checker.check_transition_constraints(state, PhaseId.P5_Uat) == \
+            default_checker.check_transition(state, PhaseId.P5_Uat)
 
 
 # ─── C-review-consensus ───────────────────────────────────────────────────────
@@ -586,68 +653,59 @@ class TestCheckTransition:
 class TestCheckReviewConsensus:
     """C-review-consensus: all 3 axes must ACCEPT in review phases."""
 
-    def test_p4_no_votes_returns_violation(self) -> None:
-        checker = _make_checker()
+    def test_p4_no_votes_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
         state = _make_state(phase=PhaseId.P4_Review)
-        violations = checker.check_review_consensus(state)
+        violations = default_checker.check_review_consensus(state)
         assert len(violations) == 1
         assert violations[0].constraint_id == "C-review-consensus"
 
-    def test_p4_partial_votes_returns_violation(self) -> None:
-        checker = _make_checker()
+    def test_p4_partial_votes_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
         state = _make_state_at_p4_with_votes(A=VoteType.Accept, B=VoteType.Accept)
-        violations = checker.check_review_consensus(state)
+        violations = default_checker.check_review_consensus(state)
         assert len(violations) == 1
         assert violations[0].constraint_id == "C-review-consensus"
 
-    def test_p4_with_revise_vote_returns_violation(self) -> None:
-        checker = _make_checker()
+    def test_p4_with_revise_vote_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
         state = _make_state_at_p4_with_votes(
             A=VoteType.Accept, B=VoteType.Accept, C=VoteType.Revise
         )
-        violations = checker.check_review_consensus(state)
+        violations = default_checker.check_review_consensus(state)
         assert len(violations) == 1
         assert violations[0].constraint_id == "C-review-consensus"
 
-    def test_p4_all_accept_returns_empty(self) -> None:
-        checker = _make_checker()
+    def test_p4_all_accept_returns_empty(self, default_checker: RuntimeConstraintChecker) -> None:
         state = _all_accept_state(PhaseId.P4_Review)
-        violations = checker.check_review_consensus(state)
+        violations = default_checker.check_review_consensus(state)
         assert violations == []
 
-    def test_p10_no_votes_returns_violation(self) -> None:
-        checker = _make_checker()
+    def test_p10_no_votes_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
         state = _make_state(phase=PhaseId.P10_CodeReview)
-        violations = checker.check_review_consensus(state)
+        violations = default_checker.check_review_consensus(state)
         assert len(violations) == 1
         assert violations[0].constraint_id == "C-review-consensus"
 
-    def test_p10_all_accept_returns_empty(self) -> None:
-        checker = _make_checker()
+    def test_p10_all_accept_returns_empty(self, default_checker: RuntimeConstraintChecker) -> None:
         state = _all_accept_state(PhaseId.P10_CodeReview)
-        violations = checker.check_review_consensus(state)
+        violations = default_checker.check_review_consensus(state)
         assert violations == []
 
-    def test_non_review_phase_returns_empty(self) -> None:
-        checker = _make_checker()
-        for phase in (
-            PhaseId.P1_Request, PhaseId.P2_Elicit, PhaseId.P3_Propose,
-            PhaseId.P5_Uat, PhaseId.P9_Slice, PhaseId.P12_Landing,
-        ):
-            state = _make_state(phase=phase)
-            violations = checker.check_review_consensus(state)
-            assert violations == [], f"Unexpected violation at {phase}"
-
-    def test_violation_message_mentions_consensus(self) -> None:
-        checker = _make_checker()
+    @pytest.mark.parametrize("phase", [
+        PhaseId.P1_Request, PhaseId.P2_Elicit, PhaseId.P3_Propose,
+        PhaseId.P5_Uat, PhaseId.P9_Slice, PhaseId.P12_Landing,
+    ])
+    def test_non_review_phase_returns_empty(self, default_checker: RuntimeConstraintChecker, phase: PhaseId) -> None:
+        state = _make_state(phase=phase)
+        violations = default_checker.check_review_consensus(state)
+        assert violations == [], f"Unexpected violation at {phase}"
+
+    def test_violation_message_mentions_consensus(self, default_checker: RuntimeConstraintChecker) -> None:
         state = _make_state(phase=PhaseId.P4_Review)
-        violations = checker.check_review_consensus(state)
+        violations = default_checker.check_review_consensus(state)
         assert "consensus" in violations[0].message.lower() or "accept" in violations[0].message.lower()
 
-    def test_violation_context_contains_phase(self) -> None:
-        checker = _make_checker()
+    def test_violation_context_contains_phase(self, default_checker: RuntimeConstraintChecker) -> None:
         state = _make_state(phase=PhaseId.P4_Review)
-        violations = checker.check_review_consensus(state)
+        violations = default_checker.check_review_consensus(state)
         assert "phase" in violations[0].context
         assert violations[0].context["phase"] == "p4"
 
@@ -658,40 +716,31 @@ class TestCheckReviewConsensus:
 class TestCheckDepDirection:
     """C-dep-direction: validate dependency direction inputs."""
 
-    def test_valid_different_ids_returns_empty(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_dep_direction("parent-123", "child-456")
+    def test_valid_different_ids_returns_empty(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_dep_direction("parent-123", "child-456")
         assert violations == []
 
-    def test_same_ids_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_dep_direction("task-abc", "task-abc")
+    def test_same_ids_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_dep_direction("task-abc", "task-abc")
         assert len(violations) == 1
         assert violations[0].constraint_id == "C-dep-direction"
 
-    def test_empty_parent_id_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_dep_direction("", "child-456")
+    def test_empty_parent_id_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_dep_direction("", "child-456")
         assert len(violations) >= 1
-        ids = {v.constraint_id for v in violations}
-        assert "C-dep-direction" in ids
+        assert any(v.constraint_id == "C-dep-direction" for v in violations)
 
-    def test_empty_child_id_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_dep_direction("parent-123", "")
+    def test_empty_child_id_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_dep_direction("parent-123", "")
         assert len(violations) >= 1
-        ids = {v.constraint_id for v in violations}
-        assert "C-dep-direction" in ids
+        assert any(v.constraint_id == "C-dep-direction" for v in violations)
 
-    def test_whitespace_only_parent_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_dep_direction("   ", "child-456")
-        ids = {v.constraint_id for v in violations}
-        assert "C-dep-direction" in ids
+    def test_whitespace_only_parent_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_dep_direction("   ", "child-456")
+        assert any(v.constraint_id == "C-dep-direction" for v in violations)
 
-    def test_violation_context_contains_both_ids(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_dep_direction("same", "same")
+    def test_violation_context_contains_both_ids(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_dep_direction("same", "same")
         ctx = violations[0].context
         assert "parent_id" in ctx
         assert "child_id" in ctx
@@ -703,36 +752,32 @@ class TestCheckDepDirection:
 class TestCheckSeverityTree:
     """C-severity-eager / C-severity-not-plan: severity tree rules."""
 
-    def test_p4_returns_violation_for_severity_not_plan(self) -> None:
+    def test_p4_returns_violation_for_severity_not_plan(self, default_checker: RuntimeConstraintChecker) -> None:
         """Plan review (p4) must NOT have severity trees."""
-        checker = _make_checker()
         state = _make_state(phase=PhaseId.P4_Review)
-        violations = checker.check_severity_tree(state)
+        violations = default_checker.check_severity_tree(state)
         assert len(violations) == 1
         assert violations[0].constraint_id == "C-severity-not-plan"
 
-    def test_non_review_phase_returns_empty(self) -> None:
-        checker = _make_checker()
-        for phase in (
-            PhaseId.P1_Request, PhaseId.P2_Elicit, PhaseId.P3_Propose,
-            PhaseId.P5_Uat, PhaseId.P8_ImplPlan, PhaseId.P9_Slice,
-        ):
-            state = _make_state(phase=phase)
-            violations = checker.check_severity_tree(state)
-            assert violations == [], f"Unexpected violation at {phase}"
-
-    def test_p10_without_severity_groups_returns_violation(self) -> None:
+    @pytest.mark.parametrize("phase", [
+        PhaseId.P1_Request, PhaseId.P2_Elicit, PhaseId.P3_Propose,
+        PhaseId.P5_Uat, PhaseId.P8_ImplPlan, PhaseId.P9_Slice,
+    ])
+    def test_non_review_phase_returns_empty(self, default_checker: RuntimeConstraintChecker, phase: PhaseId) -> None:
+        state = _make_state(phase=phase)
+        violations = default_checker.check_severity_tree(state)
+        assert violations == [], f"Unexpected violation at {phase}"
+
+    def test_p10_without_severity_groups_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
         """AC5: p10 without severity_groups → C-severity-eager violation."""
-        checker = _make_checker()
         state = _make_state(phase=PhaseId.P10_CodeReview)
         # severity_groups defaults to empty dict — no groups present
-        violations = checker.check_severity_tree(state)
+        violations = default_checker.check_severity_tree(state)
         assert len(violations) == 1
         assert violations[0].constraint_id == "C-severity-eager"
 
-    def test_p10_with_all_3_severity_groups_returns_empty(self) -> None:
+    def test_p10_with_all_3_severity_groups_returns_empty(self, default_checker: RuntimeConstraintChecker) -> None:
         """p10 with all 3 SeverityLevel keys → no violation (positive case)."""
-        checker = _make_checker()
         state = _make_state(
             phase=PhaseId.P10_CodeReview,
             severity_groups={
@@ -741,51 +786,46 @@ class TestCheckSeverityTree:
                 SeverityLevel.Minor: set(),
             },
         )
-        violations = checker.check_severity_tree(state)
+        violations = default_checker.check_severity_tree(state)
         assert violations == []
 
-    def test_p10_with_partial_severity_groups_returns_violation(self) -> None:
+    def test_p10_with_partial_severity_groups_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
         """p10 with only 1 or 2 severity groups → C-severity-eager violation."""
-        checker = _make_checker()
         state = _make_state(
             phase=PhaseId.P10_CodeReview,
             severity_groups={SeverityLevel.Blocker: set()},
         )
-        violations = checker.check_severity_tree(state)
+        violations = default_checker.check_severity_tree(state)
         assert len(violations) == 1
         assert violations[0].constraint_id == "C-severity-eager"
 
-    def test_p10_severity_eager_violation_context_has_missing_levels(self) -> None:
+    def test_p10_severity_eager_violation_context_has_missing_levels(self, default_checker: RuntimeConstraintChecker) -> None:
         """Violation context includes which severity levels are missing."""
-        checker = _make_checker()
         state = _make_state(phase=PhaseId.P10_CodeReview)
-        violations = checker.check_severity_tree(state)
+        violations = default_checker.check_severity_tree(state)
         assert violations[0].context.get("phase") == "p10"
         missing = violations[0].context.get("missing_severity_levels", "")
         assert "BLOCKER" in missing or "IMPORTANT" in missing or "MINOR" in missing
 
-    def test_p10_state_machine_advance_populates_severity_groups(self) -> None:
+    def test_p10_state_machine_advance_populates_severity_groups(self, default_checker: RuntimeConstraintChecker) -> None:
         """Advancing to p10 via EpochStateMachine auto-populates all 3 severity groups."""
         sm = EpochStateMachine("test-p10-severity")
         _advance_to(sm, PhaseId.P10_CodeReview)
         state = sm.state
-        checker = _make_checker()
-        violations = checker.check_severity_tree(state)
+        violations = default_checker.check_severity_tree(state)
         # State machine auto-populates severity_groups on p10 entry
         assert violations == [], (
             f"Expected no violations after state machine advance to p10; got {violations}"
         )
 
-    def test_severity_not_plan_violation_mentions_plan_review(self) -> None:
-        checker = _make_checker()
+    def test_severity_not_plan_violation_mentions_plan_review(self, default_checker: RuntimeConstraintChecker) -> None:
         state = _make_state(phase=PhaseId.P4_Review)
-        violations = checker.check_severity_tree(state)
+        violations = default_checker.check_severity_tree(state)
         assert "p4" in violations[0].message or "plan" in violations[0].message.lower()
 
-    def test_severity_not_plan_violation_context_has_phase(self) -> None:
-        checker = _make_checker()
+    def test_severity_not_plan_violation_context_has_phase(self, default_checker: RuntimeConstraintChecker) -> None:
         state = _make_state(phase=PhaseId.P4_Review)
-        violations = checker.check_severity_tree(state)
+        violations = default_checker.check_severity_tree(state)
         assert violations[0].context.get("phase") == "p4"
 
 
@@ -795,48 +835,41 @@ class TestCheckSeverityTree:
 class TestCheckHandoffRequired:
     """C-handoff-skill-invocation: actor-change transitions require handoff."""
 
-    def test_p7_to_p8_requires_handoff(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_handoff_required(PhaseId.P7_Handoff, PhaseId.P8_ImplPlan)
+    def test_p7_to_p8_requires_handoff(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_handoff_required(PhaseId.P7_Handoff, PhaseId.P8_ImplPlan)
         assert len(violations) == 1
         assert violations[0].constraint_id == "C-handoff-skill-invocation"
 
-    def test_p9_to_p10_requires_handoff(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_handoff_required(PhaseId.P9_Slice, PhaseId.P10_CodeReview)
+    def test_p9_to_p10_requires_handoff(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_handoff_required(PhaseId.P9_Slice, PhaseId.P10_CodeReview)
         assert len(violations) == 1
         assert violations[0].constraint_id == "C-handoff-skill-invocation"
 
-    def test_p5_to_p6_same_actor_no_handoff(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_handoff_required(PhaseId.P5_Uat, PhaseId.P6_Ratify)
+    def test_p5_to_p6_same_actor_no_handoff(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_handoff_required(PhaseId.P5_Uat, PhaseId.P6_Ratify)
         assert violations == []
 
-    def test_p6_to_p7_same_actor_no_handoff(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_handoff_required(PhaseId.P6_Ratify, PhaseId.P7_Handoff)
+    def test_p6_to_p7_same_actor_no_handoff(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_handoff_required(PhaseId.P6_Ratify, PhaseId.P7_Handoff)
         assert violations == []
 
-    def test_non_actor_change_transitions_no_handoff(self) -> None:
-        checker = _make_checker()
-        for from_p, to_p in (
-            (PhaseId.P1_Request, PhaseId.P2_Elicit),
-            (PhaseId.P2_Elicit, PhaseId.P3_Propose),
-            (PhaseId.P3_Propose, PhaseId.P4_Review),
-        ):
-            violations = checker.check_handoff_required(from_p, to_p)
-            assert violations == [], f"Unexpected handoff violation for {from_p} -> {to_p}"
-
-    def test_violation_context_contains_from_and_to_phase(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_handoff_required(PhaseId.P7_Handoff, PhaseId.P8_ImplPlan)
+    @pytest.mark.parametrize("from_p, to_p", [
+        (PhaseId.P1_Request, PhaseId.P2_Elicit),
+        (PhaseId.P2_Elicit, PhaseId.P3_Propose),
+        (PhaseId.P3_Propose, PhaseId.P4_Review),
+    ])
+    def test_non_actor_change_transitions_no_handoff(self, default_checker: RuntimeConstraintChecker, from_p: PhaseId, to_p: PhaseId) -> None:
+        violations = default_checker.check_handoff_required(from_p, to_p)
+        assert violations == [], f"Unexpected handoff violation for {from_p} -> {to_p}"
+
+    def test_violation_context_contains_from_and_to_phase(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_handoff_required(PhaseId.P7_Handoff, PhaseId.P8_ImplPlan)
         ctx = violations[0].context
         assert ctx.get("from_phase") == "p7"
         assert ctx.get("to_phase") == "p8"
 
-    def test_violation_message_mentions_skill_invocation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_handoff_required(PhaseId.P7_Handoff, PhaseId.P8_ImplPlan)
+    def test_violation_message_mentions_skill_invocation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_handoff_required(PhaseId.P7_Handoff, PhaseId.P8_ImplPlan)
         msg = violations[0].message.lower()
         assert "skill" in msg or "handoff" in msg
 
@@ -847,35 +880,30 @@ class TestCheckHandoffRequired:
 class TestCheckBlockerGate:
     """check_blocker_gate: p10 with unresolved blockers yields C-worker-gates violation."""
 
-    def test_p10_with_blockers_returns_violation(self) -> None:
-        checker = _make_checker()
+    def test_p10_with_blockers_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
         state = _make_state(phase=PhaseId.P10_CodeReview, blocker_count=1)
-        violations = checker.check_blocker_gate(state)
+        violations = default_checker.check_blocker_gate(state)
         assert len(violations) == 1
         assert violations[0].constraint_id == "C-worker-gates"
 
-    def test_p10_with_zero_blockers_returns_empty(self) -> None:
-        checker = _make_checker()
+    def test_p10_with_zero_blockers_returns_empty(self, default_checker: RuntimeConstraintChecker) -> None:
         state = _make_state(phase=PhaseId.P10_CodeReview, blocker_count=0)
-        violations = checker.check_blocker_gate(state)
+        violations = default_checker.check_blocker_gate(state)
         assert violations == []
 
-    def test_non_p10_with_blockers_returns_empty(self) -> None:
-        checker = _make_checker()
+    def test_non_p10_with_blockers_returns_empty(self, default_checker: RuntimeConstraintChecker) -> None:
         state = _make_state(phase=PhaseId.P9_Slice, blocker_count=5)
-        violations = checker.check_blocker_gate(state)
+        violations = default_checker.check_blocker_gate(state)
         assert violations == []
 
-    def test_violation_context_contains_blocker_count(self) -> None:
-        checker = _make_checker()
+    def test_violation_context_contains_blocker_count(self, default_checker: RuntimeConstraintChecker) -> None:
         state = _make_state(phase=PhaseId.P10_CodeReview, blocker_count=3)
-        violations = checker.check_blocker_gate(state)
+        violations = default_checker.check_blocker_gate(state)
         assert violations[0].context.get("blocker_count") == "3"
 
-    def test_violation_message_mentions_blocker(self) -> None:
-        checker = _make_checker()
+    def test_violation_message_mentions_blocker(self, default_checker: RuntimeConstraintChecker) -> None:
         state = _make_state(phase=PhaseId.P10_CodeReview, blocker_count=2)
-        violations = checker.check_blocker_gate(state)
+        violations = default_checker.check_blocker_gate(state)
         assert "blocker" in violations[0].message.lower()
 
 
@@ -885,65 +913,56 @@ class TestCheckBlockerGate:
 class TestCheckAuditTrail:
     """C-audit-never-delete / C-audit-dep-chain: audit trail integrity."""
 
-    def test_p2_with_empty_history_returns_violation(self) -> None:
-        checker = _make_checker()
+    def test_p2_with_empty_history_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
         # At p2 but no transitions recorded — audit trail problem
         state = _make_state(phase=PhaseId.P2_Elicit)
         state.transition_history.clear()
-        violations = checker.check_audit_trail(state)
-        ids = {v.constraint_id for v in violations}
-        assert "C-audit-never-delete" in ids
+        violations = default_checker.check_audit_trail(state)
+        assert any(v.constraint_id == "C-audit-never-delete" for v in violations)
 
-    def test_p1_with_empty_history_no_violation(self) -> None:
-        checker = _make_checker()
+    def test_p1_with_empty_history_no_violation(self, default_checker: RuntimeConstraintChecker) -> None:
         # At p1 (start), empty history is expected
         state = _make_state(phase=PhaseId.P1_Request)
-        violations = checker.check_audit_trail(state)
-        ids = {v.constraint_id for v in violations}
-        assert "C-audit-never-delete" not in ids
+        violations = default_checker.check_audit_trail(state)
+        assert not any(v.constraint_id == "C-audit-never-delete" for v in violations)
 
-    def test_transition_record_missing_triggered_by_returns_violation(self) -> None:
-        checker = _make_checker()
+    def test_transition_record_missing_triggered_by_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
         state = _make_state(phase=PhaseId.P2_Elicit)
         record = TransitionRecord(
             from_phase=PhaseId.P1_Request,
             to_phase=PhaseId.P2_Elicit,
-            timestamp=datetime.now(tz=timezone.utc),
+            timestamp=_FIXED_NOW,
             triggered_by="",  # missing
             condition_met="test condition",
         )
         state.transition_history.append(record)
-        violations = checker.check_audit_trail(state)
-        ids = {v.constraint_id for v in violations}
-        assert "C-audit-dep-chain" in ids
+        violations = default_checker.check_audit_trail(state)
+        assert any(v.constraint_id == "C-audit-dep-chain" for v in violations)
 
-    def test_transition_record_missing_condition_met_returns_violation(self) -> None:
-        checker = _make_checker()
+    def test_transition_record_missing_condition_met_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
         state = _make_state(phase=PhaseId.P2_Elicit)
         record = TransitionRecord(
             from_phase=PhaseId.P1_Request,
             to_phase=PhaseId.P2_Elicit,
-            timestamp=datetime.now(tz=timezone.utc),
+            timestamp=_FIXED_NOW,
             triggered_by="architect",
             condition_met="",  # missing
         )
         state.transition_history.append(record)
-        violations = checker.check_audit_trail(state)
-        ids = {v.constraint_id for v in violations}
-        assert "C-audit-dep-chain" in ids
+        violations = default_checker.check_audit_trail(state)
+        assert any(v.constraint_id == "C-audit-dep-chain" for v in violations)
 
-    def test_valid_history_returns_empty(self) -> None:
-        checker = _make_checker()
+    def test_valid_history_returns_empty(self, default_checker: RuntimeConstraintChecker) -> None:
         state = _make_state(phase=PhaseId.P2_Elicit)
         record = TransitionRecord(
             from_phase=PhaseId.P1_Request,
             to_phase=PhaseId.P2_Elicit,
-            timestamp=datetime.now(tz=timezone.utc),
+            timestamp=_FIXED_NOW,
             triggered_by="architect",
             condition_met="classification confirmed",
         )
         state.transition_history.append(record)
-        violations = checker.check_audit_trail(state)
+        violations = default_checker.check_audit_trail(state)
         assert violations == []
 
 
@@ -953,32 +972,27 @@ class TestCheckAuditTrail:
 class TestCheckRoleOwnership:
     """check_role_ownership: validates role-phase consistency."""
 
-    def test_valid_worker_role_returns_empty(self) -> None:
-        checker = _make_checker()
+    def test_valid_worker_role_returns_empty(self, default_checker: RuntimeConstraintChecker) -> None:
         state = _make_state(phase=PhaseId.P9_Slice, current_role=RoleId.Worker)
-        violations = checker.check_role_ownership(state)
+        violations = default_checker.check_role_ownership(state)
         assert violations == []
 
-    def test_valid_supervisor_role_returns_empty(self) -> None:
-        checker = _make_checker()
+    def test_valid_supervisor_role_returns_empty(self, default_checker: RuntimeConstraintChecker) -> None:
         state = _make_state(phase=PhaseId.P8_ImplPlan, current_role=RoleId.Supervisor)
-        violations = checker.check_role_ownership(state)
+        violations = default_checker.check_role_ownership(state)
         assert violations == []
 
-    def test_unknown_role_returns_violation(self) -> None:
-        checker = _make_checker()
+    def test_unknown_role_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
         state = _make_state(phase=PhaseId.P9_Slice, current_role="unknown-role")
-        violations = checker.check_role_ownership(state)
+        violations = default_checker.check_role_ownership(state)
         assert len(violations) >= 1
-        ids = {v.constraint_id for v in violations}
-        assert "C-vertical-slices" in ids
+        assert any(v.constraint_id == "C-vertical-slices" for v in violations)
 
-    def test_all_valid_roles_return_empty(self) -> None:
-        checker = _make_checker()
-        for role in RoleId:
-            state = _make_state(current_role=role)
-            violations = checker.check_role_ownership(state)
-            assert violations == [], f"Unexpected violation for role {role!r}"
+    @pytest.mark.parametrize("role", list(RoleId))
+    def test_all_valid_roles_return_empty(self, default_checker: RuntimeConstraintChecker, role: RoleId) -> None:
+        state = _make_state(current_role=role)
+        violations = default_checker.check_role_ownership(state)
+        assert violations == [], f"Unexpected violation for role {role!r}"
 
 
 # ─── C-review-binary ──────────────────────────────────────────────────────────
@@ -987,46 +1001,38 @@ class TestCheckRoleOwnership:
 class TestCheckReviewBinary:
     """C-review-binary: votes must be ACCEPT or REVISE only."""
 
-    def test_accept_vote_returns_empty(self) -> None:
-        checker = _make_checker()
-        assert checker.check_review_binary(VoteType.Accept) == []
+    def test_accept_vote_returns_empty(self, default_checker: RuntimeConstraintChecker) -> None:
+        assert default_checker.check_review_binary(VoteType.Accept) == []
 
-    def test_revise_vote_returns_empty(self) -> None:
-        checker = _make_checker()
-        assert checker.check_review_binary(VoteType.Revise) == []
+    def test_revise_vote_returns_empty(self, default_checker: RuntimeConstraintChecker) -> None:
+        assert default_checker.check_review_binary(VoteType.Revise) == []
 
-    def test_approve_vote_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_review_binary("APPROVE")
+    def test_approve_vote_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_review_binary("APPROVE")
         assert len(violations) == 1
         assert violations[0].constraint_id == "C-review-binary"
 
-    def test_approve_with_comments_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_review_binary("APPROVE_WITH_COMMENTS")
+    def test_approve_with_comments_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_review_binary("APPROVE_WITH_COMMENTS")
         assert len(violations) == 1
         assert violations[0].constraint_id == "C-review-binary"
 
-    def test_request_changes_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_review_binary("REQUEST_CHANGES")
+    def test_request_changes_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_review_binary("REQUEST_CHANGES")
         assert len(violations) == 1
         assert violations[0].constraint_id == "C-review-binary"
 
-    def test_reject_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_review_binary("REJECT")
+    def test_reject_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_review_binary("REJECT")
         assert len(violations) == 1
         assert violations[0].constraint_id == "C-review-binary"
 
-    def test_violation_context_contains_vote(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_review_binary("APPROVE")
+    def test_violation_context_contains_vote(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_review_binary("APPROVE")
         assert violations[0].context.get("vote") == "APPROVE"
 
-    def test_violation_message_mentions_accept_and_revise(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_review_binary("APPROVE")
+    def test_violation_message_mentions_accept_and_revise(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_review_binary("APPROVE")
         msg = violations[0].message
         assert "ACCEPT" in msg and "REVISE" in msg
 
@@ -1037,38 +1043,30 @@ class TestCheckReviewBinary:
 class TestCheckBlockerDualParent:
     """C-blocker-dual-parent: BLOCKER findings must have severity group AND slice as parents."""
 
-    def test_valid_dual_parent_returns_empty(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_blocker_dual_parent(
+    def test_valid_dual_parent_returns_empty(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_blocker_dual_parent(
             "blocker-task-abc",
             severity_group_id="severity-group-1",
             slice_id="slice-3",
         )
         assert violations == []
 
-    def test_missing_severity_group_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_blocker_dual_parent("blocker-abc", "", "slice-3")
-        ids = {v.constraint_id for v in violations}
-        assert "C-blocker-dual-parent" in ids
+    def test_missing_severity_group_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_blocker_dual_parent("blocker-abc", "", "slice-3")
+        assert any(v.constraint_id == "C-blocker-dual-parent" for v in violations)
 
-    def test_missing_slice_id_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_blocker_dual_parent("blocker-abc", "severity-group-1", "")
-        ids = {v.constraint_id for v in violations}
-        assert "C-blocker-dual-parent" in ids
+    def test_missing_slice_id_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_blocker_dual_parent("blocker-abc", "severity-group-1", "")
+        assert any(v.constraint_id == "C-blocker-dual-parent" for v in violations)
 
-    def test_same_severity_group_and_slice_id_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_blocker_dual_parent(
+    def test_same_severity_group_and_slice_id_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_blocker_dual_parent(
             "blocker-abc", "same-task", "same-task"
         )
-        ids = {v.constraint_id for v in violations}
-        assert "C-blocker-dual-parent" in ids
+        assert any(v.constraint_id == "C-blocker-dual-parent" for v in violations)
 
-    def test_violation_message_mentions_dual_parent(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_blocker_dual_parent("blocker-abc", "", "slice-3")
+    def test_violation_message_mentions_dual_parent(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_blocker_dual_parent("blocker-abc", "", "slice-3")
         assert any("severity" in v.message.lower() or "group" in v.message.lower() for v in violations)
 
 
@@ -1078,36 +1076,30 @@ class TestCheckBlockerDualParent:
 class TestCheckProposalNaming:
     """C-proposal-naming: proposal titles must follow PROPOSAL-{N}: pattern."""
 
-    def test_valid_proposal_1_title_returns_empty(self) -> None:
-        checker = _make_checker()
-        assert checker.check_proposal_naming("PROPOSAL-1: Some description") == []
+    def test_valid_proposal_1_title_returns_empty(self, default_checker: RuntimeConstraintChecker) -> None:
+        assert default_checker.check_proposal_naming("PROPOSAL-1: Some description") == []
 
-    def test_valid_proposal_10_title_returns_empty(self) -> None:
-        checker = _make_checker()
-        assert checker.check_proposal_naming("PROPOSAL-10: Another proposal") == []
+    def test_valid_proposal_10_title_returns_empty(self, default_checker: RuntimeConstraintChecker) -> None:
+        assert default_checker.check_proposal_naming("PROPOSAL-10: Another proposal") == []
 
-    def test_missing_number_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_proposal_naming("PROPOSAL: Bad title")
+    def test_missing_number_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_proposal_naming("PROPOSAL: Bad title")
         assert len(violations) == 1
         assert violations[0].constraint_id == "C-proposal-naming"
 
-    def test_lowercase_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_proposal_naming("proposal-1: lower case")
+    def test_lowercase_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_proposal_naming("proposal-1: lower case")
         assert len(violations) == 1
         assert violations[0].constraint_id == "C-proposal-naming"
 
-    def test_impl_plan_title_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_proposal_naming("IMPL_PLAN: Not a proposal")
+    def test_impl_plan_title_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_proposal_naming("IMPL_PLAN: Not a proposal")
         assert len(violations) == 1
         assert violations[0].constraint_id == "C-proposal-naming"
 
-    def test_violation_context_contains_title(self) -> None:
-        checker = _make_checker()
+    def test_violation_context_contains_title(self, default_checker: RuntimeConstraintChecker) -> None:
         title = "BAD TITLE"
-        violations = checker.check_proposal_naming(title)
+        violations = default_checker.check_proposal_naming(title)
         assert violations[0].context.get("title") == title
 
 
@@ -1117,34 +1109,28 @@ class TestCheckProposalNaming:
 class TestCheckReviewNaming:
     """C-review-naming: review task titles must follow {SCOPE}-REVIEW-{axis}-{round} pattern."""
 
-    def test_valid_review_title_axis_a_round_1(self) -> None:
-        checker = _make_checker()
-        assert checker.check_review_naming("PROPOSAL-1-REVIEW-A-1: Description") == []
+    def test_valid_review_title_axis_a_round_1(self, default_checker: RuntimeConstraintChecker) -> None:
+        assert default_checker.check_review_naming("PROPOSAL-1-REVIEW-A-1: Description") == []
 
-    def test_valid_review_title_axis_b_round_2(self) -> None:
-        checker = _make_checker()
-        assert checker.check_review_naming("SLICE-3-REVIEW-B-2: Something") == []
+    def test_valid_review_title_axis_b_round_2(self, default_checker: RuntimeConstraintChecker) -> None:
+        assert default_checker.check_review_naming("SLICE-3-REVIEW-B-2: Something") == []
 
-    def test_valid_review_title_axis_c(self) -> None:
-        checker = _make_checker()
-        assert checker.check_review_naming("IMPL-REVIEW-C-1: description") == []
+    def test_valid_review_title_axis_c(self, default_checker: RuntimeConstraintChecker) -> None:
+        assert default_checker.check_review_naming("IMPL-REVIEW-C-1: description") == []
 
-    def test_numeric_reviewer_id_instead_of_axis_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_review_naming("PROPOSAL-1-REVIEW-1-1: Bad axis")
+    def test_numeric_reviewer_id_instead_of_axis_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_review_naming("PROPOSAL-1-REVIEW-1-1: Bad axis")
         assert len(violations) == 1
         assert violations[0].constraint_id == "C-review-naming"
 
-    def test_missing_round_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_review_naming("PROPOSAL-1-REVIEW-A: No round")
+    def test_missing_round_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_review_naming("PROPOSAL-1-REVIEW-A: No round")
         assert len(violations) == 1
         assert violations[0].constraint_id == "C-review-naming"
 
-    def test_violation_context_contains_title(self) -> None:
-        checker = _make_checker()
+    def test_violation_context_contains_title(self, default_checker: RuntimeConstraintChecker) -> None:
         bad_title = "BAD-REVIEW-1-1: Numeric axis"
-        violations = checker.check_review_naming(bad_title)
+        violations = default_checker.check_review_naming(bad_title)
         assert violations[0].context.get("title") == bad_title
 
 
@@ -1154,28 +1140,24 @@ class TestCheckReviewNaming:
 class TestCheckSliceLeafTasks:
     """C-slice-leaf-tasks: every slice must have leaf tasks."""
 
-    def test_with_leaf_tasks_returns_empty(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_slice_has_leaf_tasks(
+    def test_with_leaf_tasks_returns_empty(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_slice_has_leaf_tasks(
             "slice-3",
             ["leaf-l1", "leaf-l2", "leaf-l3"],
         )
         assert violations == []
 
-    def test_empty_leaf_list_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_slice_has_leaf_tasks("slice-3", [])
+    def test_empty_leaf_list_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_slice_has_leaf_tasks("slice-3", [])
         assert len(violations) == 1
         assert violations[0].constraint_id == "C-slice-leaf-tasks"
 
-    def test_violation_context_contains_slice_id(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_slice_has_leaf_tasks("my-slice-abc", [])
+    def test_violation_context_contains_slice_id(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_slice_has_leaf_tasks("my-slice-abc", [])
         assert violations[0].context.get("slice_id") == "my-slice-abc"
 
-    def test_violation_message_mentions_leaf_tasks(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_slice_has_leaf_tasks("slice-1", [])
+    def test_violation_message_mentions_leaf_tasks(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_slice_has_leaf_tasks("slice-1", [])
         assert "leaf" in violations[0].message.lower()
 
 
@@ -1185,41 +1167,32 @@ class TestCheckSliceLeafTasks:
 class TestCheckUreVerbatim:
     """C-ure-verbatim: user interview records must include question, options, response."""
 
-    def test_complete_record_returns_empty(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_ure_verbatim(
+    def test_complete_record_returns_empty(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_ure_verbatim(
             question="What is your preference?",
             options=["Option A: Use library X", "Option B: Use library Y"],
             response="Option A: Use library X because it is simpler.",
         )
         assert violations == []
 
-    def test_missing_question_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_ure_verbatim("", ["Option A"], "Option A")
-        ids = {v.constraint_id for v in violations}
-        assert "C-ure-verbatim" in ids
+    def test_missing_question_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_ure_verbatim("", ["Option A"], "Option A")
+        assert any(v.constraint_id == "C-ure-verbatim" for v in violations)
 
-    def test_empty_options_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_ure_verbatim("Question?", [], "My answer")
-        ids = {v.constraint_id for v in violations}
-        assert "C-ure-verbatim" in ids
+    def test_empty_options_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_ure_verbatim("Question?", [], "My answer")
+        assert any(v.constraint_id == "C-ure-verbatim" for v in violations)
 
-    def test_missing_response_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_ure_verbatim("Question?", ["Option A"], "")
-        ids = {v.constraint_id for v in violations}
-        assert "C-ure-verbatim" in ids
+    def test_missing_response_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_ure_verbatim("Question?", ["Option A"], "")
+        assert any(v.constraint_id == "C-ure-verbatim" for v in violations)
 
-    def test_all_missing_returns_3_violations(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_ure_verbatim("", [], "")
+    def test_all_missing_returns_3_violations(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_ure_verbatim("", [], "")
         assert len(violations) == 3
 
-    def test_violation_context_contains_field_name(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_ure_verbatim("", ["Option A"], "answer")
+    def test_violation_context_contains_field_name(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_ure_verbatim("", ["Option A"], "answer")
         fields = [v.context.get("field") for v in violations]
         assert "question" in fields
 
@@ -1230,31 +1203,27 @@ class TestCheckUreVerbatim:
 class TestCheckFollowupTiming:
     """C-followup-timing: follow-up epic must be created immediately when findings exist."""
 
-    def test_no_findings_no_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_followup_timing(
+    def test_no_findings_no_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_followup_timing(
             has_important_or_minor=False, followup_created=False
         )
         assert violations == []
 
-    def test_findings_with_followup_created_no_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_followup_timing(
+    def test_findings_with_followup_created_no_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_followup_timing(
             has_important_or_minor=True, followup_created=True
         )
         assert violations == []
 
-    def test_findings_without_followup_created_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_followup_timing(
+    def test_findings_without_followup_created_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_followup_timing(
             has_important_or_minor=True, followup_created=False
         )
         assert len(violations) == 1
         assert violations[0].constraint_id == "C-followup-timing"
 
-    def test_violation_message_mentions_blocker_gate(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_followup_timing(True, False)
+    def test_violation_message_mentions_blocker_gate(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_followup_timing(True, False)
         msg = violations[0].message.lower()
         assert "blocker" in msg or "followup" in msg or "epic" in msg
 
@@ -1265,29 +1234,24 @@ class TestCheckFollowupTiming:
 class TestCheckAgentCommit:
     """C-agent-commit: commits must use 'git agent-commit'."""
 
-    def test_agent_commit_command_returns_empty(self) -> None:
-        checker = _make_checker()
-        assert checker.check_agent_commit("git agent-commit -m 'feat: something'") == []
+    def test_agent_commit_command_returns_empty(self, default_checker: RuntimeConstraintChecker) -> None:
+        assert default_checker.check_agent_commit("git agent-commit -m 'feat: something'") == []
 
-    def test_git_commit_command_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_agent_commit("git commit -m 'feat: something'")
+    def test_git_commit_command_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_agent_commit("git commit -m 'feat: something'")
         assert len(violations) == 1
         assert violations[0].constraint_id == "C-agent-commit"
 
-    def test_unrelated_command_returns_empty(self) -> None:
-        checker = _make_checker()
-        assert checker.check_agent_commit("git push origin main") == []
+    def test_unrelated_command_returns_empty(self, default_checker: RuntimeConstraintChecker) -> None:
+        assert default_checker.check_agent_commit("git push origin main") == []
 
-    def test_violation_message_mentions_agent_commit(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_agent_commit("git commit -m 'bad'")
+    def test_violation_message_mentions_agent_commit(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_agent_commit("git commit -m 'bad'")
         assert "agent-commit" in violations[0].message
 
-    def test_violation_context_contains_command(self) -> None:
-        checker = _make_checker()
+    def test_violation_context_contains_command(self, default_checker: RuntimeConstraintChecker) -> None:
         cmd = "git commit -m 'bad'"
-        violations = checker.check_agent_commit(cmd)
+        violations = default_checker.check_agent_commit(cmd)
         assert violations[0].context.get("command") == cmd
 
 
@@ -1297,35 +1261,29 @@ class TestCheckAgentCommit:
 class TestCheckFrontmatterRefs:
     """C-frontmatter-refs: task descriptions must use YAML frontmatter for cross-task refs."""
 
-    def test_valid_frontmatter_with_all_keys_returns_empty(self) -> None:
-        checker = _make_checker()
+    def test_valid_frontmatter_with_all_keys_returns_empty(self, default_checker: RuntimeConstraintChecker) -> None:
         desc = "---\nreferences:\n  urd: abc-123\n  request: def-456\n---\n## Content"
-        violations = checker.check_frontmatter_refs(desc, ["urd", "request"])
+        violations = default_checker.check_frontmatter_refs(desc, ["urd", "request"])
         assert violations == []
 
-    def test_missing_key_returns_violation(self) -> None:
-        checker = _make_checker()
+    def test_missing_key_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
         desc = "---\nreferences:\n  urd: abc-123\n---\n## Content"
-        violations = checker.check_frontmatter_refs(desc, ["urd", "request"])
-        ids = {v.constraint_id for v in violations}
-        assert "C-frontmatter-refs" in ids
+        violations = default_checker.check_frontmatter_refs(desc, ["urd", "request"])
+        assert any(v.constraint_id == "C-frontmatter-refs" for v in violations)
 
-    def test_no_frontmatter_returns_violations_for_all_keys(self) -> None:
-        checker = _make_checker()
+    def test_no_frontmatter_returns_violations_for_all_keys(self, default_checker: RuntimeConstraintChecker) -> None:
         desc = "## Content without frontmatter"
-        violations = checker.check_frontmatter_refs(desc, ["urd", "request"])
+        violations = default_checker.check_frontmatter_refs(desc, ["urd", "request"])
         assert len(violations) == 2
 
-    def test_empty_required_keys_returns_empty(self) -> None:
-        checker = _make_checker()
+    def test_empty_required_keys_returns_empty(self, default_checker: RuntimeConstraintChecker) -> None:
         desc = "## Any description"
-        violations = checker.check_frontmatter_refs(desc, [])
+        violations = default_checker.check_frontmatter_refs(desc, [])
         assert violations == []
 
-    def test_violation_context_contains_missing_key(self) -> None:
-        checker = _make_checker()
+    def test_violation_context_contains_missing_key(self, default_checker: RuntimeConstraintChecker) -> None:
         desc = "## No frontmatter"
-        violations = checker.check_frontmatter_refs(desc, ["urd"])
+        violations = default_checker.check_frontmatter_refs(desc, ["urd"])
         assert violations[0].context.get("missing_key") == "urd"
 
 
@@ -1335,33 +1293,27 @@ class TestCheckFrontmatterRefs:
 class TestCheckSupervisorNoImpl:
     """C-supervisor-no-impl: supervisor must not implement code directly."""
 
-    def test_worker_doing_impl_no_violation(self) -> None:
-        checker = _make_checker()
-        assert checker.check_supervisor_no_impl("worker", "file_edit") == []
+    def test_worker_doing_impl_no_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        assert default_checker.check_supervisor_no_impl("worker", "file_edit") == []
 
-    def test_supervisor_doing_file_edit_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_supervisor_no_impl("supervisor", "file_edit")
+    def test_supervisor_doing_file_edit_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_supervisor_no_impl("supervisor", "file_edit")
         assert len(violations) == 1
         assert violations[0].constraint_id == "C-supervisor-no-impl"
 
-    def test_supervisor_doing_file_write_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_supervisor_no_impl("supervisor", "file_write")
+    def test_supervisor_doing_file_write_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_supervisor_no_impl("supervisor", "file_write")
         assert len(violations) == 1
         assert violations[0].constraint_id == "C-supervisor-no-impl"
 
-    def test_supervisor_doing_coordination_no_violation(self) -> None:
-        checker = _make_checker()
-        assert checker.check_supervisor_no_impl("supervisor", "beads_update") == []
+    def test_supervisor_doing_coordination_no_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        assert default_checker.check_supervisor_no_impl("supervisor", "beads_update") == []
 
-    def test_architect_doing_impl_no_violation(self) -> None:
-        checker = _make_checker()
-        assert checker.check_supervisor_no_impl("architect", "file_edit") == []
+    def test_architect_doing_impl_no_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        assert default_checker.check_supervisor_no_impl("architect", "file_edit") == []
 
-    def test_violation_context_contains_role_and_action(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_supervisor_no_impl("supervisor", "code_change")
+    def test_violation_context_contains_role_and_action(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_supervisor_no_impl("supervisor", "code_change")
         ctx = violations[0].context
         assert ctx.get("role") == "supervisor"
         assert ctx.get("action_type") == "code_change"
@@ -1373,46 +1325,37 @@ class TestCheckSupervisorNoImpl:
 class TestCheckFollowupLifecycle:
     """C-followup-lifecycle: follow-up tasks must use FOLLOWUP_* prefix."""
 
-    def test_followup_ure_title_returns_empty(self) -> None:
-        checker = _make_checker()
-        assert checker.check_followup_lifecycle("FOLLOWUP_URE: Scope findings") == []
+    def test_followup_ure_title_returns_empty(self, default_checker: RuntimeConstraintChecker) -> None:
+        assert default_checker.check_followup_lifecycle("FOLLOWUP_URE: Scope findings") == []
 
-    def test_followup_urd_title_returns_empty(self) -> None:
-        checker = _make_checker()
-        assert checker.check_followup_lifecycle("FOLLOWUP_URD: Requirements") == []
+    def test_followup_urd_title_returns_empty(self, default_checker: RuntimeConstraintChecker) -> None:
+        assert default_checker.check_followup_lifecycle("FOLLOWUP_URD: Requirements") == []
 
-    def test_followup_proposal_title_returns_empty(self) -> None:
-        checker = _make_checker()
-        assert checker.check_followup_lifecycle("FOLLOWUP_PROPOSAL-1: Technical plan") == []
+    def test_followup_proposal_title_returns_empty(self, default_checker: RuntimeConstraintChecker) -> None:
+        assert default_checker.check_followup_lifecycle("FOLLOWUP_PROPOSAL-1: Technical plan") == []
 
-    def test_followup_impl_plan_title_returns_empty(self) -> None:
-        checker = _make_checker()
-        assert checker.check_followup_lifecycle("FOLLOWUP_IMPL_PLAN: Plan tasks") == []
+    def test_followup_impl_plan_title_returns_empty(self, default_checker: RuntimeConstraintChecker) -> None:
+        assert default_checker.check_followup_lifecycle("FOLLOWUP_IMPL_PLAN: Plan tasks") == []
 
-    def test_followup_slice_title_returns_empty(self) -> None:
-        checker = _make_checker()
-        assert checker.check_followup_lifecycle("FOLLOWUP_SLICE-3: Fix naming") == []
+    def test_followup_slice_title_returns_empty(self, default_checker: RuntimeConstraintChecker) -> None:
+        assert default_checker.check_followup_lifecycle("FOLLOWUP_SLICE-3: Fix naming") == []
 
-    def test_followup_epic_title_returns_empty(self) -> None:
-        checker = _make_checker()
-        assert checker.check_followup_lifecycle("FOLLOWUP: Findings from code review") == []
+    def test_followup_epic_title_returns_empty(self, default_checker: RuntimeConstraintChecker) -> None:
+        assert default_checker.check_followup_lifecycle("FOLLOWUP: Findings from code review") == []
 
-    def test_bare_ure_without_prefix_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_followup_lifecycle("URE: No prefix")
+    def test_bare_ure_without_prefix_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_followup_lifecycle("URE: No prefix")
         assert len(violations) == 1
         assert violations[0].constraint_id == "C-followup-lifecycle"
 
-    def test_slice_without_prefix_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_followup_lifecycle("SLICE-3: Missing FOLLOWUP prefix")
+    def test_slice_without_prefix_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_followup_lifecycle("SLICE-3: Missing FOLLOWUP prefix")
         assert len(violations) == 1
         assert violations[0].constraint_id == "C-followup-lifecycle"
 
-    def test_violation_context_contains_title(self) -> None:
-        checker = _make_checker()
+    def test_violation_context_contains_title(self, default_checker: RuntimeConstraintChecker) -> None:
         bad_title = "URE: Bad title"
-        violations = checker.check_followup_lifecycle(bad_title)
+        violations = default_checker.check_followup_lifecycle(bad_title)
         assert violations[0].context.get("title") == bad_title
 
 
@@ -1422,30 +1365,24 @@ class TestCheckFollowupLifecycle:
 class TestCheckFollowupLeafAdoption:
     """C-followup-leaf-adoption: IMPORTANT/MINOR leaf tasks must have dual parents."""
 
-    def test_valid_dual_parent_returns_empty(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_followup_leaf_adoption(
+    def test_valid_dual_parent_returns_empty(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_followup_leaf_adoption(
             "leaf-abc",
             severity_group_id="sev-group-123",
             followup_slice_id="followup-slice-456",
         )
         assert violations == []
 
-    def test_missing_severity_group_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_followup_leaf_adoption("leaf-abc", "", "followup-slice-456")
-        ids = {v.constraint_id for v in violations}
-        assert "C-followup-leaf-adoption" in ids
+    def test_missing_severity_group_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_followup_leaf_adoption("leaf-abc", "", "followup-slice-456")
+        assert any(v.constraint_id == "C-followup-leaf-adoption" for v in violations)
 
-    def test_missing_followup_slice_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_followup_leaf_adoption("leaf-abc", "sev-group-123", "")
-        ids = {v.constraint_id for v in violations}
-        assert "C-followup-leaf-adoption" in ids
+    def test_missing_followup_slice_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_followup_leaf_adoption("leaf-abc", "sev-group-123", "")
+        assert any(v.constraint_id == "C-followup-leaf-adoption" for v in violations)
 
-    def test_violation_context_contains_leaf_task_id(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_followup_leaf_adoption("leaf-xyz", "", "followup-slice")
+    def test_violation_context_contains_leaf_task_id(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_followup_leaf_adoption("leaf-xyz", "", "followup-slice")
         assert violations[0].context.get("leaf_task_id") == "leaf-xyz"
 
 
@@ -1455,47 +1392,38 @@ class TestCheckFollowupLeafAdoption:
 class TestCheckWorkerGates:
     """C-worker-gates: worker completion requires quality gates to pass."""
 
-    def test_all_gates_pass_returns_empty(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_worker_gates(
+    def test_all_gates_pass_returns_empty(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_worker_gates(
             has_todos=False, tests_pass=True, typecheck_pass=True
         )
         assert violations == []
 
-    def test_tests_failing_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_worker_gates(
+    def test_tests_failing_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_worker_gates(
             has_todos=False, tests_pass=False, typecheck_pass=True
         )
-        ids = {v.constraint_id for v in violations}
-        assert "C-worker-gates" in ids
+        assert any(v.constraint_id == "C-worker-gates" for v in violations)
 
-    def test_typecheck_failing_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_worker_gates(
+    def test_typecheck_failing_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_worker_gates(
             has_todos=False, tests_pass=True, typecheck_pass=False
         )
-        ids = {v.constraint_id for v in violations}
-        assert "C-worker-gates" in ids
+        assert any(v.constraint_id == "C-worker-gates" for v in violations)
 
-    def test_has_todos_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_worker_gates(
+    def test_has_todos_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_worker_gates(
             has_todos=True, tests_pass=True, typecheck_pass=True
         )
-        ids = {v.constraint_id for v in violations}
-        assert "C-worker-gates" in ids
+        assert any(v.constraint_id == "C-worker-gates" for v in violations)
 
-    def test_all_gates_fail_returns_3_violations(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_worker_gates(
+    def test_all_gates_fail_returns_3_violations(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_worker_gates(
             has_todos=True, tests_pass=False, typecheck_pass=False
         )
         assert len(violations) == 3
 
-    def test_violation_context_contains_gate_name(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_worker_gates(False, False, True)
+    def test_violation_context_contains_gate_name(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_worker_gates(False, False, True)
         assert any(v.context.get("gate") == "tests" for v in violations)
 
 
@@ -1505,32 +1433,28 @@ class TestCheckWorkerGates:
 class TestCheckSupervisorExploreEphemeral:
     """C-supervisor-explore-ephemeral: supervisor must use ephemeral Explore subagents at p8."""
 
-    def test_p8_with_ephemeral_task_returns_empty(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_supervisor_explore_ephemeral(
+    def test_p8_with_ephemeral_task_returns_empty(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_supervisor_explore_ephemeral(
             PhaseId.P8_ImplPlan, exploration_method="ephemeral_task"
         )
         assert violations == []
 
-    def test_p8_without_ephemeral_task_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_supervisor_explore_ephemeral(
+    def test_p8_without_ephemeral_task_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_supervisor_explore_ephemeral(
             PhaseId.P8_ImplPlan, exploration_method="direct"
         )
         assert len(violations) == 1
         assert violations[0].constraint_id == "C-supervisor-explore-ephemeral"
 
-    def test_non_p8_phase_returns_empty_regardless_of_method(self) -> None:
-        checker = _make_checker()
-        for phase in (
-            PhaseId.P1_Request, PhaseId.P9_Slice, PhaseId.P10_CodeReview
-        ):
-            violations = checker.check_supervisor_explore_ephemeral(phase, exploration_method="direct")
-            assert violations == [], f"Unexpected violation at {phase}"
-
-    def test_violation_context_contains_phase(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_supervisor_explore_ephemeral(PhaseId.P8_ImplPlan, "direct")
+    @pytest.mark.parametrize("phase", [
+        PhaseId.P1_Request, PhaseId.P9_Slice, PhaseId.P10_CodeReview,
+    ])
+    def test_non_p8_phase_returns_empty_regardless_of_method(self, default_checker: RuntimeConstraintChecker, phase: PhaseId) -> None:
+        violations = default_checker.check_supervisor_explore_ephemeral(phase, exploration_method="direct")
+        assert violations == [], f"Unexpected violation at {phase}"
+
+    def test_violation_context_contains_phase(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_supervisor_explore_ephemeral(PhaseId.P8_ImplPlan, "direct")
         assert violations[0].context.get("phase") == "p8"
 
 
@@ -1540,20 +1464,17 @@ class TestCheckSupervisorExploreEphemeral:
 class TestCheckIntegrationPoints:
     """C-integration-points: cross-slice dependencies must be documented in IMPL_PLAN."""
 
-    def test_with_integration_points_returns_empty(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_integration_points(has_integration_points=True)
+    def test_with_integration_points_returns_empty(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_integration_points(has_integration_points=True)
         assert violations == []
 
-    def test_without_integration_points_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_integration_points(has_integration_points=False)
+    def test_without_integration_points_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_integration_points(has_integration_points=False)
         assert len(violations) == 1
         assert violations[0].constraint_id == "C-integration-points"
 
-    def test_violation_context_contains_flag(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_integration_points(has_integration_points=False)
+    def test_violation_context_contains_flag(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_integration_points(has_integration_points=False)
         assert violations[0].context.get("has_integration_points") == "False"
 
 
@@ -1563,32 +1484,26 @@ class TestCheckIntegrationPoints:
 class TestCheckSliceReviewBeforeClose:
     """C-slice-review-before-close: slices must be reviewed before closure."""
 
-    def test_supervisor_closes_after_review_returns_empty(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_slice_review_before_close(
+    def test_supervisor_closes_after_review_returns_empty(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_slice_review_before_close(
             slice_closed_by_worker=False, review_completed=True
         )
         assert violations == []
 
-    def test_worker_closes_slice_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_slice_review_before_close(
+    def test_worker_closes_slice_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_slice_review_before_close(
             slice_closed_by_worker=True, review_completed=True
         )
-        ids = {v.constraint_id for v in violations}
-        assert "C-slice-review-before-close" in ids
+        assert any(v.constraint_id == "C-slice-review-before-close" for v in violations)
 
-    def test_supervisor_closes_without_review_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_slice_review_before_close(
+    def test_supervisor_closes_without_review_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_slice_review_before_close(
             slice_closed_by_worker=False, review_completed=False
         )
-        ids = {v.constraint_id for v in violations}
-        assert "C-slice-review-before-close" in ids
+        assert any(v.constraint_id == "C-slice-review-before-close" for v in violations)
 
-    def test_violation_context_contains_flags(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_slice_review_before_close(
+    def test_violation_context_contains_flags(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_slice_review_before_close(
             slice_closed_by_worker=True, review_completed=False
         )
         ctx = violations[0].context
@@ -1602,21 +1517,18 @@ class TestCheckSliceReviewBeforeClose:
 class TestCheckMaxReviewCycles:
     """C-max-review-cycles: worker-reviewer cycles capped at 3."""
 
-    def test_within_limit_returns_empty(self) -> None:
-        checker = _make_checker()
-        for count in (1, 2, 3):
-            violations = checker.check_max_review_cycles(review_cycle_count=count)
-            assert violations == [], f"Unexpected violation at cycle count {count}"
+    @pytest.mark.parametrize("count", [1, 2, 3])
+    def test_within_limit_returns_empty(self, default_checker: RuntimeConstraintChecker, count: int) -> None:
+        violations = default_checker.check_max_review_cycles(review_cycle_count=count)
+        assert violations == [], f"Unexpected violation at cycle count {count}"
 
-    def test_exceeds_limit_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_max_review_cycles(review_cycle_count=4)
+    def test_exceeds_limit_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_max_review_cycles(review_cycle_count=4)
         assert len(violations) == 1
         assert violations[0].constraint_id == "C-max-review-cycles"
 
-    def test_violation_context_contains_counts(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_max_review_cycles(review_cycle_count=5)
+    def test_violation_context_contains_counts(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_max_review_cycles(review_cycle_count=5)
         ctx = violations[0].context
         assert ctx.get("review_cycle_count") == "5"
         assert ctx.get("max_cycles") == "3"
@@ -1628,41 +1540,33 @@ class TestCheckMaxReviewCycles:
 class TestCheckVerticalSlices:
     """C-vertical-slices: each production code path must have exactly one owner."""
 
-    def test_single_owner_returns_empty(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_vertical_slices(
+    def test_single_owner_returns_empty(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_vertical_slices(
             "scripts/aura_protocol/constraints.py",
             ["worker-3"],
         )
         assert violations == []
 
-    def test_no_owner_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_vertical_slices(
+    def test_no_owner_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_vertical_slices(
             "scripts/aura_protocol/constraints.py",
             [],
         )
-        ids = {v.constraint_id for v in violations}
-        assert "C-vertical-slices" in ids
+        assert any(v.constraint_id == "C-vertical-slices" for v in violations)
 
-    def test_multiple_owners_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_vertical_slices(
+    def test_multiple_owners_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_vertical_slices(
             "scripts/aura_protocol/constraints.py",
             ["worker-1", "worker-2"],
         )
-        ids = {v.constraint_id for v in violations}
-        assert "C-vertical-slices" in ids
+        assert any(v.constraint_id == "C-vertical-slices" for v in violations)
 
-    def test_empty_production_code_path_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_vertical_slices("", ["worker-1"])
-        ids = {v.constraint_id for v in violations}
-        assert "C-vertical-slices" in ids
+    def test_empty_production_code_path_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_vertical_slices("", ["worker-1"])
+        assert any(v.constraint_id == "C-vertical-slices" for v in violations)
 
-    def test_violation_context_contains_path_and_count(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_vertical_slices("some/path.py", [])
+    def test_violation_context_contains_path_and_count(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_vertical_slices("some/path.py", [])
         ctx = violations[0].context
         assert "production_code_path" in ctx or "owner_count" in ctx
 
@@ -1673,44 +1577,39 @@ class TestCheckVerticalSlices:
 class TestCrossConstraintIntegration:
     """Integration tests verifying that check_state_constraints aggregates multiple constraint violations."""
 
-    def test_p4_with_no_votes_check_state_constraints_is_non_empty(self) -> None:
-        checker = _make_checker()
+    def test_p4_with_no_votes_check_state_constraints_is_non_empty(self, default_checker: RuntimeConstraintChecker) -> None:
         state = _make_state(phase=PhaseId.P4_Review)
-        violations = checker.check_state_constraints(state)
+        violations = default_checker.check_state_constraints(state)
         # AC5: should NOT silently pass
         assert violations, "check_state_constraints should return violations for p4 without consensus"
 
-    def test_p10_with_blockers_and_no_consensus_check_state_constraints_is_non_empty(self) -> None:
-        checker = _make_checker()
+    def test_p10_with_blockers_and_no_consensus_check_state_constraints_is_non_empty(self, default_checker: RuntimeConstraintChecker) -> None:
         state = _make_state(phase=PhaseId.P10_CodeReview, blocker_count=2)
-        violations = checker.check_state_constraints(state)
+        violations = default_checker.check_state_constraints(state)
         assert violations, "check_state_constraints should return violations for p10 with blockers"
 
-    def test_all_violations_have_constraint_id_in_specs(self) -> None:
+    def test_all_violations_have_constraint_id_in_specs(self, default_checker: RuntimeConstraintChecker) -> None:
         """Every constraint_id in a violation must be a known C-* constraint."""
-        checker = _make_checker()
         # Create a state with multiple potential violations
         state = _make_state(phase=PhaseId.P10_CodeReview, blocker_count=1)
-        violations = checker.check_state_constraints(state)
+        violations = default_checker.check_state_constraints(state)
         for v in violations:
-            assert v.constraint_id in CONSTRAINT_SPECS, (
+            assert v.constraint_id in default_checker.known_ids, (
                 f"Violation has unknown constraint_id: {v.constraint_id!r}. "
-                f"Known IDs: {sorted(CONSTRAINT_SPECS.keys())}"
+                f"Known IDs: {sorted(default_checker.known_ids)}"
             )
 
-    def test_clean_p1_state_produces_no_violations(self) -> None:
+    def test_clean_p1_state_produces_no_violations(self, default_checker: RuntimeConstraintChecker) -> None:
         """A fresh p1 state should not produce any violations."""
-        checker = _make_checker()
         state = _make_state(phase=PhaseId.P1_Request)
-        violations = checker.check_state_constraints(state)
+        violations = default_checker.check_state_constraints(state)
         assert violations == [], f"Unexpected violations for clean p1 state: {violations}"
 
-    def test_check_state_constraints_aggregates_not_short_circuits(self) -> None:
+    def test_check_state_constraints_aggregates_not_short_circuits(self, default_checker: RuntimeConstraintChecker) -> None:
         """check_state_constraints must return violations from multiple checks, not just the first."""
-        checker = _make_checker()
         state = _make_state(phase=PhaseId.P10_CodeReview, blocker_count=5)
         # p10 has both C-review-consensus (no votes) and C-worker-gates (blockers)
-        violations = checker.check_state_constraints(state)
+        violations = default_checker.check_state_constraints(state)
         constraint_ids = {v.constraint_id for v in violations}
         # At least both must appear
         assert len(constraint_ids) >= 2, (
@@ -1752,14 +1651,12 @@ class TestSameActorModuleLevelConstant:
 class TestCheckNaming:
     """check_naming aggregates naming/format checks across a list of titles."""
 
-    def test_empty_title_list_returns_empty(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_naming([])
+    def test_empty_title_list_returns_empty(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_naming([])
         assert violations == []
 
-    def test_valid_proposal_title_in_list_returns_empty(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_naming(["PROPOSAL-1: Valid proposal"])
+    def test_valid_proposal_title_in_list_returns_empty(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_naming(["PROPOSAL-1: Valid proposal"])
         # PROPOSAL-1 title passes proposal naming but NOT review naming or followup lifecycle
         # check_agent_commit returns empty for non-commit commands
         # check_review_naming will return violation for non-review pattern
@@ -1767,29 +1664,23 @@ class TestCheckNaming:
         # We only verify it processes the list (doesn't raise)
         assert isinstance(violations, list)
 
-    def test_returns_violations_for_invalid_proposal_title(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_naming(["bad-title-without-pattern"])
+    def test_returns_violations_for_invalid_proposal_title(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_naming(["bad-title-without-pattern"])
         ids = {v.constraint_id for v in violations}
         # proposal naming should fail
         assert "C-proposal-naming" in ids
 
-    def test_returns_violations_for_git_commit_command(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_naming(["git commit -m 'bad'"])
-        ids = {v.constraint_id for v in violations}
-        assert "C-agent-commit" in ids
+    def test_returns_violations_for_git_commit_command(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_naming(["git commit -m 'bad'"])
+        assert any(v.constraint_id == "C-agent-commit" for v in violations)
 
-    def test_git_agent_commit_no_agent_commit_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_naming(["git agent-commit -m 'good'"])
-        ids = {v.constraint_id for v in violations}
-        assert "C-agent-commit" not in ids
+    def test_git_agent_commit_no_agent_commit_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_naming(["git agent-commit -m 'good'"])
+        assert not any(v.constraint_id == "C-agent-commit" for v in violations)
 
-    def test_processes_multiple_titles(self) -> None:
+    def test_processes_multiple_titles(self, default_checker: RuntimeConstraintChecker) -> None:
         """check_naming runs all checks for each title in the list."""
-        checker = _make_checker()
-        violations = checker.check_naming([
+        violations = default_checker.check_naming([
             "git commit -m 'bad'",
             "git commit -m 'another bad'",
         ])
@@ -1797,24 +1688,19 @@ class TestCheckNaming:
         agent_commit_violations = [v for v in violations if v.constraint_id == "C-agent-commit"]
         assert len(agent_commit_violations) == 2
 
-    def test_returns_list(self) -> None:
-        checker = _make_checker()
-        result = checker.check_naming(["any-title"])
+    def test_returns_list(self, default_checker: RuntimeConstraintChecker) -> None:
+        result = default_checker.check_naming(["any-title"])
         assert isinstance(result, list)
 
-    def test_followup_lifecycle_violation_in_naming(self) -> None:
+    def test_followup_lifecycle_violation_in_naming(self, default_checker: RuntimeConstraintChecker) -> None:
         """check_naming catches C-followup-lifecycle violations."""
-        checker = _make_checker()
-        violations = checker.check_naming(["URE: Missing FOLLOWUP prefix"])
-        ids = {v.constraint_id for v in violations}
-        assert "C-followup-lifecycle" in ids
+        violations = default_checker.check_naming(["URE: Missing FOLLOWUP prefix"])
+        assert any(v.constraint_id == "C-followup-lifecycle" for v in violations)
 
-    def test_valid_followup_slice_in_naming_no_followup_lifecycle_violation(self) -> None:
+    def test_valid_followup_slice_in_naming_no_followup_lifecycle_violation(self, default_checker: RuntimeConstraintChecker) -> None:
         """FOLLOWUP_SLICE-3 passes C-followup-lifecycle check."""
-        checker = _make_checker()
-        violations = checker.check_naming(["FOLLOWUP_SLICE-3: Description"])
-        ids = {v.constraint_id for v in violations}
-        assert "C-followup-lifecycle" not in ids
+        violations = default_checker.check_naming(["FOLLOWUP_SLICE-3: Description"])
+        assert not any(v.constraint_id == "C-followup-lifecycle" for v in violations)
 
 
 # ─── check_structural aggregation ─────────────────────────────────────────────
@@ -1823,181 +1709,142 @@ class TestCheckNaming:
 class TestCheckStructural:
     """check_structural aggregates structural checks with flexible kwargs."""
 
-    def test_no_kwargs_returns_empty(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_structural()
+    def test_no_kwargs_returns_empty(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_structural()
         assert violations == []
 
-    def test_returns_list(self) -> None:
-        checker = _make_checker()
-        result = checker.check_structural(parent_id="a", child_id="b")
+    def test_returns_list(self, default_checker: RuntimeConstraintChecker) -> None:
+        result = default_checker.check_structural(parent_id="a", child_id="b")
         assert isinstance(result, list)
 
-    def test_dep_direction_valid_ids_no_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_structural(parent_id="parent-1", child_id="child-2")
+    def test_dep_direction_valid_ids_no_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_structural(parent_id="parent-1", child_id="child-2")
         assert violations == []
 
-    def test_dep_direction_same_ids_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_structural(parent_id="same", child_id="same")
-        ids = {v.constraint_id for v in violations}
-        assert "C-dep-direction" in ids
+    def test_dep_direction_same_ids_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_structural(parent_id="same", child_id="same")
+        assert any(v.constraint_id == "C-dep-direction" for v in violations)
 
-    def test_review_binary_invalid_vote_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_structural(vote="APPROVE")
-        ids = {v.constraint_id for v in violations}
-        assert "C-review-binary" in ids
+    def test_review_binary_invalid_vote_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_structural(vote="APPROVE")
+        assert any(v.constraint_id == "C-review-binary" for v in violations)
 
-    def test_review_binary_valid_vote_no_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_structural(vote="ACCEPT")
+    def test_review_binary_valid_vote_no_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_structural(vote="ACCEPT")
         assert violations == []
 
-    def test_blocker_dual_parent_valid_returns_empty(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_structural(
+    def test_blocker_dual_parent_valid_returns_empty(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_structural(
             blocker_task_id="blocker-abc",
             severity_group_id="sev-group-1",
             slice_id="slice-3",
         )
         assert violations == []
 
-    def test_blocker_dual_parent_missing_severity_group_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_structural(
+    def test_blocker_dual_parent_missing_severity_group_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_structural(
             blocker_task_id="blocker-abc",
             severity_group_id="",
             slice_id="slice-3",
         )
-        ids = {v.constraint_id for v in violations}
-        assert "C-blocker-dual-parent" in ids
+        assert any(v.constraint_id == "C-blocker-dual-parent" for v in violations)
 
-    def test_slice_leaf_tasks_empty_list_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_structural(slice_id="slice-3", leaf_task_ids=[])
-        ids = {v.constraint_id for v in violations}
-        assert "C-slice-leaf-tasks" in ids
+    def test_slice_leaf_tasks_empty_list_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_structural(slice_id="slice-3", leaf_task_ids=[])
+        assert any(v.constraint_id == "C-slice-leaf-tasks" for v in violations)
 
-    def test_slice_leaf_tasks_not_run_when_slice_id_missing(self) -> None:
+    def test_slice_leaf_tasks_not_run_when_slice_id_missing(self, default_checker: RuntimeConstraintChecker) -> None:
         """check_slice_has_leaf_tasks skipped when slice_id not provided."""
-        checker = _make_checker()
         # Only leaf_task_ids provided, no slice_id — structural check skipped
-        violations = checker.check_structural(leaf_task_ids=[])
+        violations = default_checker.check_structural(leaf_task_ids=[])
         assert violations == []
 
-    def test_worker_gates_all_pass_no_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_structural(
+    def test_worker_gates_all_pass_no_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_structural(
             has_todos=False, tests_pass=True, typecheck_pass=True
         )
         assert violations == []
 
-    def test_worker_gates_failing_tests_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_structural(
+    def test_worker_gates_failing_tests_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_structural(
             has_todos=False, tests_pass=False, typecheck_pass=True
         )
-        ids = {v.constraint_id for v in violations}
-        assert "C-worker-gates" in ids
+        assert any(v.constraint_id == "C-worker-gates" for v in violations)
 
-    def test_vertical_slices_single_owner_no_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_structural(
+    def test_vertical_slices_single_owner_no_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_structural(
             production_code_path="scripts/constraints.py",
             owner_ids=["worker-3"],
         )
         assert violations == []
 
-    def test_vertical_slices_multiple_owners_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_structural(
+    def test_vertical_slices_multiple_owners_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_structural(
             production_code_path="scripts/constraints.py",
             owner_ids=["worker-1", "worker-2"],
         )
-        ids = {v.constraint_id for v in violations}
-        assert "C-vertical-slices" in ids
+        assert any(v.constraint_id == "C-vertical-slices" for v in violations)
 
-    def test_followup_timing_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_structural(
+    def test_followup_timing_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_structural(
             has_important_or_minor=True,
             followup_created=False,
         )
-        ids = {v.constraint_id for v in violations}
-        assert "C-followup-timing" in ids
+        assert any(v.constraint_id == "C-followup-timing" for v in violations)
 
-    def test_supervisor_no_impl_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_structural(role="supervisor", action_type="file_edit")
-        ids = {v.constraint_id for v in violations}
-        assert "C-supervisor-no-impl" in ids
+    def test_supervisor_no_impl_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_structural(role="supervisor", action_type="file_edit")
+        assert any(v.constraint_id == "C-supervisor-no-impl" for v in violations)
 
-    def test_supervisor_explore_ephemeral_violation_at_p8(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_structural(
+    def test_supervisor_explore_ephemeral_violation_at_p8(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_structural(
             phase=PhaseId.P8_ImplPlan,
             exploration_method="direct",
         )
-        ids = {v.constraint_id for v in violations}
-        assert "C-supervisor-explore-ephemeral" in ids
+        assert any(v.constraint_id == "C-supervisor-explore-ephemeral" for v in violations)
 
-    def test_integration_points_via_structural(self) -> None:
+    def test_integration_points_via_structural(self, default_checker: RuntimeConstraintChecker) -> None:
         """C-integration-points surfaces through check_structural()."""
-        checker = _make_checker()
-        violations = checker.check_structural(has_integration_points=False)
-        ids = {v.constraint_id for v in violations}
-        assert "C-integration-points" in ids
+        violations = default_checker.check_structural(has_integration_points=False)
+        assert any(v.constraint_id == "C-integration-points" for v in violations)
 
-    def test_slice_review_before_close_via_structural(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_structural(
+    def test_slice_review_before_close_via_structural(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_structural(
             slice_closed_by_worker=True,
             review_completed=False,
         )
-        ids = {v.constraint_id for v in violations}
-        assert "C-slice-review-before-close" in ids
+        assert any(v.constraint_id == "C-slice-review-before-close" for v in violations)
 
-    def test_max_review_cycles_via_structural(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_structural(review_cycle_count=4)
-        ids = {v.constraint_id for v in violations}
-        assert "C-max-review-cycles" in ids
+    def test_max_review_cycles_via_structural(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_structural(review_cycle_count=4)
+        assert any(v.constraint_id == "C-max-review-cycles" for v in violations)
 
-    def test_ure_verbatim_missing_question_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_structural(
+    def test_ure_verbatim_missing_question_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_structural(
             question="",
             options=["Option A"],
             response="Option A",
         )
-        ids = {v.constraint_id for v in violations}
-        assert "C-ure-verbatim" in ids
+        assert any(v.constraint_id == "C-ure-verbatim" for v in violations)
 
-    def test_frontmatter_refs_missing_key_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_structural(
+    def test_frontmatter_refs_missing_key_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_structural(
             task_description="## No frontmatter",
             required_ref_keys=["urd"],
         )
-        ids = {v.constraint_id for v in violations}
-        assert "C-frontmatter-refs" in ids
+        assert any(v.constraint_id == "C-frontmatter-refs" for v in violations)
 
-    def test_followup_leaf_adoption_missing_severity_group_returns_violation(self) -> None:
-        checker = _make_checker()
-        violations = checker.check_structural(
+    def test_followup_leaf_adoption_missing_severity_group_returns_violation(self, default_checker: RuntimeConstraintChecker) -> None:
+        violations = default_checker.check_structural(
             leaf_task_id="leaf-abc",
             severity_group_id="",
             followup_slice_id="followup-slice-456",
         )
-        ids = {v.constraint_id for v in violations}
-        assert "C-followup-leaf-adoption" in ids
+        assert any(v.constraint_id == "C-followup-leaf-adoption" for v in violations)
 
-    def test_multiple_structural_checks_run_together(self) -> None:
+    def test_multiple_structural_checks_run_together(self, default_checker: RuntimeConstraintChecker) -> None:
         """check_structural runs multiple checks simultaneously when kwargs supplied."""
-        checker = _make_checker()
-        violations = checker.check_structural(
+        violations = default_checker.check_structural(
             parent_id="same",
             child_id="same",  # triggers C-dep-direction
             vote="APPROVE",   # triggers C-review-binary
@@ -2006,10 +1853,9 @@ class TestCheckStructural:
         assert "C-dep-direction" in ids
         assert "C-review-binary" in ids
 
-    def test_does_not_short_circuit(self) -> None:
+    def test_does_not_short_circuit(self, default_checker: RuntimeConstraintChecker) -> None:
         """check_structural aggregates all violations, does not stop at first."""
-        checker = _make_checker()
-        violations = checker.check_structural(
+        violations = default_checker.check_structural(
             has_todos=True,
             tests_pass=False,
             typecheck_pass=False,
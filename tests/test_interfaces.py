@@ -36,6 +36,7 @@ from aura_protocol.interfaces import (
     ToolCall,
     ToolPermissionRequest,
     TranscriptRecorder,
+    satisfies_iface,
 )
 from aura_protocol.types import EventType, PhaseId, ReviewAxis, RoleId, VoteType
 
@@ -96,6 +97,54 @@ class TestConstraintValidatorInterfaceProtocol:
         assert isinstance(checker, ConstraintValidatorInterface)
 
 
+class TestSatisfiesIface:
+    """satisfies_iface: cached structural check matching isinstance() semantics."""
+
+    def test_true_for_matching_type(self) -> None:
+        """Given type with validate() when satisfies_iface checked then True."""
+
+        class ConcreteValidator:
+            def validate(self, state: object) -> list:
+                return []
+
+        assert satisfies_iface(ConcreteValidator, ConstraintValidatorInterface)
+
+    def test_false_for_non_matching_type(self) -> None:
+        """Given type without validate() when satisfies_iface checked then False."""
+
+        class NotAValidator:
+            def check(self, state: object) -> list:
+                return []
+
+        assert not satisfies_iface(NotAValidator, ConstraintValidatorInterface)
+
+    def test_agrees_with_isinstance(self) -> None:
+        """satisfies_iface(type(obj), Iface) must agree with isinstance(obj, Iface)."""
+        checker = RuntimeConstraintChecker()
+        assert satisfies_iface(type(checker), ConstraintValidatorInterface) == isinstance(
+            checker, ConstraintValidatorInterface
+        )
+        assert satisfies_iface(object, ConstraintValidatorInterface) == isinstance(
+            object(), ConstraintValidatorInterface
+        )
+
+    def test_repeated_calls_hit_cache(self) -> None:
+        """Second call for the same (type, interface) pair is a cache hit."""
+        satisfies_iface.cache_clear()
+        satisfies_iface(RuntimeConstraintChecker, ConstraintValidatorInterface)
+        satisfies_iface(RuntimeConstraintChecker, ConstraintValidatorInterface)
+        assert satisfies_iface.cache_info().hits >= 1
+
+    def test_multi_method_protocol(self) -> None:
+        """All Protocol members must be present — a partial match is False."""
+
+        class PartialRecorder:
+            async def record_phase_transition(self, event: object) -> None: ...
+
+        assert not satisfies_iface(PartialRecorder, TranscriptRecorder)
+        assert satisfies_iface(NullTranscriptRecorder, TranscriptRecorder)
+
+
 class TestTranscriptRecorderProtocol:
     """AC9: TranscriptRecorder structural subtyping."""
 
@@ -32,10 +32,20 @@ from aura_protocol.state_machine import (
     TransitionError,
     TransitionRecord,
 )
-from aura_protocol.types import PhaseId, ReviewAxis, RoleId, SeverityLevel, VoteType
+from aura_protocol.types import (
+    PHASE_SPECS,
+    Domain,
+    PhaseId,
+    PhaseSpec,
+    ReviewAxis,
+    RoleId,
+    SeverityLevel,
+    Transition,
+    VoteType,
+)
 
 # Import shared helpers from conftest (module-level, not fixtures).
-from conftest import _advance_to, _make_state
+from conftest import _advance_to, _make_state, _record_unanimous_accept
 
 
 # ─── Helpers ──────────────────────────────────────────────────────────────────
@@ -46,6 +56,11 @@ def _make_sm(epoch_id: str = "test-epoch") -> EpochStateMachine:
     return EpochStateMachine(epoch_id)
 
 
+def _targets(sm: EpochStateMachine) -> frozenset[PhaseId]:
+    """Return the set of phases reachable via the currently available transitions."""
+    return frozenset(t.to_phase for t in sm.available_transitions)
+
+
 # ─── AC1: State Machine Transitions ───────────────────────────────────────────
 
 
@@ -129,86 +144,82 @@ class TestAC1Transitions:
 # ─── AC2: Consensus Gate ──────────────────────────────────────────────────────
 
 
-class TestAC2ConsensusGate:
-    """AC2: Given epoch in P4 with 2/3 ACCEPT, advance(p5) → TransitionError."""
+# Consensus-gate scenarios for P4→P5: (votes to record, whether advance raises).
+# Every failing row fails on the consensus gate, so the violation message
+# always mentions consensus.
+CONSENSUS_CASES = [
+    pytest.param({}, True, id="no-votes"),
+    pytest.param({ReviewAxis.Correctness: VoteType.Accept}, True, id="1-of-3-accept"),
+    pytest.param(
+        {
+            ReviewAxis.Correctness: VoteType.Accept,
+            ReviewAxis.TestQuality: VoteType.Accept,
+        },
+        True,
+        id="2-of-3-accept",
+    ),
+    pytest.param(
+        {
+            ReviewAxis.Correctness: VoteType.Accept,
+            ReviewAxis.TestQuality: VoteType.Accept,
+            ReviewAxis.Elegance: VoteType.Revise,
+        },
+        True,
+        id="revise-vote",
+    ),
+    pytest.param(
+        {
+            ReviewAxis.Correctness: VoteType.Accept,
+            ReviewAxis.TestQuality: VoteType.Accept,
+            ReviewAxis.Elegance: VoteType.Accept,
+        },
+        False,
+        id="all-3-accept",
+    ),
+]
 
-    def _sm_at_p4(self) -> EpochStateMachine:
-        sm = _make_sm()
-        _advance_to(sm, PhaseId.P4_Review)
-        return sm
-
-    def test_advance_p4_to_p5_without_any_votes_raises(self) -> None:
-        sm = self._sm_at_p4()
-        with pytest.raises(TransitionError) as exc_info:
-            sm.advance(
-                PhaseId.P5_Uat,
-                triggered_by="test",
-                condition_met="premature",
-            )
-        assert exc_info.value.violations
-        assert "consensus" in exc_info.value.violations[0].lower()
 
-    def test_advance_p4_to_p5_with_2_of_3_accept_raises(self) -> None:
-        sm = self._sm_at_p4()
-        sm.record_vote(ReviewAxis.Correctness, VoteType.Accept)
-        sm.record_vote(ReviewAxis.TestQuality, VoteType.Accept)
-        # C axis not voted
+class TestAC2ConsensusGate:
+    """AC2: Given epoch in P4 with 2/3 ACCEPT, advance(p5) → TransitionError."""
 
-        with pytest.raises(TransitionError) as exc_info:
-            sm.advance(
-                PhaseId.P5_Uat,
-                triggered_by="test",
-                condition_met="2/3 ACCEPT",
+    @pytest.mark.parametrize("votes,should_raise", CONSENSUS_CASES)
+    def test_advance_p4_to_p5_consensus_gate(
+        self,
+        sm_at_p4: EpochStateMachine,
+        votes: dict[ReviewAxis, VoteType],
+        should_raise: bool,
+    ) -> None:
+        for axis, vote in votes.items():
+            sm_at_p4.record_vote(axis, vote)
+
+        if should_raise:
+            with pytest.raises(TransitionError) as exc_info:
+                sm_at_p4.advance(
+                    PhaseId.P5_Uat, triggered_by="test", condition_met="gate check"
+                )
+            assert exc_info.value.violations
+            assert "consensus" in exc_info.value.violations[0].lower()
+            assert sm_at_p4.state.current_phase == PhaseId.P4_Review
+        else:
+            record = sm_at_p4.advance(
+                PhaseId.P5_Uat, triggered_by="reviewer", condition_met="all 3 vote ACCEPT"
             )
-        assert exc_info.value.violations
-        assert "consensus" in exc_info.value.violations[0].lower()
-
-    def test_advance_p4_to_p5_with_all_3_accept_succeeds(self) -> None:
-        sm = self._sm_at_p4()
-        sm.record_vote(ReviewAxis.Correctness, VoteType.Accept)
-        sm.record_vote(ReviewAxis.TestQuality, VoteType.Accept)
-        sm.record_vote(ReviewAxis.Elegance, VoteType.Accept)
-
-        record = sm.advance(
-            PhaseId.P5_Uat, triggered_by="reviewer", condition_met="all 3 vote ACCEPT"
-        )
-        assert sm.state.current_phase == PhaseId.P5_Uat
-        assert record.from_phase == PhaseId.P4_Review
-        assert record.to_phase == PhaseId.P5_Uat
-
-    def test_advance_p4_to_p5_with_1_of_3_accept_raises(self) -> None:
-        sm = self._sm_at_p4()
-        sm.record_vote(ReviewAxis.Correctness, VoteType.Accept)
-        # B and C not voted
-
-        with pytest.raises(TransitionError):
-            sm.advance(PhaseId.P5_Uat, triggered_by="test", condition_met="1/3 ACCEPT")
+            assert sm_at_p4.state.current_phase == PhaseId.P5_Uat
+            assert record.from_phase == PhaseId.P4_Review
+            assert record.to_phase == PhaseId.P5_Uat
 
-    def test_advance_p4_to_p5_with_revise_vote_raises(self) -> None:
-        sm = self._sm_at_p4()
-        sm.record_vote(ReviewAxis.Correctness, VoteType.Accept)
-        sm.record_vote(ReviewAxis.TestQuality, VoteType.Accept)
-        sm.record_vote(ReviewAxis.Elegance, VoteType.Revise)
-
-        with pytest.raises(TransitionError):
-            sm.advance(PhaseId.P5_Uat, triggered_by="test", condition_met="has revise")
+    def test_validate_advance_returns_violations_for_missing_consensus(self, sm_at_p4: EpochStateMachine) -> None:
+        sm_at_p4.record_vote(ReviewAxis.Correctness, VoteType.Accept)
+        sm_at_p4.record_vote(ReviewAxis.TestQuality, VoteType.Accept)
 
-    def test_validate_advance_returns_violations_for_missing_consensus(self) -> None:
-        sm = self._sm_at_p4()
-        sm.record_vote(ReviewAxis.Correctness, VoteType.Accept)
-        sm.record_vote(ReviewAxis.TestQuality, VoteType.Accept)
-
-        violations = sm.validate_advance(PhaseId.P5_Uat)
+        violations = sm_at_p4.validate_advance(PhaseId.P5_Uat)
         assert len(violations) == 1
         assert "consensus" in violations[0].lower()
 
-    def test_validate_advance_returns_empty_when_consensus_met(self) -> None:
-        sm = self._sm_at_p4()
-        sm.record_vote(ReviewAxis.Correctness, VoteType.Accept)
-        sm.record_vote(ReviewAxis.TestQuality, VoteType.Accept)
-        sm.record_vote(ReviewAxis.Elegance, VoteType.Accept)
+    def test_validate_advance_returns_empty_when_consensus_met(self, sm_at_p4: EpochStateMachine) -> None:
+        _record_unanimous_accept(sm_at_p4)
 
-        violations = sm.validate_advance(PhaseId.P5_Uat)
+        violations = sm_at_p4.validate_advance(PhaseId.P5_Uat)
         assert violations == []
 
 
@@ -218,64 +229,50 @@ class TestAC2ConsensusGate:
 class TestAC3RevisionLoop:
     """AC3: Given epoch in P4 with REVISE, available_transitions → only p3."""
 
-    def _sm_at_p4(self) -> EpochStateMachine:
-        sm = _make_sm()
-        _advance_to(sm, PhaseId.P4_Review)
-        return sm
+    def test_at_p4_with_revise_only_p3_available(self, sm_at_p4: EpochStateMachine) -> None:
+        sm_at_p4.record_vote(ReviewAxis.Correctness, VoteType.Revise)
 
-    def test_at_p4_with_revise_only_p3_available(self) -> None:
-        sm = self._sm_at_p4()
-        sm.record_vote(ReviewAxis.Correctness, VoteType.Revise)
-
-        targets = {t.to_phase for t in sm.available_transitions}
+        targets = _targets(sm_at_p4)
         assert targets == {PhaseId.P3_Propose}
 
-    def test_at_p4_with_revise_on_any_axis_only_p3_available(self) -> None:
-        sm = self._sm_at_p4()
-        sm.record_vote(ReviewAxis.Correctness, VoteType.Accept)
-        sm.record_vote(ReviewAxis.TestQuality, VoteType.Accept)
-        sm.record_vote(ReviewAxis.Elegance, VoteType.Revise)
+    def test_at_p4_with_revise_on_any_axis_only_p3_available(self, sm_at_p4: EpochStateMachine) -> None:
+        sm_at_p4.record_vote(ReviewAxis.Correctness, VoteType.Accept)
+        sm_at_p4.record_vote(ReviewAxis.TestQuality, VoteType.Accept)
+        sm_at_p4.record_vote(ReviewAxis.Elegance, VoteType.Revise)
 
-        targets = {t.to_phase for t in sm.available_transitions}
+        targets = _targets(sm_at_p4)
         assert targets == {PhaseId.P3_Propose}
 
-    def test_at_p4_without_votes_no_forward_transition(self) -> None:
+    def test_at_p4_without_votes_no_forward_transition(self, sm_at_p4: EpochStateMachine) -> None:
         """Without consensus and without REVISE, p5 is NOT available (no votes = not qualified)."""
-        sm = self._sm_at_p4()
         # No votes recorded
 
-        targets = {t.to_phase for t in sm.available_transitions}
+        targets = _targets(sm_at_p4)
         # p5 requires consensus (not reached), so only p3 (the non-gated transition) is available.
         assert PhaseId.P5_Uat not in targets
 
-    def test_at_p4_with_all_accept_p5_available(self) -> None:
-        sm = self._sm_at_p4()
-        sm.record_vote(ReviewAxis.Correctness, VoteType.Accept)
-        sm.record_vote(ReviewAxis.TestQuality, VoteType.Accept)
-        sm.record_vote(ReviewAxis.Elegance, VoteType.Accept)
+    def test_at_p4_with_all_accept_p5_available(self, sm_at_p4: EpochStateMachine) -> None:
+        _record_unanimous_accept(sm_at_p4)
 
-        targets = {t.to_phase for t in sm.available_transitions}
+        targets = _targets(sm_at_p4)
         # With consensus, p5 is available (and p3 is also a valid transition per spec).
         assert PhaseId.P5_Uat in targets
 
-    def test_at_p10_with_revise_only_p9_available(self) -> None:
-        sm = _make_sm()
-        _advance_to(sm, PhaseId.P10_CodeReview)
-        sm.record_vote(ReviewAxis.Correctness, VoteType.Revise)
+    def test_at_p10_with_revise_only_p9_available(self, sm_at_p10: EpochStateMachine) -> None:
+        sm_at_p10.record_vote(ReviewAxis.Correctness, VoteType.Revise)
 
-        targets = {t.to_phase for t in sm.available_transitions}
+        targets = _targets(sm_at_p10)
         assert targets == {PhaseId.P9_Slice}
 
-    def test_advance_to_p3_from_p4_allowed_with_revise(self) -> None:
-        sm = self._sm_at_p4()
-        sm.record_vote(ReviewAxis.TestQuality, VoteType.Revise)
+    def test_advance_to_p3_from_p4_allowed_with_revise(self, sm_at_p4: EpochStateMachine) -> None:
+        sm_at_p4.record_vote(ReviewAxis.TestQuality, VoteType.Revise)
 
         # Should not raise
-        record = sm.advance(
+        record = sm_at_p4.advance(
             PhaseId.P3_Propose, triggered_by="reviewer", condition_met="any reviewer votes REVISE"
         )
         assert record.to_phase == PhaseId.P3_Propose
-        assert sm.state.current_phase == PhaseId.P3_Propose
+        assert sm_at_p4.state.current_phase == PhaseId.P3_Propose
 
 
 # ─── AC4: BLOCKER Gate ────────────────────────────────────────────────────────
@@ -284,20 +281,12 @@ class TestAC3RevisionLoop:
 class TestAC4BlockerGate:
     """AC4: Given epoch in P10 with blockers > 0, advance(p11) → TransitionError."""
 
-    def _sm_at_p10(self) -> EpochStateMachine:
-        sm = _make_sm()
-        _advance_to(sm, PhaseId.P10_CodeReview)
-        return sm
-
-    def test_advance_p10_to_p11_with_blocker_raises(self) -> None:
-        sm = self._sm_at_p10()
-        sm.record_blocker()  # 1 unresolved blocker
-        sm.record_vote(ReviewAxis.Correctness, VoteType.Accept)
-        sm.record_vote(ReviewAxis.TestQuality, VoteType.Accept)
-        sm.record_vote(ReviewAxis.Elegance, VoteType.Accept)
+    def test_advance_p10_to_p11_with_blocker_raises(self, sm_at_p10: EpochStateMachine) -> None:
+        sm_at_p10.record_blocker()  # 1 unresolved blocker
+        _record_unanimous_accept(sm_at_p10)
 
         with pytest.raises(TransitionError) as exc_info:
-            sm.advance(
+            sm_at_p10.advance(
                 PhaseId.P11_ImplUat,
                 triggered_by="test",
                 condition_met="has blockers",
@@ -305,69 +294,56 @@ class TestAC4BlockerGate:
         assert exc_info.value.violations
         assert "blocker" in exc_info.value.violations[0].lower()
 
-    def test_advance_p10_to_p11_with_resolved_blockers_succeeds(self) -> None:
-        sm = self._sm_at_p10()
-        sm.record_blocker()   # +1 → count = 1
-        sm.record_blocker(resolved=True)  # -1 → count = 0
-        sm.record_vote(ReviewAxis.Correctness, VoteType.Accept)
-        sm.record_vote(ReviewAxis.TestQuality, VoteType.Accept)
-        sm.record_vote(ReviewAxis.Elegance, VoteType.Accept)
+    def test_advance_p10_to_p11_with_resolved_blockers_succeeds(self, sm_at_p10: EpochStateMachine) -> None:
+        sm_at_p10.record_blocker()   # +1 → count = 1
+        sm_at_p10.record_blocker(resolved=True)  # -1 → count = 0
+        _record_unanimous_accept(sm_at_p10)
 
-        record = sm.advance(
+        record = sm_at_p10.advance(
             PhaseId.P11_ImplUat,
             triggered_by="supervisor",
             condition_met="all BLOCKERs resolved",
         )
         assert record.to_phase == PhaseId.P11_ImplUat
 
-    def test_advance_p10_to_p11_without_blockers_and_with_consensus_succeeds(self) -> None:
-        sm = self._sm_at_p10()
-        sm.record_vote(ReviewAxis.Correctness, VoteType.Accept)
-        sm.record_vote(ReviewAxis.TestQuality, VoteType.Accept)
-        sm.record_vote(ReviewAxis.Elegance, VoteType.Accept)
+    def test_advance_p10_to_p11_without_blockers_and_with_consensus_succeeds(self, sm_at_p10: EpochStateMachine) -> None:
+        _record_unanimous_accept(sm_at_p10)
 
-        record = sm.advance(
+        record = sm_at_p10.advance(
             PhaseId.P11_ImplUat,
             triggered_by="supervisor",
             condition_met="all BLOCKERs resolved, all 3 ACCEPT",
         )
         assert record.to_phase == PhaseId.P11_ImplUat
 
-    def test_blocker_count_increments(self) -> None:
-        sm = self._sm_at_p10()
-        assert sm.state.blocker_count == 0
-        sm.record_blocker()
-        assert sm.state.blocker_count == 1
-        sm.record_blocker()
-        assert sm.state.blocker_count == 2
-
-    def test_blocker_count_decrements_on_resolved(self) -> None:
-        sm = self._sm_at_p10()
-        sm.record_blocker()
-        sm.record_blocker()
-        sm.record_blocker(resolved=True)
-        assert sm.state.blocker_count == 1
-
-    def test_blocker_count_clamped_at_zero(self) -> None:
-        sm = self._sm_at_p10()
-        sm.record_blocker(resolved=True)  # already at 0
-        assert sm.state.blocker_count == 0
-
-    def test_p11_not_in_available_when_blockers_present(self) -> None:
-        sm = self._sm_at_p10()
-        sm.record_blocker()
-
-        targets = {t.to_phase for t in sm.available_transitions}
+    def test_blocker_count_increments(self, sm_at_p10: EpochStateMachine) -> None:
+        assert sm_at_p10.state.blocker_count == 0
+        sm_at_p10.record_blocker()
+        assert sm_at_p10.state.blocker_count == 1
+        sm_at_p10.record_blocker()
+        assert sm_at_p10.state.blocker_count == 2
+
+    def test_blocker_count_decrements_on_resolved(self, sm_at_p10: EpochStateMachine) -> None:
+        sm_at_p10.record_blocker()
+        sm_at_p10.record_blocker()
+        sm_at_p10.record_blocker(resolved=True)
+        assert sm_at_p10.state.blocker_count == 1
+
+    def test_blocker_count_clamped_at_zero(self, sm_at_p10: EpochStateMachine) -> None:
+        sm_at_p10.record_blocker(resolved=True)  # already at 0
+        assert sm_at_p10.state.blocker_count == 0
+
+    def test_p11_not_in_available_when_blockers_present(self, sm_at_p10: EpochStateMachine) -> None:
+        sm_at_p10.record_blocker()
+
+        targets = _targets(sm_at_p10)
         assert PhaseId.P11_ImplUat not in targets
 
-    def test_validate_advance_returns_blocker_violation(self) -> None:
-        sm = self._sm_at_p10()
-        sm.record_blocker()
-        sm.record_vote(ReviewAxis.Correctness, VoteType.Accept)
-        sm.record_vote(ReviewAxis.TestQuality, VoteType.Accept)
-        sm.record_vote(ReviewAxis.Elegance, VoteType.Accept)
+    def test_validate_advance_returns_blocker_violation(self, sm_at_p10: EpochStateMachine) -> None:
+        sm_at_p10.record_blocker()
+        _record_unanimous_accept(sm_at_p10)
 
-        violations = sm.validate_advance(PhaseId.P11_ImplUat)
+        violations = sm_at_p10.validate_advance(PhaseId.P11_ImplUat)
         assert len(violations) == 1
         assert "blocker" in violations[0].lower()
 
@@ -420,30 +396,22 @@ class TestSequentialProgression:
         _advance_to(sm, PhaseId.Complete)
         assert sm.state.current_phase == PhaseId.Complete
 
-    def test_full_progression_records_12_transitions(self) -> None:
-        sm = _make_sm()
-        _advance_to(sm, PhaseId.Complete)
+    def test_full_progression_records_12_transitions(self, sm_complete: EpochStateMachine) -> None:
         # p1→p2, p2→p3, ..., p12→complete = 12 transitions
-        assert len(sm.state.transition_history) == 12
+        assert len(sm_complete.state.transition_history) == 12
 
-    def test_full_progression_completes_all_12_phases(self) -> None:
-        sm = _make_sm()
-        _advance_to(sm, PhaseId.Complete)
+    def test_full_progression_completes_all_12_phases(self, sm_complete: EpochStateMachine) -> None:
         expected = {p for p in PhaseId if p != PhaseId.Complete}
-        assert sm.state.completed_phases == expected
+        assert sm_complete.state.completed_phases == expected
 
-    def test_no_transition_from_complete(self) -> None:
-        sm = _make_sm()
-        _advance_to(sm, PhaseId.Complete)
+    def test_no_transition_from_complete(self, sm_complete: EpochStateMachine) -> None:
         with pytest.raises(TransitionError) as exc_info:
-            sm.advance(PhaseId.P1_Request, triggered_by="test", condition_met="restart")
+            sm_complete.advance(PhaseId.P1_Request, triggered_by="test", condition_met="restart")
         assert exc_info.value.violations
         assert "COMPLETE" in exc_info.value.violations[0]
 
-    def test_available_transitions_empty_at_complete(self) -> None:
-        sm = _make_sm()
-        _advance_to(sm, PhaseId.Complete)
-        assert sm.available_transitions == []
+    def test_available_transitions_empty_at_complete(self, sm_complete: EpochStateMachine) -> None:
+        assert sm_complete.available_transitions == []
 
 
 # ─── Vote Recording and Clearing ──────────────────────────────────────────────
@@ -481,29 +449,72 @@ class TestVoteRecording:
         sm.record_vote(ReviewAxis.Elegance, VoteType.Accept)
         assert len(sm.state.review_votes) == 3
 
-    def test_has_consensus_false_with_no_votes(self) -> None:
+    def test_record_votes_applies_batch(self) -> None:
         sm = _make_sm()
-        assert sm.has_consensus() is False
+        sm.record_votes(
+            [
+                (ReviewAxis.Correctness, VoteType.Accept),
+                (ReviewAxis.TestQuality, VoteType.Revise),
+                (ReviewAxis.Elegance, VoteType.Accept),
+            ]
+        )
+        assert len(sm.state.review_votes) == 3
+        assert sm.state.review_votes[ReviewAxis.TestQuality] == VoteType.Revise
 
-    def test_has_consensus_false_with_partial_votes(self) -> None:
+    def test_record_votes_later_vote_overwrites_earlier(self) -> None:
         sm = _make_sm()
-        sm.record_vote(ReviewAxis.Correctness, VoteType.Accept)
-        sm.record_vote(ReviewAxis.TestQuality, VoteType.Accept)
-        assert sm.has_consensus() is False
+        sm.record_votes(
+            [
+                (ReviewAxis.Correctness, VoteType.Revise),
+                (ReviewAxis.Correctness, VoteType.Accept),
+            ]
+        )
+        assert sm.state.review_votes[ReviewAxis.Correctness] == VoteType.Accept
 
-    def test_has_consensus_false_with_revise(self) -> None:
+    def test_record_votes_invalid_axis_raises_value_error(self) -> None:
         sm = _make_sm()
-        sm.record_vote(ReviewAxis.Correctness, VoteType.Accept)
-        sm.record_vote(ReviewAxis.TestQuality, VoteType.Accept)
-        sm.record_vote(ReviewAxis.Elegance, VoteType.Revise)
-        assert sm.has_consensus() is False
-
-    def test_has_consensus_true_with_all_accept(self) -> None:
+        with pytest.raises(ValueError):
+            sm.record_votes([("X", VoteType.Accept)])
+
+    @pytest.mark.parametrize(
+        "votes,expected",
+        [
+            pytest.param({}, False, id="no-votes"),
+            pytest.param(
+                {
+                    ReviewAxis.Correctness: VoteType.Accept,
+                    ReviewAxis.TestQuality: VoteType.Accept,
+                },
+                False,
+                id="partial-votes",
+            ),
+            pytest.param(
+                {
+                    ReviewAxis.Correctness: VoteType.Accept,
+                    ReviewAxis.TestQuality: VoteType.Accept,
+                    ReviewAxis.Elegance: VoteType.Revise,
+                },
+                False,
+                id="revise-vote",
+            ),
+            pytest.param(
+                {
+                    ReviewAxis.Correctness: VoteType.Accept,
+                    ReviewAxis.TestQuality: VoteType.Accept,
+                    ReviewAxis.Elegance: VoteType.Accept,
+                },
+                True,
+                id="all-accept",
+            ),
+        ],
+    )
+    def test_has_consensus(
+        self, votes: dict[ReviewAxis, VoteType], expected: bool
+    ) -> None:
         sm = _make_sm()
-        sm.record_vote(ReviewAxis.Correctness, VoteType.Accept)
-        sm.record_vote(ReviewAxis.TestQuality, VoteType.Accept)
-        sm.record_vote(ReviewAxis.Elegance, VoteType.Accept)
-        assert sm.has_consensus() is True
+        for axis, vote in votes.items():
+            sm.record_vote(axis, vote)
+        assert sm.has_consensus() is expected
 
     def test_review_votes_keys_are_review_axis_members(self) -> None:
         """review_votes dict keys must be ReviewAxis members, not raw strings."""
@@ -548,6 +559,41 @@ class TestStateProperty:
         assert sm.state.epoch_id == "my-epoch-id"
 
 
+# ─── clone() Snapshot Copies ──────────────────────────────────────────────────
+
+
+class TestClone:
+    """clone() returns an independent machine sharing only immutable data."""
+
+    def test_clone_preserves_state(self) -> None:
+        sm = _make_sm()
+        _advance_to(sm, PhaseId.P4_Review)
+        cloned = sm.clone()
+        assert cloned.state.current_phase == PhaseId.P4_Review
+        assert cloned.state.completed_phases == sm.state.completed_phases
+        assert cloned.state.transition_history == sm.state.transition_history
+
+    def test_clone_advance_does_not_affect_original(self) -> None:
+        sm = _make_sm()
+        cloned = sm.clone()
+        cloned.advance(PhaseId.P2_Elicit, triggered_by="test", condition_met="ok")
+        assert sm.state.current_phase == PhaseId.P1_Request
+        assert sm.state.transition_history == []
+
+    def test_clone_votes_are_independent(self) -> None:
+        sm = _make_sm()
+        cloned = sm.clone()
+        cloned.record_vote(ReviewAxis.Correctness, VoteType.Accept)
+        assert sm.state.review_votes == {}
+
+    def test_clone_severity_sets_are_independent(self) -> None:
+        sm = _make_sm()
+        _advance_to(sm, PhaseId.P10_CodeReview)
+        cloned = sm.clone()
+        cloned.state.severity_groups[SeverityLevel.Blocker].add("finding-xyz")
+        assert "finding-xyz" not in sm.state.severity_groups[SeverityLevel.Blocker]
+
+
 # ─── validate_advance Dry-Run ─────────────────────────────────────────────────
 
 
@@ -570,10 +616,8 @@ class TestValidateAdvance:
         assert sm.state.current_phase == PhaseId.P1_Request
         assert sm.state.transition_history == []
 
-    def test_from_complete_returns_violation(self) -> None:
-        sm = _make_sm()
-        _advance_to(sm, PhaseId.Complete)
-        violations = sm.validate_advance(PhaseId.P1_Request)
+    def test_from_complete_returns_violation(self, sm_complete: EpochStateMachine) -> None:
+        violations = sm_complete.validate_advance(PhaseId.P1_Request)
         assert violations
         assert "COMPLETE" in violations[0]
 
@@ -601,8 +645,6 @@ class TestDependencyInjection:
     """Custom specs can be injected for testing minimal state machines."""
 
     def test_custom_specs_used(self) -> None:
-        from aura_protocol.types import Domain, PhaseSpec, Transition
-
         # Minimal 2-phase spec: p1 → p2 → complete
         custom_specs = {
             PhaseId.P1_Request: PhaseSpec(
@@ -639,7 +681,6 @@ class TestDependencyInjection:
         assert sm.state.current_phase == PhaseId.Complete
 
     def test_default_specs_are_phase_specs(self) -> None:
-        from aura_protocol.types import PHASE_SPECS
         sm = _make_sm()
         # The machine starts at p1 and p2 must be in PHASE_SPECS
         assert PhaseId.P1_Request in PHASE_SPECS
@@ -708,15 +749,9 @@ class TestAdvanceTimestamp:
 class TestP10ConsensusGate:
     """AC3 (extension): P10→P11 without consensus raises TransitionError (same as P4→P5)."""
 
-    def _sm_at_p10(self) -> EpochStateMachine:
-        sm = _make_sm()
-        _advance_to(sm, PhaseId.P10_CodeReview)
-        return sm
-
-    def test_advance_p10_to_p11_without_votes_raises(self) -> None:
-        sm = self._sm_at_p10()
+    def test_advance_p10_to_p11_without_votes_raises(self, sm_at_p10: EpochStateMachine) -> None:
         with pytest.raises(TransitionError) as exc_info:
-            sm.advance(
+            sm_at_p10.advance(
                 PhaseId.P11_ImplUat,
                 triggered_by="test",
                 condition_met="premature",
@@ -724,13 +759,12 @@ class TestP10ConsensusGate:
         assert exc_info.value.violations
         assert "consensus" in exc_info.value.violations[0].lower()
 
-    def test_advance_p10_to_p11_with_2_of_3_accept_raises(self) -> None:
-        sm = self._sm_at_p10()
-        sm.record_vote(ReviewAxis.Correctness, VoteType.Accept)
-        sm.record_vote(ReviewAxis.TestQuality, VoteType.Accept)
+    def test_advance_p10_to_p11_with_2_of_3_accept_raises(self, sm_at_p10: EpochStateMachine) -> None:
+        sm_at_p10.record_vote(ReviewAxis.Correctness, VoteType.Accept)
+        sm_at_p10.record_vote(ReviewAxis.TestQuality, VoteType.Accept)
         # C axis not voted
         with pytest.raises(TransitionError) as exc_info:
-            sm.advance(
+            sm_at_p10.advance(
                 PhaseId.P11_ImplUat,
                 triggered_by="test",
                 condition_met="2/3 ACCEPT",
@@ -738,33 +772,26 @@ class TestP10ConsensusGate:
         assert exc_info.value.violations
         assert "consensus" in exc_info.value.violations[0].lower()
 
-    def test_advance_p10_to_p11_with_all_3_accept_and_no_blockers_succeeds(self) -> None:
-        sm = self._sm_at_p10()
-        sm.record_vote(ReviewAxis.Correctness, VoteType.Accept)
-        sm.record_vote(ReviewAxis.TestQuality, VoteType.Accept)
-        sm.record_vote(ReviewAxis.Elegance, VoteType.Accept)
-        record = sm.advance(
+    def test_advance_p10_to_p11_with_all_3_accept_and_no_blockers_succeeds(self, sm_at_p10: EpochStateMachine) -> None:
+        _record_unanimous_accept(sm_at_p10)
+        record = sm_at_p10.advance(
             PhaseId.P11_ImplUat,
             triggered_by="supervisor",
             condition_met="all 3 ACCEPT, no blockers",
         )
         assert record.to_phase == PhaseId.P11_ImplUat
 
-    def test_validate_advance_returns_consensus_violation_at_p10(self) -> None:
-        sm = self._sm_at_p10()
-        sm.record_vote(ReviewAxis.Correctness, VoteType.Accept)
-        sm.record_vote(ReviewAxis.TestQuality, VoteType.Accept)
+    def test_validate_advance_returns_consensus_violation_at_p10(self, sm_at_p10: EpochStateMachine) -> None:
+        sm_at_p10.record_vote(ReviewAxis.Correctness, VoteType.Accept)
+        sm_at_p10.record_vote(ReviewAxis.TestQuality, VoteType.Accept)
 
-        violations = sm.validate_advance(PhaseId.P11_ImplUat)
+        violations = sm_at_p10.validate_advance(PhaseId.P11_ImplUat)
         assert any("consensus" in v.lower() for v in violations)
 
-    def test_validate_advance_no_violation_when_consensus_met_at_p10(self) -> None:
-        sm = self._sm_at_p10()
-        sm.record_vote(ReviewAxis.Correctness, VoteType.Accept)
-        sm.record_vote(ReviewAxis.TestQuality, VoteType.Accept)
-        sm.record_vote(ReviewAxis.Elegance, VoteType.Accept)
+    def test_validate_advance_no_violation_when_consensus_met_at_p10(self, sm_at_p10: EpochStateMachine) -> None:
+        _record_unanimous_accept(sm_at_p10)
 
-        violations = sm.validate_advance(PhaseId.P11_ImplUat)
+        violations = sm_at_p10.validate_advance(PhaseId.P11_ImplUat)
         assert violations == []
 
 
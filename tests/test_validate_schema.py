@@ -248,6 +248,63 @@ class TestCLI:
         assert "error(s) found" in result.stdout
 
 
+# ─── Batch application ───────────────────────────────────────────────────────
+
+
+class TestApplyMany:
+    """apply_many should match per-call apply_mutation semantics."""
+
+    def test_apply_many_detects_every_mutation(self, schema_fixture: SchemaFixture):
+        """Batch application yields one independently mutated root per mutation."""
+        pairs = schema_fixture.apply_many(schema_fixture.generate_all_mutations())
+        assert len(pairs) == len(ALL_MUTATIONS)
+        for mutation, root in pairs:
+            errors = validate_tree(root)
+            assert any(
+                e.layer == mutation.layer and mutation.expected_fragment in e.message
+                for e in errors
+            ), f"apply_many missed mutation '{mutation.name}'"
+
+    def test_apply_many_empty_iterable(self, schema_fixture: SchemaFixture):
+        assert schema_fixture.apply_many([]) == []
+
+    def test_apply_mutations_stacks_on_one_root(self, schema_fixture: SchemaFixture):
+        """apply_mutations combines independent mutations on a single copy."""
+        combined = [STRUCTURAL_MUTATIONS[0], REFERENTIAL_MUTATIONS[2]]
+        root = schema_fixture.apply_mutations(combined)
+        errors = validate_tree(root)
+        for mutation in combined:
+            assert any(
+                e.layer == mutation.layer and mutation.expected_fragment in e.message
+                for e in errors
+            ), f"combined root missing error for '{mutation.name}'"
+
+    def test_apply_mutations_empty_returns_valid_root(
+        self, schema_fixture: SchemaFixture
+    ):
+        root = schema_fixture.apply_mutations([])
+        assert validate_tree(root) == []
+
+    def test_batch_del_attrs_single_walk(self, schema_fixture: SchemaFixture):
+        """_batch_del_attrs services several deletions in one tree pass."""
+        from fixtures.schema_fixture import _batch_del_attrs
+
+        mutation = SchemaMutation(
+            name="batched_deletions",
+            layer=ErrorLayer.STRUCTURAL,
+            description="Phase domain and substep order deleted in one walk",
+            expected_fragment="domain",
+            category="batch",
+            op=_batch_del_attrs(
+                [("phase", "p1", "domain"), ("substep", "s1", "order")]
+            ),
+        )
+        root = schema_fixture.apply_mutation(mutation)
+        messages = [e.message for e in validate_tree(root)]
+        assert any("domain" in m for m in messages)
+        assert any("order" in m for m in messages)
+
+
 # ─── Fixture statistics ──────────────────────────────────────────────────────
 
 
@@ -38,7 +38,7 @@ import functools
 import inspect
 import os
 from dataclasses import fields
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
 
 import pytest
 import pytest_asyncio
@@ -50,7 +50,14 @@ from aura_protocol.state_machine import (
     TransitionError,
     TransitionRecord,
 )
-from aura_protocol.types import EventType, PhaseId, ReviewAxis, Transition, VoteType
+from aura_protocol.types import (
+    PHASE_DOMAIN,
+    EventType,
+    PhaseId,
+    ReviewAxis,
+    Transition,
+    VoteType,
+)
 from aura_protocol.workflow import (
     SA_DOMAIN,
     SA_EPOCH_ID,
@@ -72,6 +79,7 @@ from aura_protocol.workflow import (
     SliceWorkflow,
     check_constraints,
     record_transition,
+    record_transitions,
 )
 from conftest import _advance_to
 from temporalio.common import SearchAttributeKey
@@ -82,7 +90,7 @@ from temporalio.testing import ActivityEnvironment
 # Centralized list of @activity.defn functions registered with Temporal workers
 # in sandbox tests. Extend here when new activity modules are added.
 
-_TEMPORAL_ACTIVITIES: list = [check_constraints, record_transition]
+_TEMPORAL_ACTIVITIES: list = [check_constraints, record_transition, record_transitions]
 
 try:
     from aura_protocol.audit_activities import (
@@ -95,6 +103,7 @@ try:
     _TEMPORAL_ACTIVITIES = [
         check_constraints,
         record_transition,
+        record_transitions,
         record_audit_event,
         query_audit_events,
     ]
@@ -112,115 +121,153 @@ def _make_sm(epoch_id: str = "test-epoch") -> EpochStateMachine:
     return EpochStateMachine(epoch_id)
 
 
-# ─── L1: Type Definitions ─────────────────────────────────────────────────────
+# Fixed timestamp for TransitionRecord construction in activity tests.
+# record_transition/record_transitions are v1 no-op stubs that never inspect
+# the timestamp, so a constant keeps the tests deterministic (AC6: no
+# non-deterministic ops) and avoids a datetime.now() call per record.
+_FIXED_TS = datetime(2024, 1, 1, tzinfo=timezone.utc)
 
 
-class TestSearchAttributeKeys:
-    """Search attribute keys are correctly named and typed."""
+@pytest.fixture(scope="module")
+def activity_env() -> ActivityEnvironment:
+    """Module-scoped ActivityEnvironment shared by all activity tests.
 
-    def test_sa_epoch_id_is_text(self) -> None:
-        """SA_EPOCH_ID must be a text key named 'AuraEpochId'."""
-        assert SA_EPOCH_ID.name == "AuraEpochId"
-        # text keys accept str values — verify value_set works
-        update = SA_EPOCH_ID.value_set("epoch-123")
-        assert update is not None
+    ActivityEnvironment holds no per-run state — env.run() just executes the
+    activity in-process with an activity context — so one instance can serve
+    every activity test instead of being rebuilt per test.
+    """
+    return ActivityEnvironment()
 
-    def test_sa_phase_is_keyword(self) -> None:
-        """SA_PHASE must be a keyword key named 'AuraPhase'."""
-        assert SA_PHASE.name == "AuraPhase"
-        update = SA_PHASE.value_set("p9")
-        assert update is not None
 
-    def test_sa_role_is_keyword(self) -> None:
-        """SA_ROLE must be a keyword key named 'AuraRole'."""
-        assert SA_ROLE.name == "AuraRole"
-        update = SA_ROLE.value_set("supervisor")
-        assert update is not None
+# ─── L1: Type Definitions ─────────────────────────────────────────────────────
 
-    def test_sa_status_is_keyword(self) -> None:
-        """SA_STATUS must be a keyword key named 'AuraStatus'."""
-        assert SA_STATUS.name == "AuraStatus"
-        update = SA_STATUS.value_set("running")
-        assert update is not None
 
-    def test_sa_domain_is_keyword(self) -> None:
-        """SA_DOMAIN must be a keyword key named 'AuraDomain'."""
-        assert SA_DOMAIN.name == "AuraDomain"
-        update = SA_DOMAIN.value_set("impl")
-        assert update is not None
+class TestSearchAttributeKeys:
+    """Search attribute keys are correctly named and typed."""
+
+    @pytest.mark.parametrize(
+        "key,name,sample_value",
+        [
+            pytest.param(SA_EPOCH_ID, "AuraEpochId", "epoch-123", id="epoch_id"),
+            pytest.param(SA_PHASE, "AuraPhase", "p9", id="phase"),
+            pytest.param(SA_ROLE, "AuraRole", "supervisor", id="role"),
+            pytest.param(SA_STATUS, "AuraStatus", "running", id="status"),
+            pytest.param(SA_DOMAIN, "AuraDomain", "impl", id="domain"),
+        ],
+    )
+    def test_sa_key_name_and_value_set(
+        self, key: SearchAttributeKey, name: str, sample_value: str
+    ) -> None:
+        """Each SA_* constant is a SearchAttributeKey with the expected name.
 
-    def test_all_sa_keys_are_search_attribute_keys(self) -> None:
-        """All SA_* constants must be SearchAttributeKey instances."""
-        for key in [SA_EPOCH_ID, SA_PHASE, SA_ROLE, SA_STATUS, SA_DOMAIN]:
-            assert isinstance(key, SearchAttributeKey)
+        All keys accept str values — verify value_set works with a
+        representative sample value for each attribute.
+        """
+        assert isinstance(key, SearchAttributeKey)
+        assert key.name == name
+        update = key.value_set(sample_value)
+        assert update is not None
 
 
 class TestSignalQueryTypes:
     """Signal/query type dataclasses are correctly structured."""
 
-    def test_epoch_input_is_frozen_dataclass(self) -> None:
-        """EpochInput must be a frozen dataclass with epoch_id and request_description."""
-        inp = EpochInput(epoch_id="ep-1", request_description="test request")
-        assert inp.epoch_id == "ep-1"
-        assert inp.request_description == "test request"
-        # Frozen: must raise on attribute set
-        with pytest.raises((AttributeError, TypeError)):
-            inp.epoch_id = "changed"  # type: ignore[misc]
-
-    def test_epoch_result_is_frozen_dataclass(self) -> None:
-        """EpochResult must be a frozen dataclass with the correct fields."""
-        result = EpochResult(
-            epoch_id="ep-1",
-            final_phase=PhaseId.Complete,
-            transition_count=12,
-            successful_transition_count=12,
-            constraint_violations_total=0,
-        )
-        assert result.epoch_id == "ep-1"
-        assert result.final_phase == PhaseId.Complete
-        assert result.transition_count == 12
-        assert result.successful_transition_count == 12
-        assert result.constraint_violations_total == 0
-        with pytest.raises((AttributeError, TypeError)):
-            result.transition_count = 0  # type: ignore[misc]
+    @pytest.mark.parametrize(
+        "cls,kwargs,mutate_field,mutate_value",
+        [
+            pytest.param(
+                EpochInput,
+                {"epoch_id": "ep-1", "request_description": "test request"},
+                "epoch_id",
+                "changed",
+                id="EpochInput",
+            ),
+            pytest.param(
+                EpochResult,
+                {
+                    "epoch_id": "ep-1",
+                    "final_phase": PhaseId.Complete,
+                    "transition_count": 12,
+                    "successful_transition_count": 12,
+                    "constraint_violations_total": 0,
+                },
+                "transition_count",
+                0,
+                id="EpochResult",
+            ),
+            pytest.param(
+                PhaseAdvanceSignal,
+                {
+                    "to_phase": PhaseId.P2_Elicit,
+                    "triggered_by": "architect",
+                    "condition_met": "classification confirmed",
+                },
+                "to_phase",
+                PhaseId.P3_Propose,
+                id="PhaseAdvanceSignal",
+            ),
+            pytest.param(
+                ReviewVoteSignal,
+                {
+                    "axis": ReviewAxis.Correctness,
+                    "vote": VoteType.Accept,
+                    "reviewer_id": "reviewer-1",
+                },
+                "axis",
+                ReviewAxis.TestQuality,
+                id="ReviewVoteSignal",
+            ),
+        ],
+    )
+    def test_frozen_dataclass_fields(
+        self, cls: type, kwargs: dict, mutate_field: str, mutate_value: object
+    ) -> None:
+        """Each signal/query dataclass stores its fields and rejects mutation.
 
-    def test_phase_advance_signal_is_frozen_dataclass(self) -> None:
-        """PhaseAdvanceSignal must be a frozen dataclass with to_phase, triggered_by, condition_met."""
-        sig = PhaseAdvanceSignal(
-            to_phase=PhaseId.P2_Elicit,
-            triggered_by="architect",
-            condition_met="classification confirmed",
-        )
-        assert sig.to_phase == PhaseId.P2_Elicit
-        assert sig.triggered_by == "architect"
-        assert sig.condition_met == "classification confirmed"
-        with pytest.raises((AttributeError, TypeError)):
-            sig.to_phase = PhaseId.P3_Propose  # type: ignore[misc]
-
-    def test_review_vote_signal_is_frozen_dataclass(self) -> None:
-        """ReviewVoteSignal must be a frozen dataclass with axis, vote, reviewer_id."""
-        sig = ReviewVoteSignal(axis=ReviewAxis.Correctness, vote=VoteType.Accept, reviewer_id="reviewer-1")
-        assert sig.axis == ReviewAxis.Correctness
-        assert sig.vote == VoteType.Accept
-        assert sig.reviewer_id == "reviewer-1"
+        Constructs the dataclass from kwargs, asserts every field round-trips,
+        then verifies the frozen contract by attempting to overwrite one field.
+        """
+        obj = cls(**kwargs)
+        for field_name, expected in kwargs.items():
+            assert getattr(obj, field_name) == expected
+        # Frozen: must raise on attribute set
         with pytest.raises((AttributeError, TypeError)):
-            sig.axis = ReviewAxis.TestQuality  # type: ignore[misc]
-
-    def test_phase_advance_signal_uses_phase_id_enum(self) -> None:
-        """PhaseAdvanceSignal.to_phase must be a PhaseId enum."""
-        sig = PhaseAdvanceSignal(
-            to_phase=PhaseId.P9_Slice,
-            triggered_by="supervisor",
-            condition_met="slices created",
-        )
-        assert sig.to_phase is PhaseId.P9_Slice
-        assert isinstance(sig.to_phase, PhaseId)
-
-    def test_review_vote_signal_uses_vote_type_enum(self) -> None:
-        """ReviewVoteSignal.vote must be a VoteType enum."""
-        sig = ReviewVoteSignal(axis=ReviewAxis.TestQuality, vote=VoteType.Revise, reviewer_id="reviewer-2")
-        assert sig.vote is VoteType.Revise
-        assert isinstance(sig.vote, VoteType)
+            setattr(obj, mutate_field, mutate_value)
+
+    @pytest.mark.parametrize(
+        "obj,attr,enum_cls,expected_member",
+        [
+            pytest.param(
+                PhaseAdvanceSignal(
+                    to_phase=PhaseId.P9_Slice,
+                    triggered_by="supervisor",
+                    condition_met="slices created",
+                ),
+                "to_phase",
+                PhaseId,
+                PhaseId.P9_Slice,
+                id="PhaseAdvanceSignal-to_phase",
+            ),
+            pytest.param(
+                ReviewVoteSignal(
+                    axis=ReviewAxis.TestQuality,
+                    vote=VoteType.Revise,
+                    reviewer_id="reviewer-2",
+                ),
+                "vote",
+                VoteType,
+                VoteType.Revise,
+                id="ReviewVoteSignal-vote",
+            ),
+        ],
+    )
+    def test_signal_fields_are_enums(
+        self, obj: object, attr: str, enum_cls: type, expected_member: object
+    ) -> None:
+        """Enum-typed signal fields hold the enum member itself, not a plain string."""
+        value = getattr(obj, attr)
+        assert value is expected_member
+        assert isinstance(value, enum_cls)
 
 
 class TestWorkflowStructure:
@@ -231,35 +278,32 @@ class TestWorkflowStructure:
     correctly without running the full Temporal test server.
     """
 
-    def test_workflow_defn_applied(self) -> None:
-        """EpochWorkflow must have @workflow.defn applied (has __temporal_workflow_definition)."""
-        # @workflow.defn attaches __temporal_workflow_definition to the class
-        assert hasattr(EpochWorkflow, "__temporal_workflow_definition")
-
-    def test_advance_phase_is_signal(self) -> None:
-        """advance_phase must be a @workflow.signal handler."""
-        method = EpochWorkflow.advance_phase
-        assert hasattr(method, "__temporal_signal_definition")
-
-    def test_submit_vote_is_signal(self) -> None:
-        """submit_vote must be a @workflow.signal handler."""
-        method = EpochWorkflow.submit_vote
-        assert hasattr(method, "__temporal_signal_definition")
-
-    def test_current_state_is_query(self) -> None:
-        """current_state must be a @workflow.query handler."""
-        method = EpochWorkflow.current_state
-        assert hasattr(method, "__temporal_query_definition")
-
-    def test_available_transitions_is_query(self) -> None:
-        """available_transitions must be a @workflow.query handler."""
-        method = EpochWorkflow.available_transitions
-        assert hasattr(method, "__temporal_query_definition")
-
-    def test_run_is_workflow_run(self) -> None:
-        """run must be the @workflow.run entry point."""
-        method = EpochWorkflow.run
-        assert hasattr(method, "__temporal_workflow_run")
+    @pytest.mark.parametrize(
+        "attr_owner,dunder",
+        [
+            pytest.param(
+                EpochWorkflow, "__temporal_workflow_definition", id="class-workflow-defn"
+            ),
+            pytest.param(
+                EpochWorkflow.advance_phase, "__temporal_signal_definition", id="advance_phase-signal"
+            ),
+            pytest.param(
+                EpochWorkflow.submit_vote, "__temporal_signal_definition", id="submit_vote-signal"
+            ),
+            pytest.param(
+                EpochWorkflow.current_state, "__temporal_query_definition", id="current_state-query"
+            ),
+            pytest.param(
+                EpochWorkflow.available_transitions,
+                "__temporal_query_definition",
+                id="available_transitions-query",
+            ),
+            pytest.param(EpochWorkflow.run, "__temporal_workflow_run", id="run-workflow-run"),
+        ],
+    )
+    def test_has_temporal_marker(self, attr_owner: object, dunder: str) -> None:
+        """Each workflow class/method carries the expected @workflow.* marker attribute."""
+        assert hasattr(attr_owner, dunder)
 
 
 # ─── L2: Activity Tests ────────────────────────────────────────────────────────
@@ -269,55 +313,50 @@ class TestWorkflowStructure:
 class TestCheckConstraintsActivity:
     """AC6: check_constraints activity validates protocol constraints."""
 
-    @pytest.mark.asyncio
-    async def test_valid_p1_to_p2_advance_has_no_violations(self) -> None:
+    async def test_valid_p1_to_p2_advance_has_no_violations(self, activity_env: ActivityEnvironment) -> None:
         """check_constraints at P1 proposing P2 returns no violations.
 
         This is the simplest forward transition with no gate conditions.
         """
         sm = _make_sm("epoch-test-1")
-        env = ActivityEnvironment()
-        violations = await env.run(check_constraints, sm.state, PhaseId.P2_Elicit)
+        violations = await activity_env.run(check_constraints, sm.state, PhaseId.P2_Elicit)
         assert isinstance(violations, list)
         assert violations == []
 
-    @pytest.mark.asyncio
-    async def test_p4_to_p5_without_consensus_has_violations(self) -> None:
+    async def test_p4_to_p5_without_consensus_has_violations(
+        self, activity_env: ActivityEnvironment, sm_at_p4: EpochStateMachine
+    ) -> None:
         """check_constraints at P4 proposing P5 without consensus returns violations.
 
         C-review-consensus: all 3 axes (A, B, C) must ACCEPT before advancing.
         """
-        sm = _make_sm("epoch-test-2")
-        _advance_to(sm, PhaseId.P4_Review)
+        sm = sm_at_p4
         # No votes recorded — consensus not reached.
-        env = ActivityEnvironment()
-        violations = await env.run(check_constraints, sm.state, PhaseId.P5_Uat)
+        violations = await activity_env.run(check_constraints, sm.state, PhaseId.P5_Uat)
         assert len(violations) > 0
         constraint_ids = [v.constraint_id for v in violations]
         assert "C-review-consensus" in constraint_ids
 
-    @pytest.mark.asyncio
-    async def test_p4_to_p5_with_consensus_has_no_violations(self) -> None:
+    async def test_p4_to_p5_with_consensus_has_no_violations(
+        self, activity_env: ActivityEnvironment, sm_at_p4_with_consensus: EpochStateMachine
+    ) -> None:
         """check_constraints at P4 with all 3 ACCEPT returns no violations."""
-        sm = _make_sm("epoch-test-3")
-        _advance_to(sm, PhaseId.P4_Review)
-        # Record all 3 ACCEPT votes (satisfied in _advance_to already, but let's be explicit).
-        # _advance_to stops before advancing through the gate; re-record.
-        sm.record_vote(ReviewAxis.Correctness, VoteType.Accept)
-        sm.record_vote(ReviewAxis.TestQuality, VoteType.Accept)
-        sm.record_vote(ReviewAxis.Elegance, VoteType.Accept)
-        env = ActivityEnvironment()
-        violations = await env.run(check_constraints, sm.state, PhaseId.P5_Uat)
+        sm = sm_at_p4_with_consensus
+        violations = await activity_env.run(check_constraints, sm.state, PhaseId.P5_Uat)
         # No consensus violations (only handoff-required violations for actor-change transitions).
         consensus_violations = [v for v in violations if v.constraint_id == "C-review-consensus"]
         assert consensus_violations == []
 
-    @pytest.mark.asyncio
     async def test_check_constraints_returns_list_of_constraint_violations(self) -> None:
-        """check_constraints always returns list[ConstraintViolation]."""
+        """check_constraints always returns list[ConstraintViolation].
+
+        Awaits the activity coroutine directly — this test only asserts the
+        return type, and check_constraints never touches the activity context,
+        so the ActivityEnvironment dispatch (covered by the other tests in
+        this class) adds nothing here.
+        """
         sm = _make_sm("epoch-test-4")
-        env = ActivityEnvironment()
-        result = await env.run(check_constraints, sm.state, PhaseId.P2_Elicit)
+        result = await check_constraints(sm.state, PhaseId.P2_Elicit)
         assert isinstance(result, list)
         for item in result:
             assert isinstance(item, ConstraintViolation)
@@ -326,43 +365,67 @@ class TestCheckConstraintsActivity:
 class TestRecordTransitionActivity:
     """record_transition activity is a no-op stub that does not raise."""
 
-    @pytest.mark.asyncio
-    async def test_record_transition_succeeds_without_side_effects(self) -> None:
+    async def test_record_transition_succeeds_without_side_effects(self, activity_env: ActivityEnvironment) -> None:
         """record_transition completes without raising for a valid TransitionRecord."""
-        from datetime import datetime, timezone
-
         record = TransitionRecord(
             from_phase=PhaseId.P1_Request,
             to_phase=PhaseId.P2_Elicit,
-            timestamp=datetime.now(tz=timezone.utc),
+            timestamp=_FIXED_TS,
             triggered_by="architect",
             condition_met="classification confirmed",
         )
-        env = ActivityEnvironment()
         # Should not raise.
-        result = await env.run(record_transition, record)
+        result = await activity_env.run(record_transition, record)
         assert result is None
 
-    @pytest.mark.asyncio
-    async def test_record_transition_accepts_any_phase_pair(self) -> None:
+    @pytest.mark.parametrize(
+        "from_p,to_p",
+        [
+            pytest.param(PhaseId.P8_ImplPlan, PhaseId.P9_Slice, id="p8-to-p9"),
+            pytest.param(PhaseId.P9_Slice, PhaseId.P10_CodeReview, id="p9-to-p10"),
+            pytest.param(PhaseId.P12_Landing, PhaseId.Complete, id="p12-to-complete"),
+        ],
+    )
+    async def test_record_transition_accepts_any_phase_pair(
+        self, activity_env: ActivityEnvironment, from_p: PhaseId, to_p: PhaseId
+    ) -> None:
         """record_transition works for all valid phase pairs."""
-        from datetime import datetime, timezone
-
-        for from_p, to_p in [
-            (PhaseId.P8_ImplPlan, PhaseId.P9_Slice),
-            (PhaseId.P9_Slice, PhaseId.P10_CodeReview),
-            (PhaseId.P12_Landing, PhaseId.Complete),
-        ]:
-            record = TransitionRecord(
+        record = TransitionRecord(
+            from_phase=from_p,
+            to_phase=to_p,
+            timestamp=_FIXED_TS,
+            triggered_by="supervisor",
+            condition_met="all conditions met",
+        )
+        result = await activity_env.run(record_transition, record)
+        assert result is None
+
+
+class TestRecordTransitionsActivity:
+    """record_transitions activity (batched) is a no-op stub that does not raise."""
+
+    async def test_record_transitions_accepts_batch(self, activity_env: ActivityEnvironment) -> None:
+        """record_transitions completes without raising for a batch of records."""
+        records = [
+            TransitionRecord(
                 from_phase=from_p,
                 to_phase=to_p,
-                timestamp=datetime.now(tz=timezone.utc),
+                timestamp=_FIXED_TS,
                 triggered_by="supervisor",
                 condition_met="all conditions met",
             )
-            env = ActivityEnvironment()
-            result = await env.run(record_transition, record)
-            assert result is None
+            for from_p, to_p in [
+                (PhaseId.P1_Request, PhaseId.P2_Elicit),
+                (PhaseId.P2_Elicit, PhaseId.P3_Propose),
+            ]
+        ]
+        result = await activity_env.run(record_transitions, records)
+        assert result is None
+
+    async def test_record_transitions_accepts_empty_batch(self, activity_env: ActivityEnvironment) -> None:
+        """record_transitions tolerates an empty batch (defensive no-op)."""
+        result = await activity_env.run(record_transitions, [])
+        assert result is None
 
 
 # ─── L3: AC6 / AC7 — State Machine Integration ───────────────────────────────
@@ -461,39 +524,39 @@ class TestAC6AdvancePhaseSignalLogic:
         expected_completed = {PhaseId.P1_Request, PhaseId.P2_Elicit, PhaseId.P3_Propose}
         assert expected_completed.issubset(sm.state.completed_phases)
 
-    def test_search_attributes_values_are_correct_after_advance(self) -> None:
+    @pytest.mark.parametrize(
+        "target_phase,expected_value",
+        [
+            pytest.param(PhaseId.P2_Elicit, "p2", id="p2"),
+            pytest.param(PhaseId.P9_Slice, "p9", id="p9"),
+            pytest.param(PhaseId.P12_Landing, "p12", id="p12"),
+        ],
+    )
+    def test_search_attributes_values_are_correct_after_advance(
+        self, target_phase: PhaseId, expected_value: str
+    ) -> None:
         """After advance, the values used for search attribute upsert are correct.
 
         AC6: search attrs must be updated atomically with the state transition.
-        We verify the source values (current phase, role) that the workflow
-        would use in upsert_search_attributes().
+        We verify the source values (current phase, role, domain) that the
+        workflow would use in upsert_search_attributes(), at several points
+        along the forward path.
         """
-        from aura_protocol.types import PHASE_DOMAIN
-
         sm = _make_sm("ac6-epoch-5")
-        sm.advance(
-            PhaseId.P2_Elicit,
-            triggered_by="architect",
-            condition_met="confirmed",
-        )
+        _advance_to(sm, target_phase)
 
         # Values that the workflow.upsert_search_attributes() call would use.
-        expected_phase = sm.state.current_phase.value
-        expected_role = sm.state.current_role
-        expected_domain = PHASE_DOMAIN.get(sm.state.current_phase)
-
-        assert expected_phase == "p2"
-        assert expected_role is not None
-        assert expected_domain is not None  # P2 is in USER domain
+        assert sm.state.current_phase.value == expected_value
+        assert sm.state.current_role is not None
+        assert PHASE_DOMAIN.get(sm.state.current_phase) is not None
 
-    def test_review_vote_signal_recorded_before_advance(self) -> None:
+    def test_review_vote_signal_recorded_before_advance(self, sm_at_p4: EpochStateMachine) -> None:
         """ReviewVoteSignal: submit_vote queues votes, applied before next advance.
 
         Simulates the workflow's vote-draining logic: votes are applied
         before processing the advance signal.
         """
-        sm = _make_sm("ac6-epoch-6")
-        _advance_to(sm, PhaseId.P4_Review)
+        sm = sm_at_p4
 
         # Simulate 3 ReviewVoteSignals being received.
         vote_signals = [
@@ -516,13 +579,12 @@ class TestAC6AdvancePhaseSignalLogic:
         assert record.to_phase == PhaseId.P5_Uat
         assert sm.state.current_phase == PhaseId.P5_Uat
 
-    def test_revise_vote_blocks_forward_advance(self) -> None:
+    def test_revise_vote_blocks_forward_advance(self, sm_at_p4: EpochStateMachine) -> None:
         """A single REVISE vote makes only the backward transition available.
 
         AC6: vote signals must affect available_transitions atomically.
         """
-        sm = _make_sm("ac6-epoch-7")
-        _advance_to(sm, PhaseId.P4_Review)
+        sm = sm_at_p4
 
         # One REVISE vote — consensus blocked.
         sm.record_vote(ReviewAxis.Correctness, VoteType.Revise)
@@ -548,13 +610,12 @@ class TestAC7QueryCurrentState:
         state = sm.state
         assert state.current_phase == PhaseId.P1_Request
 
-    def test_state_after_p9_advance_reflects_p9(self) -> None:
+    def test_state_after_p9_advance_reflects_p9(self, sm_at_p9: EpochStateMachine) -> None:
         """AC7: After advancing to P9, current_state query returns P9 phase.
 
         This is the AC7 scenario: AuraPhase='p9' query should return the workflow.
         """
-        sm = _make_sm("ac7-epoch-2")
-        _advance_to(sm, PhaseId.P9_Slice)
+        sm = sm_at_p9
 
         # The workflow current_state() query returns sm.state.
         state = sm.state
@@ -571,28 +632,25 @@ class TestAC7QueryCurrentState:
         assert PhaseId.P2_Elicit in state.completed_phases
         assert PhaseId.P3_Propose not in state.completed_phases  # current, not completed
 
-    def test_available_transitions_query_correct_at_p9(self) -> None:
+    def test_available_transitions_query_correct_at_p9(self, sm_at_p9: EpochStateMachine) -> None:
         """AC7: available_transitions() at P9 returns P10 as the valid next step."""
-        sm = _make_sm("ac7-epoch-4")
-        _advance_to(sm, PhaseId.P9_Slice)
+        sm = sm_at_p9
 
         # available_transitions() is the same logic the workflow query exposes.
         transitions = sm.available_transitions
         assert len(transitions) == 1
         assert transitions[0].to_phase == PhaseId.P10_CodeReview
 
-    def test_available_transitions_empty_at_complete(self) -> None:
+    def test_available_transitions_empty_at_complete(self, sm_complete: EpochStateMachine) -> None:
         """AC7: available_transitions() at COMPLETE returns empty list."""
-        sm = _make_sm("ac7-epoch-5")
-        _advance_to(sm, PhaseId.Complete)
+        sm = sm_complete
 
         transitions = sm.available_transitions
         assert transitions == []
 
-    def test_vote_state_visible_in_current_state(self) -> None:
+    def test_vote_state_visible_in_current_state(self, sm_at_p4: EpochStateMachine) -> None:
         """AC7: review votes appear in current_state().review_votes (no stale state)."""
-        sm = _make_sm("ac7-epoch-6")
-        _advance_to(sm, PhaseId.P4_Review)
+        sm = sm_at_p4
         sm.record_vote(ReviewAxis.Correctness, VoteType.Accept)
         sm.record_vote(ReviewAxis.TestQuality, VoteType.Revise)
 
@@ -600,14 +658,13 @@ class TestAC7QueryCurrentState:
         assert state.review_votes.get(ReviewAxis.Correctness) == VoteType.Accept
         assert state.review_votes.get(ReviewAxis.TestQuality) == VoteType.Revise
 
-    def test_state_search_attr_values_match_current_phase(self) -> None:
+    def test_state_search_attr_values_match_current_phase(self, sm_at_p9: EpochStateMachine) -> None:
         """AC7: The phase value used for SA_PHASE upsert matches current state.
 
         Verifies no stale search attributes — the values come directly from
         sm.state.current_phase.value after each transition.
         """
-        sm = _make_sm("ac7-epoch-7")
-        _advance_to(sm, PhaseId.P9_Slice)
+        sm = sm_at_p9
 
         # This is what the workflow would set for AuraPhase after reaching P9.
         phase_sa_value = sm.state.current_phase.value
@@ -698,8 +755,6 @@ class TestFailedTransitionAuditTrailUnit:
                 failed_record = TransitionRecord(...)
                 self._sm.state.transition_history.append(failed_record)
         """
-        from datetime import datetime, timezone
-
         sm = _make_sm("audit-trail-epoch-1")
         assert sm.state.current_phase == PhaseId.P1_Request
 
@@ -711,7 +766,7 @@ class TestFailedTransitionAuditTrailUnit:
             failed_record = TransitionRecord(
                 from_phase=sm.state.current_phase,
                 to_phase=PhaseId.P9_Slice,
-                timestamp=datetime.now(tz=timezone.utc),
+                timestamp=_FIXED_TS,
                 triggered_by="architect",
                 condition_met=f"FAILED: {e}",
                 success=False,
@@ -738,8 +793,6 @@ class TestFailedTransitionAuditTrailUnit:
         Verifies the semantics of transition_count vs successful_transition_count:
         a FAILED record increments transition_count but not successful_transition_count.
         """
-        from datetime import datetime, timezone
-
         sm = _make_sm("audit-trail-epoch-2")
 
         # Attempt an invalid transition.
@@ -749,7 +802,7 @@ class TestFailedTransitionAuditTrailUnit:
             failed_record = TransitionRecord(
                 from_phase=sm.state.current_phase,
                 to_phase=PhaseId.P9_Slice,
-                timestamp=datetime.now(tz=timezone.utc),
+                timestamp=_FIXED_TS,
                 triggered_by="architect",
                 condition_met=f"FAILED: {e}",
                 success=False,
@@ -776,8 +829,6 @@ class TestFailedTransitionAuditTrailUnit:
 
         Verifies the audit trail captures every failed attempt, not just the first.
         """
-        from datetime import datetime, timezone
-
         sm = _make_sm("audit-trail-epoch-3")
         invalid_targets = [PhaseId.P9_Slice, PhaseId.P12_Landing, PhaseId.Complete]
 
@@ -788,7 +839,7 @@ class TestFailedTransitionAuditTrailUnit:
                 failed_record = TransitionRecord(
                     from_phase=sm.state.current_phase,
                     to_phase=target,
-                    timestamp=datetime.now(tz=timezone.utc),
+                    timestamp=_FIXED_TS,
                     triggered_by="architect",
                     condition_met=f"FAILED: {e}",
                     success=False,
@@ -811,12 +862,15 @@ class TestFailedTransitionAuditTrailUnit:
 class TestFullLifecycleIntegration:
     """Full lifecycle test: P1 → COMPLETE via forward path."""
 
-    def test_full_forward_path_completes(self) -> None:
-        """The state machine can complete the full 12-phase lifecycle."""
-        sm = _make_sm("full-lifecycle-epoch")
-        _advance_to(sm, PhaseId.Complete)
-        assert sm.state.current_phase == PhaseId.Complete
-        assert len(sm.state.transition_history) == 12
+    def test_full_forward_path_completes(self, sm_complete: EpochStateMachine) -> None:
+        """The state machine can complete the full 12-phase lifecycle.
+
+        Uses the session-scoped COMPLETE template from conftest — the real
+        end-to-end walk is exercised (and kept deliberately un-cached) in
+        test_state_machine.py; here we only assert the terminal shape.
+        """
+        assert sm_complete.state.current_phase == PhaseId.Complete
+        assert len(sm_complete.state.transition_history) == 12
 
     def test_transition_count_matches_history_length(self) -> None:
         """EpochResult.transition_count matches the actual transition_history length.